@@ -0,0 +1,57 @@
+"""
+Ленивые вкладки ttk.Notebook.
+
+Ключевые особенности:
+- При запуске в Notebook добавляются только пустые рамки-заглушки
+- Вкладка строится фабрикой при первом выборе или при первом
+  обращении к ней через get() (например, из уведомления таймера)
+- Построенная вкладка кэшируется и больше не пересоздаётся
+- Время построения попадает в профиль старта (--profile-startup)
+Связи: MainWindow (все вкладки, кроме таймеров)
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Dict, Tuple
+
+from utils.startup_profiler import profiler
+
+Factory = Callable[[ttk.Frame], tk.Widget]
+
+
+class LazyNotebook:
+    def __init__(self, notebook: ttk.Notebook):
+        self.notebook = notebook
+        self._factories: Dict[str, Tuple[ttk.Frame, Factory]] = {}
+        self._names: Dict[str, str] = {}
+        self._tabs: Dict[str, tk.Widget] = {}
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed, add="+")
+
+    def add(self, name: str, text: str, factory: Factory) -> ttk.Frame:
+        """Добавляет заглушку; factory(frame) создаст содержимое вкладки"""
+        frame = ttk.Frame(self.notebook)
+        self.notebook.add(frame, text=text)
+        self._factories[name] = (frame, factory)
+        self._names[str(frame)] = name
+        return frame
+
+    def get(self, name: str) -> tk.Widget:
+        """Возвращает вкладку, при необходимости строя её"""
+        tab = self._tabs.get(name)
+        if tab is not None:
+            return tab
+
+        frame, factory = self._factories[name]
+        with profiler.phase(f"вкладка {name}"):
+            tab = factory(frame)
+        tab.pack(expand=True, fill=tk.BOTH)
+        self._tabs[name] = tab
+        return tab
+
+    def is_built(self, name: str) -> bool:
+        return name in self._tabs
+
+    def _on_tab_changed(self, event=None) -> None:
+        name = self._names.get(self.notebook.select())
+        if name is not None:
+            self.get(name)
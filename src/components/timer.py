@@ -1,85 +1,115 @@
-import platform
-import threading
-import time
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
-from pygame import mixer
+from components.timer_engine import IDLE, PHASE, RINGING, RUNNING, STATE, TICK
+from components.timer_model import (
+    CHANGED,
+    TimerModel,
+    format_duration,
+    parse_field,
+    split_duration,
+)
+from utils.tick_scheduler import TickScheduler
 
-from utils.sound_utils import SoundPlayer
-from utils.timer_notification import TimerNotification
-from windows.main_timer_window import MainTimerWindow
 
-if platform.system() == "Windows":
-    import winsound
+def _model_attribute(name):
+    """Свойство строки, читающее и пишущее одноимённый атрибут модели"""
+    return property(
+        lambda self: getattr(self.model, name),
+        lambda self, value: setattr(self.model, name, value),
+    )
 
 
 class Timer(ttk.Frame):
-    def __init__(self, parent, on_delete=None):
+    """
+    Строка списка таймеров. Состояние хранит TimerModel; VirtualTimerList
+    переиспользует строку для другого таймера через bind_model().
+    """
+
+    def __init__(self, parent, on_delete=None, scheduler=None, model=None):
         super().__init__(parent)
         self.parent = parent
-        self.on_delete = on_delete
-        self.remaining_time = 0
-        self.is_running = False
-        self.custom_sound = None
-        self.paused_time = 0
-        self.initial_time = None
-        self.main_window = None
-        self.sound_player = SoundPlayer()
+        self.model = None
         self.emoji_window = None
         self.time_inputs_focused = False
+        self.preset_columns = None
+        self.description_var = tk.StringVar()
+        self.description_var.trace_add("write", self.on_description_changed)
         self.setup_ui()
 
-    def safe_update_main_window(self):
-        try:
-            if self.main_window and self.main_window.winfo_exists():
-                if hasattr(self.main_window, "time_label"):
-                    self.main_window.time_label.configure(
-                        text=self.time_label.cget("text")
-                    )
-                if hasattr(self.main_window, "description_label"):
-                    self.main_window.description_label.configure(
-                        text=self.description.get()
-                    )
-                if self.initial_time:
-                    self.main_window.draw_progress()
-        except (tk.TclError, AttributeError):
-            pass
+        if model is None:
+            model = TimerModel(
+                parent, scheduler or TickScheduler(self), on_delete=on_delete
+            )
+        self.bind_model(model)
+
+    engine = _model_attribute("engine")
+    custom_sound = _model_attribute("custom_sound")
+    alarm_active = _model_attribute("alarm_active")
+    main_window = _model_attribute("main_window")
+    sound_player = _model_attribute("sound_player")
+    is_running = _model_attribute("is_running")
+    remaining_time = _model_attribute("remaining_time")
+    paused_time = _model_attribute("paused_time")
+    initial_time = _model_attribute("initial_time")
+
+    def bind_model(self, model):
+        """Показывает в строке другой таймер"""
+        if model is self.model:
+            return
+        self.unbind_model()
+        self.model = model
+        model.add_listener(self.on_model_event)
+        self.render_model()
+
+    def unbind_model(self):
+        if self.model is not None:
+            self.model.remove_listener(self.on_model_event)
+            self.model = None
+
+    def render_model(self):
+        """Полностью перерисовывает строку по модели"""
+        model = self.model
+        if self.description_var.get() != model.description:
+            self.description_var.set(model.description)
+        hours, minutes, seconds = split_duration(model.engine.duration)
+        for spinbox, value in (
+            (self.hours, hours),
+            (self.minutes, minutes),
+            (self.seconds, seconds),
+        ):
+            spinbox.state(["!disabled"])
+            spinbox.set(str(value))
+        self.sound_button.config(text="🔊 ✓" if model.custom_sound else "🔊")
+
+        if model.engine.sequence is not None:
+            self.phase_label.pack(anchor="w", pady=(4, 0))
+        else:
+            self.phase_label.pack_forget()
 
-    def update_display(self):
-        hours = self.remaining_time // 3600
-        minutes = (self.remaining_time % 3600) // 60
-        seconds = self.remaining_time % 60
-        display_text = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        self.update_state()
+        self.update_phase_label()
+        self.update_display()
+        self.update_presets_visibility()
 
+    def update_display(self):
         try:
-            self.time_label.configure(text=display_text)
-            self.safe_update_main_window()
+            self.time_label.configure(text=format_duration(self.remaining_time))
         except tk.TclError:
             pass
 
-    def show_main_screen(self):
-        if not self.main_window or not self.main_window.winfo_exists():
-            if not self.initial_time:
-                self.initial_time = (
-                    int(self.hours.get() or 0) * 3600
-                    + int(self.minutes.get() or 0) * 60
-                    + int(self.seconds.get() or 0)
-                )
-
-            self.main_window = MainTimerWindow(self.parent, self)
-            self.main_window.attributes("-alpha", 0.0)
-
-            def fade_in():
-                try:
-                    alpha = self.main_window.attributes("-alpha")
-                    if alpha < 1.0:
-                        self.main_window.attributes("-alpha", alpha + 0.1)
-                        self.main_window.after(20, fade_in)
-                except tk.TclError:
-                    pass
+    def update_state(self):
+        state = self.engine.state
+        locked = state != IDLE or self.engine.sequence is not None
+        for spinbox in (self.hours, self.minutes, self.seconds):
+            spinbox.state(["disabled" if locked else "!disabled"])
+        self.start_button.config(text="▶")
+        self.start_button.state(
+            ["disabled" if state in (RUNNING, RINGING) else "!disabled"]
+        )
 
-            fade_in()
+    def show_main_screen(self):
+        self.model.show_main_screen()
 
     def setup_ui(self):
         main_container = ttk.Frame(self)
@@ -95,8 +125,9 @@ class Timer(ttk.Frame):
         description_frame = ttk.Frame(left_frame)
         description_frame.pack(fill=tk.X, expand=True)
 
-        self.description = ttk.Entry(description_frame, font=("Arial", 12))
-        self.description.insert(0, "Описание таймера")
+        self.description = ttk.Entry(
+            description_frame, font=("Arial", 12), textvariable=self.description_var
+        )
         self.description.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
         self.context_menu = tk.Menu(self.description, tearoff=0)
@@ -121,6 +152,8 @@ class Timer(ttk.Frame):
         )
         self.emoji_button.pack(side=tk.RIGHT, padx=(5, 0))
 
+        self.phase_label = ttk.Label(left_frame, font=("Arial", 10))
+
         time_frame = ttk.Frame(content_frame)
         time_frame.pack(side=tk.LEFT, padx=15)
 
@@ -149,44 +182,11 @@ class Timer(ttk.Frame):
         self.seconds = ttk.Spinbox(spinbox_container, from_=0, to=59, **spinbox_style)
         self.seconds.pack(side=tk.LEFT)
 
-        self.hours.bind(
-            "<<Increment>>",
-            lambda e: (self.update_time_display(), self.update_presets_visibility()),
-        )
-        self.hours.bind(
-            "<<Decrement>>",
-            lambda e: (self.update_time_display(), self.update_presets_visibility()),
-        )
-        self.hours.bind(
-            "<KeyRelease>",
-            lambda e: (self.update_time_display(), self.update_presets_visibility()),
-        )
-
-        self.minutes.bind(
-            "<<Increment>>",
-            lambda e: (self.update_time_display(), self.update_presets_visibility()),
-        )
-        self.minutes.bind(
-            "<<Decrement>>",
-            lambda e: (self.update_time_display(), self.update_presets_visibility()),
-        )
-        self.minutes.bind(
-            "<KeyRelease>",
-            lambda e: (self.update_time_display(), self.update_presets_visibility()),
-        )
-
-        self.seconds.bind(
-            "<<Increment>>",
-            lambda e: (self.update_time_display(), self.update_presets_visibility()),
-        )
-        self.seconds.bind(
-            "<<Decrement>>",
-            lambda e: (self.update_time_display(), self.update_presets_visibility()),
-        )
-        self.seconds.bind(
-            "<KeyRelease>",
-            lambda e: (self.update_time_display(), self.update_presets_visibility()),
-        )
+        # Стрелки меняют значение в классовой привязке TSpinbox, уже после
+        # привязок виджета, поэтому длительность синхронизирует command=
+        for spinbox in (self.hours, self.minutes, self.seconds):
+            spinbox.configure(command=self.on_time_input_changed)
+            spinbox.bind("<KeyRelease>", self.on_time_input_changed)
 
         self.hours.bind("<FocusIn>", self.on_time_input_focus_in)
         self.hours.bind("<FocusOut>", self.on_time_input_focus_out)
@@ -306,117 +306,53 @@ class Timer(ttk.Frame):
         separator = ttk.Separator(self, orient="horizontal")
         separator.pack(fill=tk.X, pady=(10, 0))
 
-        self.update_time_display()
-        self.update_presets_visibility()
-
     def start_timer(self):
-        if not self.is_running:
-            if self.paused_time > 0:
-                self.remaining_time = self.paused_time
-                self.paused_time = 0
-            else:
-                total_seconds = (
-                    int(self.hours.get() or 0) * 3600
-                    + int(self.minutes.get() or 0) * 60
-                    + int(self.seconds.get() or 0)
-                )
-                self.remaining_time = total_seconds
-                self.initial_time = total_seconds
-
-            if self.remaining_time > 0:
-                self.is_running = True
-                self.start_button.state(["disabled"])
-                self.hours.state(["disabled"])
-                self.minutes.state(["disabled"])
-                self.seconds.state(["disabled"])
-
-                try:
-                    if (
-                        self.main_window
-                        and self.main_window.winfo_exists()
-                        and hasattr(self.main_window, "pause_btn")
-                    ):
-                        self.main_window.pause_btn.configure(text="⏸")
-                except tk.TclError:
-                    pass
-
-                self.update_thread = threading.Thread(target=self.update_timer)
-                self.update_thread.daemon = True
-                self.update_thread.start()
-
-    def update_timer(self):
-        while self.is_running and self.remaining_time > 0:
-            try:
-                self.update_display()
-                if hasattr(self, "main_window") and self.main_window:
-                    self.main_window.draw_progress()
-                time.sleep(1)
-                self.remaining_time -= 1
-            except tk.TclError:
-                break
-
-        if self.is_running:
-            self.is_running = False
-            self.play_alarm()
-            self.show_notification()
+        if self.engine.state == IDLE:
+            self.update_time_display()
+        self.model.start_timer()
 
     def pause_timer(self):
-        if self.is_running:
-            self.is_running = False
-            self.paused_time = self.remaining_time
-            self.start_button.config(text="▶")
-            self.start_button.state(["!disabled"])
-
-            try:
-                if (
-                    self.main_window
-                    and self.main_window.winfo_exists()
-                    and hasattr(self.main_window, "pause_btn")
-                ):
-                    self.main_window.pause_btn.configure(text="▶")
-            except tk.TclError:
-                pass
+        self.model.pause_timer()
 
     def stop_timer(self):
-        self.is_running = False
-        total_seconds = (
-            int(self.hours.get() or 0) * 3600
-            + int(self.minutes.get() or 0) * 60
-            + int(self.seconds.get() or 0)
-        )
-        self.remaining_time = total_seconds
-        self.paused_time = 0
-        self.initial_time = total_seconds
-
-        self.start_button.state(["!disabled"])
-        self.start_button.config(text="▶")
-        self.hours.state(["!disabled"])
-        self.minutes.state(["!disabled"])
-        self.seconds.state(["!disabled"])
-
-        try:
-            if (
-                self.main_window
-                and self.main_window.winfo_exists()
-                and not self.main_window.is_destroyed()
-            ):
-                if hasattr(self.main_window, "pause_btn"):
-                    try:
-                        self.main_window.pause_btn.configure(text="▶")
-                    except tk.TclError:
-                        pass
-
-                try:
-                    self.main_window.draw_progress()
-                except tk.TclError:
-                    pass
-        except (tk.TclError, AttributeError):
-            pass
+        self.model.stop_timer()
+
+    def set_sequence(self, sequence):
+        """Превращает таймер в цепочку фаз (Помодоро) с общим прогрессом"""
+        self.model.set_sequence(sequence)
+
+    def update_phase_label(self):
+        if self.engine.sequence is not None:
+            self.phase_label.configure(text=self.engine.sequence.describe())
+
+    def display_title(self):
+        return self.model.display_title()
+
+    def set_duration(self, seconds):
+        """Выставляет длительность модели; поля ввода обновятся по CHANGED"""
+        self.model.set_duration(seconds)
+
+    def on_model_event(self, event):
+        """Перерисовывает строку по событиям модели"""
+        if event == TICK:
+            self.update_display()
+        elif event == PHASE:
+            self.update_phase_label()
+        elif event == STATE:
+            self.update_state()
+            if self.engine.state == IDLE:
+                self.update_phase_label()
+                self.update_display()
+                self.update_presets_visibility()
+        elif event == CHANGED:
+            self.render_model()
 
-        self.update_display()
-        self.update_presets_visibility()
+    def on_description_changed(self, *args):
+        if self.model is not None:
+            self.model.description = self.description_var.get()
 
     def update_time_display(self):
+        """Разбирает поля ввода и передаёт длительность в TimerEngine"""
         try:
             hours = int(self.hours.get() or 0)
             minutes = int(self.minutes.get() or 0)
@@ -424,8 +360,11 @@ class Timer(ttk.Frame):
             display_text = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
             self.time_label.configure(text=display_text)
         except (ValueError, tk.TclError):
+            hours = minutes = seconds = 0
             self.time_label.configure(text="00:00:00")
 
+        self.engine.set_duration(hours * 3600 + minutes * 60 + seconds)
+
     def apply_preset(self, minutes):
         self.hours.set("0")
         self.minutes.set(str(minutes))
@@ -435,9 +374,9 @@ class Timer(ttk.Frame):
 
     def update_presets_visibility(self):
         total_seconds = (
-            int(self.hours.get() or 0) * 3600
-            + int(self.minutes.get() or 0) * 60
-            + int(self.seconds.get() or 0)
+            parse_field(self.hours.get()) * 3600
+            + parse_field(self.minutes.get()) * 60
+            + parse_field(self.seconds.get())
         )
 
         if total_seconds == 0 or self.time_inputs_focused:
@@ -445,6 +384,10 @@ class Timer(ttk.Frame):
         else:
             self.presets_frame.pack_forget()
 
+    def on_time_input_changed(self, event=None):
+        self.update_time_display()
+        self.update_presets_visibility()
+
     def on_time_input_focus_in(self, event):
         self.time_inputs_focused = True
         self.update_presets_visibility()
@@ -464,6 +407,11 @@ class Timer(ttk.Frame):
         button_width = 95
         buttons_per_row = max(1, available_width // button_width)
 
+        # <Configure> приходит и при смене высоты; раскладка та же - не трогаем
+        if buttons_per_row == self.preset_columns:
+            return
+        self.preset_columns = buttons_per_row
+
         row, col = 0, 0
         for btn in self.preset_buttons:
             btn.grid(row=row, column=col, padx=2, pady=2)
@@ -477,101 +425,23 @@ class Timer(ttk.Frame):
             filetypes=[("MP3 files", "*.mp3"), ("WAV files", "*.wav")]
         )
         if file_path:
-            self.custom_sound = file_path
-            self.sound_button.config(text="🔊 ✓")
+            self.model.set_custom_sound(file_path)
 
     def play_alarm(self):
-        def sound_thread():
-            if not hasattr(self, "alarm_active"):
-                self.alarm_active = True
-
-            if (
-                hasattr(self, "custom_sound")
-                and self.custom_sound
-                and self.alarm_active
-            ):
-                try:
-                    mixer.init()
-                    mixer.music.load(self.custom_sound)
-                    mixer.music.play(-1)
-                except Exception as e:
-                    print(f"Ошибка воспроизведения custom sound: {e}")
-                    if self.alarm_active:
-                        self.beep_alarm()
-            else:
-                if self.alarm_active:
-                    self.beep_alarm()
-
-        self.alarm_active = True
-        self.sound_thread = threading.Thread(target=sound_thread, daemon=True)
-        self.sound_thread.start()
-
-    def beep_alarm(self):
-        def beep_thread():
-            while self.is_running and getattr(self, "alarm_active", True):
-                try:
-                    self.sound_player.play_beep()
-                    time.sleep(0.5)
-                except:
-                    break
-
-        self.is_running = True
-        self.alarm_active = True
-        self.beep_thread = threading.Thread(target=beep_thread, daemon=True)
-        self.beep_thread.start()
+        self.model.play_alarm()
 
     def stop_alarm(self):
-        self.alarm_active = False
-        self.is_running = False
-
-        try:
-            if mixer.get_init():
-                mixer.music.stop()
-                mixer.stop()
-                mixer.quit()
-        except:
-            pass
-
-        if hasattr(self, "sound_player"):
-            self.sound_player.stop()
-
-    def show_notification(self):
-        try:
-            next_timers = []
-            if hasattr(self.parent, "timers"):
-                next_timers = [t for t in self.parent.timers if t != self]
-
-            notification = TimerNotification(
-                self.parent, self.description.get(), next_timers, current_timer=self
-            )
-
-            self.wait_window(notification)
-
-            if hasattr(notification, "result") and notification.result == "snooze":
-                return
-
-            self.stop_alarm()
-            self.is_running = False
-            self.stop_timer()
-
-        except tk.TclError:
-            pass
+        self.model.stop_alarm()
 
     def delete_timer(self):
         if messagebox.askyesno("Подтверждение", "Действительно удалить таймер?"):
-            if self.on_delete:
-                self.on_delete(self)
+            if self.model.on_delete:
+                self.model.on_delete(self.model)
 
     def to_dict(self):
-        return {
-            "description": self.description.get(),
-            "hours": self.hours.get(),
-            "minutes": self.minutes.get(),
-            "seconds": self.seconds.get(),
-            "custom_sound": (
-                self.custom_sound if hasattr(self, "custom_sound") else None
-            ),
-        }
+        if self.engine.state == IDLE:
+            self.update_time_display()
+        return self.model.to_dict()
 
     def copy_text(self):
         try:
@@ -0,0 +1,251 @@
+"""
+Состояние таймера без Tk.
+
+Ключевые особенности:
+- Конечный автомат: idle -> running <-> paused -> ringing -> idle
+- Остаток пересчитывается от монотонного дедлайна планировщика, а не
+  накапливается по тикам
+- Следующий тик планируется на момент смены отображаемой секунды
+- Подписчики получают событие TICK (изменился остаток) или STATE
+  (сменилось состояние) и сами решают, что перерисовать
+- Нужен только планировщик с now()/call_at()/cancel(): тысячи таймеров
+  можно гонять и измерять без дисплея
+- С последовательностью (TimerSequence) по дедлайну фазы сразу
+  начинается следующая, без зазора; звонок - только в конце
+- snooze() - разовый отсчёт поверх звонка: последовательность и заданная
+  длительность не меняются
+- snapshot()/restore() переводят дедлайн в реальное время и обратно:
+  идущие таймеры переживают перезапуск, а истёкшие за время простоя
+  звенят сразу после загрузки
+Связи: TimerModel, Timer (представление), TickScheduler, TimerSequence
+"""
+
+import math
+import time
+from typing import Callable, List, Optional
+
+from components.timer_sequence import TimerSequence
+
+IDLE = "idle"
+RUNNING = "running"
+PAUSED = "paused"
+RINGING = "ringing"
+
+TICK = "tick"
+STATE = "state"
+PHASE = "phase"
+
+Listener = Callable[[str], None]
+
+
+class TimerEngine:
+    def __init__(
+        self,
+        scheduler,
+        duration: int = 0,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        self.scheduler = scheduler
+        self.wall_clock = wall_clock
+        self.duration = duration
+        self.state = IDLE
+        self.deadline: Optional[float] = None
+        self.remaining_time = 0
+        self.paused_time = 0.0
+        self.initial_time: Optional[int] = None
+        self.sequence: Optional[TimerSequence] = None
+        self.snoozing = False
+        self._tick_handle: Optional[int] = None
+        self._listeners: List[Listener] = []
+
+    @property
+    def is_running(self) -> bool:
+        return self.state == RUNNING
+
+    def add_listener(self, listener: Listener) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Listener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def set_duration(self, seconds: int) -> None:
+        """Длительность следующего запуска; идущий отсчёт не меняется"""
+        self.duration = max(0, int(seconds))
+        if self.state == IDLE:
+            self.remaining_time = self.duration
+            self._notify(TICK)
+
+    def set_sequence(self, sequence: Optional[TimerSequence]) -> None:
+        """Подключает последовательность фаз; длительность - первая фаза"""
+        self.sequence = sequence
+        if sequence is not None:
+            sequence.reset()
+            self.set_duration(sequence.current.seconds)
+
+    def start(self) -> bool:
+        """Запускает отсчёт заново или продолжает после паузы"""
+        if self.state == RUNNING:
+            return False
+
+        if self.state == PAUSED and self.paused_time > 0:
+            duration = self.paused_time
+        else:
+            self.snoozing = False
+            self._rewind_sequence()
+            duration = self.duration
+            self.initial_time = duration
+
+        if duration <= 0:
+            return False
+
+        self.paused_time = 0
+        self.deadline = self.scheduler.now() + duration
+        self._set_state(RUNNING)
+        self._tick()
+        return True
+
+    def snooze(self, seconds: int) -> bool:
+        """
+        Откладывает звонок на seconds: разовый отсчёт без перемотки
+        последовательности и без смены длительности
+        """
+        seconds = int(seconds)
+        if seconds <= 0:
+            return False
+
+        self._cancel_tick()
+        self.snoozing = True
+        self.paused_time = 0
+        self.initial_time = seconds
+        self.deadline = self.scheduler.now() + seconds
+        self._set_state(RUNNING)
+        self._tick()
+        return True
+
+    def pause(self) -> bool:
+        if self.state != RUNNING:
+            return False
+
+        self._cancel_tick()
+        self.paused_time = max(0, self.deadline - self.scheduler.now())
+        self._set_state(PAUSED)
+        return True
+
+    def stop(self) -> None:
+        """Сбрасывает таймер к заданной длительности из любого состояния"""
+        self._cancel_tick()
+        self.snoozing = False
+        self._rewind_sequence()
+        self.deadline = None
+        self.paused_time = 0
+        self.remaining_time = self.duration
+        self.initial_time = self.duration
+        self._set_state(IDLE)
+
+    def snapshot(self) -> dict:
+        """Состояние отсчёта для timers.json"""
+        state = {"state": self.state, "initial_time": self.initial_time}
+        if self.state == RUNNING:
+            remaining = self.deadline - self.scheduler.now()
+            state["deadline_at"] = round(self.wall_clock() + remaining, 1)
+        elif self.state == PAUSED:
+            state["paused_remaining"] = round(self.paused_time, 1)
+        if self.sequence is not None:
+            state["position"] = self.sequence.position
+        return state
+
+    def restore(self, state: dict) -> None:
+        """
+        Продолжает сохранённый отсчёт по реальным часам. Первый тик идёт
+        через планировщик, поэтому истёкший таймер зазвонит уже после
+        окончания загрузки.
+        """
+        status = state.get("state")
+        if self.state != IDLE or status not in (RUNNING, PAUSED, RINGING):
+            return
+
+        self.initial_time = state.get("initial_time") or self.duration
+        if self.sequence is not None:
+            self.sequence.seek(state.get("position", 0))
+        if status == PAUSED:
+            self.paused_time = float(state.get("paused_remaining", 0))
+            self.remaining_time = math.ceil(self.paused_time)
+            self._set_state(PAUSED)
+            return
+
+        remaining = 0.0
+        if status == RUNNING:
+            remaining = state.get("deadline_at", 0) - self.wall_clock()
+        # Фазы, закончившиеся за время простоя, пропускаются без звонка
+        while remaining <= 0 and self.sequence is not None and self.sequence.advance():
+            remaining += self.sequence.current.seconds
+            self.initial_time = self.sequence.current.seconds
+        remaining = max(0.0, remaining)
+        self.deadline = self.scheduler.now() + remaining
+        self.remaining_time = math.ceil(remaining)
+        self._set_state(RUNNING)
+        self._tick_handle = self.scheduler.call_at(self.scheduler.now(), self._tick)
+
+    def progress(self) -> float:
+        """
+        Доля оставшегося времени от 1.0 (только запущен) до 0.0; для
+        последовательности - по всем фазам сразу
+        """
+        if self.sequence is not None and not self.snoozing:
+            total = self.sequence.total_seconds()
+            left = self.sequence.seconds_after_current() + self.remaining_time
+            return max(0.0, min(1.0, left / total))
+        if not self.initial_time or self.initial_time <= 0:
+            return 1.0
+        return max(0.0, min(1.0, self.remaining_time / self.initial_time))
+
+    def _tick(self) -> None:
+        self._tick_handle = None
+        if self.state != RUNNING:
+            return
+
+        remaining = self.deadline - self.scheduler.now()
+        self.remaining_time = max(0, math.ceil(remaining))
+        self._notify(TICK)
+        if self.state != RUNNING:
+            return
+
+        if self.remaining_time > 0:
+            next_change = self.deadline - (self.remaining_time - 1)
+            self._tick_handle = self.scheduler.call_at(next_change, self._tick)
+            return
+
+        if self.sequence is not None and not self.snoozing and self.sequence.advance():
+            self._next_phase()
+            return
+
+        self.snoozing = False
+        self.deadline = None
+        self._set_state(RINGING)
+
+    def _next_phase(self) -> None:
+        """Следующая фаза отсчитывается от дедлайна предыдущей, без зазора"""
+        duration = self.sequence.current.seconds
+        self.deadline += duration
+        self.initial_time = duration
+        self._notify(PHASE)
+        self._tick()
+
+    def _rewind_sequence(self) -> None:
+        if self.sequence is None:
+            return
+        self.sequence.reset()
+        self.duration = self.sequence.current.seconds
+
+    def _cancel_tick(self) -> None:
+        self.scheduler.cancel(self._tick_handle)
+        self._tick_handle = None
+
+    def _set_state(self, state: str) -> None:
+        self.state = state
+        self._notify(STATE)
+
+    def _notify(self, event: str) -> None:
+        for listener in list(self._listeners):
+            listener(event)
@@ -0,0 +1,271 @@
+"""
+Таймер без строки списка.
+
+Ключевые особенности:
+- Описание, звук, TimerEngine и сигнал живут здесь, а не в виджете:
+  таймер тикает, звенит и показывает уведомление, даже когда его строка
+  прокручена за край списка и отдана другому таймеру
+- Строки (Timer) подписываются на события модели: события TimerEngine
+  пересылаются как есть, CHANGED - изменились описание, длительность,
+  звук или последовательность
+- Полноэкранное окно обновляется от модели, без участия строки
+Связи: MainWindow (список таймеров, сохранение), Timer (строка),
+VirtualTimerList, MainTimerWindow, TimerNotification
+"""
+
+import threading
+import time
+import tkinter as tk
+from typing import Callable, List, Optional
+
+from components.timer_engine import PHASE, RINGING, STATE, TICK, TimerEngine
+from components.timer_sequence import TimerSequence
+from utils.sound_utils import SoundPlayer, audio_engine
+from windows.main_timer_window import MainTimerWindow
+
+CHANGED = "changed"
+DEFAULT_DESCRIPTION = "Описание таймера"
+
+Listener = Callable[[str], None]
+
+
+def split_duration(seconds: int):
+    """Секунды -> (часы, минуты, секунды)"""
+    return seconds // 3600, seconds % 3600 // 60, seconds % 60
+
+
+def format_duration(seconds: int) -> str:
+    return "{:02d}:{:02d}:{:02d}".format(*split_duration(seconds))
+
+
+def parse_field(value) -> int:
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+class TimerModel:
+    def __init__(self, parent, scheduler, on_delete=None):
+        self.parent = parent
+        self.on_delete = on_delete
+        self.engine = TimerEngine(scheduler)
+        self.engine.add_listener(self.on_engine_event)
+        self.description = DEFAULT_DESCRIPTION
+        self.custom_sound: Optional[str] = None
+        self.main_window = None
+        self.sound_player = SoundPlayer()
+        self.alarm_active = False
+        self._listeners: List[Listener] = []
+
+    @property
+    def is_running(self):
+        return self.engine.is_running
+
+    @property
+    def remaining_time(self):
+        return self.engine.remaining_time
+
+    @property
+    def paused_time(self):
+        return self.engine.paused_time
+
+    @property
+    def initial_time(self):
+        return self.engine.initial_time
+
+    def add_listener(self, listener: Listener) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Listener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def set_description(self, text: str) -> None:
+        self.description = text
+        self._notify(CHANGED)
+
+    def set_duration(self, seconds: int) -> None:
+        self.engine.set_duration(seconds)
+        self._notify(CHANGED)
+
+    def set_custom_sound(self, path: Optional[str]) -> None:
+        """Запоминает звук сигнала и заранее декодирует его в фоне"""
+        self.custom_sound = path
+        if path:
+            threading.Thread(
+                target=audio_engine.preload, args=(path,), daemon=True
+            ).start()
+        self._notify(CHANGED)
+
+    def set_sequence(self, sequence: Optional[TimerSequence]) -> None:
+        """Превращает таймер в цепочку фаз (Помодоро) с общим прогрессом"""
+        self.engine.set_sequence(sequence)
+        self._notify(CHANGED)
+
+    def display_title(self) -> str:
+        """Описание таймера, а для цепочки - ещё и текущая фаза"""
+        if self.engine.sequence is None:
+            return self.description
+        return f"{self.description}\n{self.engine.sequence.describe()}"
+
+    def start_timer(self):
+        self.engine.start()
+
+    def pause_timer(self):
+        self.engine.pause()
+
+    def stop_timer(self):
+        self.engine.stop()
+
+    def on_engine_event(self, event):
+        self._notify(event)
+        if event in (TICK, PHASE):
+            self.update_main_window()
+        if event == PHASE:
+            self.sound_player.play_notification()
+        if event == STATE:
+            self.set_main_window_pause_text("⏸" if self.is_running else "▶")
+            if self.engine.state == RINGING:
+                self.play_alarm()
+                self.show_notification()
+
+    def update_main_window(self):
+        try:
+            if self.main_window and self.main_window.winfo_exists():
+                if hasattr(self.main_window, "time_label"):
+                    self.main_window.time_label.configure(
+                        text=format_duration(self.remaining_time)
+                    )
+                if hasattr(self.main_window, "description_label"):
+                    self.main_window.description_label.configure(
+                        text=self.display_title()
+                    )
+                if self.engine.initial_time:
+                    self.main_window.draw_progress()
+        except (tk.TclError, AttributeError):
+            pass
+
+    def set_main_window_pause_text(self, text):
+        try:
+            if (
+                self.main_window
+                and self.main_window.winfo_exists()
+                and hasattr(self.main_window, "pause_btn")
+            ):
+                self.main_window.pause_btn.configure(text=text)
+        except tk.TclError:
+            pass
+
+    def show_main_screen(self):
+        if not self.main_window or not self.main_window.winfo_exists():
+            self.main_window = MainTimerWindow(self.parent, self)
+            self.main_window.attributes("-alpha", 0.0)
+
+            def fade_in():
+                try:
+                    alpha = self.main_window.attributes("-alpha")
+                    if alpha < 1.0:
+                        self.main_window.attributes("-alpha", alpha + 0.1)
+                        self.main_window.after(20, fade_in)
+                except tk.TclError:
+                    pass
+
+            fade_in()
+
+    def play_alarm(self):
+        def sound_thread():
+            if self.custom_sound and self.alarm_active:
+                played = audio_engine.play(self.custom_sound, owner=self, loops=-1)
+                if not played and self.alarm_active:
+                    self.beep_alarm()
+            elif self.alarm_active:
+                self.beep_alarm()
+
+        self.alarm_active = True
+        self.sound_thread = threading.Thread(target=sound_thread, daemon=True)
+        self.sound_thread.start()
+
+    def beep_alarm(self):
+        self.alarm_active = True
+        if self.sound_player.play_beep_loop():
+            return
+
+        def beep_thread():
+            while self.alarm_active:
+                try:
+                    self.sound_player.play_beep()
+                    time.sleep(0.5)
+                except:
+                    break
+
+        self.beep_thread = threading.Thread(target=beep_thread, daemon=True)
+        self.beep_thread.start()
+
+    def stop_alarm(self):
+        self.alarm_active = False
+        audio_engine.stop(self)
+        self.sound_player.stop()
+
+    def show_notification(self):
+        from utils.timer_notification import TimerNotification
+
+        try:
+            next_timers = []
+            if hasattr(self.parent, "timers"):
+                next_timers = [t for t in self.parent.timers if t != self]
+
+            notification = TimerNotification(
+                self.parent, self.description, next_timers, current_timer=self
+            )
+
+            self.parent.wait_window(notification)
+
+            if hasattr(notification, "result") and notification.result == "snooze":
+                return
+
+            self.stop_alarm()
+            self.stop_timer()
+
+        except tk.TclError:
+            pass
+
+    def to_dict(self):
+        hours, minutes, seconds = split_duration(self.engine.duration)
+        return {
+            "description": self.description,
+            "hours": str(hours),
+            "minutes": str(minutes),
+            "seconds": str(seconds),
+            "custom_sound": self.custom_sound,
+            "sequence": (
+                self.engine.sequence.to_json() if self.engine.sequence else None
+            ),
+            "run_state": self.engine.snapshot(),
+        }
+
+    def load_dict(self, timer_data):
+        """Восстанавливает таймер из записи timers.json"""
+        self.description = timer_data["description"]
+        self.engine.set_duration(
+            parse_field(timer_data.get("hours")) * 3600
+            + parse_field(timer_data.get("minutes")) * 60
+            + parse_field(timer_data.get("seconds"))
+        )
+        self.custom_sound = timer_data.get("custom_sound") or None
+
+        if timer_data.get("sequence"):
+            try:
+                self.engine.set_sequence(
+                    TimerSequence.from_json(timer_data["sequence"])
+                )
+            except (KeyError, ValueError, TypeError) as e:
+                print(f"Пропущена некорректная последовательность таймера: {e}")
+
+        if timer_data.get("run_state"):
+            self.engine.restore(timer_data["run_state"])
+        self._notify(CHANGED)
+
+    def _notify(self, event: str) -> None:
+        for listener in list(self._listeners):
+            listener(event)
@@ -0,0 +1,129 @@
+"""
+Последовательность фаз таймера (циклы Помодоро).
+
+Ключевые особенности:
+- Упорядоченный список фаз повторяется cycles раз
+- Длинный перерыв заменяет последнюю фазу каждого long_break_every-го
+  цикла: фокус, перерыв, ..., фокус, длинный перерыв
+- Позиция - номер шага в развёрнутом списке фаз: её легко сохранить
+  и восстановить, а общий прогресс считается по ней одной
+- Разбор из timers.json один раз при загрузке (from_json), обратное
+  преобразование при сохранении (to_json)
+Связи: TimerEngine (переключает фазы), Timer, MainWindow (пресеты)
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional
+
+
+class Phase(NamedTuple):
+    name: str
+    seconds: int
+
+
+class TimerSequence:
+    def __init__(
+        self,
+        phases: List[Phase],
+        cycles: int = 1,
+        long_break: Optional[Phase] = None,
+        long_break_every: int = 0,
+    ):
+        if not phases or any(phase.seconds <= 0 for phase in phases):
+            raise ValueError("Последовательность требует фазы ненулевой длины")
+        self.phases = list(phases)
+        self.cycles = max(1, cycles)
+        self.long_break = long_break
+        self.long_break_every = long_break_every
+        self.position = 0
+
+    @property
+    def step_count(self) -> int:
+        return self.cycles * len(self.phases)
+
+    @property
+    def cycle(self) -> int:
+        """Номер текущего цикла, начиная с 1"""
+        return self.position // len(self.phases) + 1
+
+    @property
+    def current(self) -> Phase:
+        return self.phase_at(self.position)
+
+    def phase_at(self, position: int) -> Phase:
+        cycle, index = divmod(position, len(self.phases))
+        if (
+            self.long_break is not None
+            and self.long_break_every > 0
+            and index == len(self.phases) - 1
+            and (cycle + 1) % self.long_break_every == 0
+        ):
+            return self.long_break
+        return self.phases[index]
+
+    def reset(self) -> None:
+        self.position = 0
+
+    def advance(self) -> bool:
+        """Переходит к следующей фазе; False - последовательность закончилась"""
+        if self.position + 1 >= self.step_count:
+            return False
+        self.position += 1
+        return True
+
+    def seek(self, position: int) -> None:
+        self.position = max(0, min(position, self.step_count - 1))
+
+    def total_seconds(self) -> int:
+        return sum(self.phase_at(step).seconds for step in range(self.step_count))
+
+    def seconds_after_current(self) -> int:
+        """Длительность фаз, которые ещё не начались"""
+        return sum(
+            self.phase_at(step).seconds
+            for step in range(self.position + 1, self.step_count)
+        )
+
+    def describe(self) -> str:
+        """Подпись текущей фазы для строки таймера и полноэкранного окна"""
+        return f"{self.current.name} · цикл {self.cycle}/{self.cycles}"
+
+    def to_json(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "phases": [list(phase) for phase in self.phases],
+            "cycles": self.cycles,
+        }
+        if self.long_break is not None:
+            data["long_break"] = list(self.long_break)
+            data["long_break_every"] = self.long_break_every
+        return data
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "TimerSequence":
+        """Разбирает последовательность; ValueError/TypeError при ошибке"""
+        phases = [Phase(str(name), int(seconds)) for name, seconds in data["phases"]]
+        long_break = data.get("long_break")
+        if long_break is not None:
+            long_break = Phase(str(long_break[0]), int(long_break[1]))
+        return cls(
+            phases,
+            cycles=int(data.get("cycles", 1)),
+            long_break=long_break,
+            long_break_every=int(data.get("long_break_every", 0)),
+        )
+
+
+def pomodoro_sequence() -> TimerSequence:
+    """4 цикла 25+5, последний перерыв четвёртого цикла - длинный"""
+    return TimerSequence(
+        [Phase("🍅 Фокус", 25 * 60), Phase("☕️ Короткий перерыв", 5 * 60)],
+        cycles=4,
+        long_break=Phase("🌴 Длинный перерыв", 15 * 60),
+        long_break_every=4,
+    )
+
+
+def long_focus_sequence() -> TimerSequence:
+    return TimerSequence(
+        [Phase("🔋 Глубокий фокус", 52 * 60), Phase("🌳 Длинный перерыв", 17 * 60)],
+        cycles=2,
+    )
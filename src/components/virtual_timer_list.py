@@ -0,0 +1,220 @@
+"""
+Виртуализированный список таймеров.
+
+Ключевые особенности:
+- Строки Timer создаются только для видимой части списка; при прокрутке
+  те же строки привязываются к другим моделям (Timer.bind_model), так что
+  число виджетов не растёт с числом таймеров
+- Прокрутка идёт по таймерам, а не по пикселям: полоса прокрутки
+  показывает положение во всём списке моделей
+- Запущенные таймеры за краем окна перечислены в строке-сводке
+  под списком; щелчок по сводке прокручивает к первому из них
+Связи: MainWindow (список моделей), Timer, TimerModel, VirtualTreeview
+(visible_window)
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from typing import List, Sequence, Set
+
+from components.timer import Timer
+from components.timer_engine import RINGING, RUNNING
+from components.timer_model import TimerModel, format_duration
+from components.virtual_treeview import visible_window
+
+DEFAULT_ROW_HEIGHT = 90
+SUMMARY_LIMIT = 3
+
+
+def offscreen_running(
+    models: Sequence[TimerModel], start: int, end: int
+) -> List[TimerModel]:
+    """Идущие и звенящие таймеры вне строк start..end"""
+    return [
+        model
+        for position, model in enumerate(models)
+        if not start <= position < end and model.engine.state in (RUNNING, RINGING)
+    ]
+
+
+def summary_text(models: Sequence[TimerModel], limit: int = SUMMARY_LIMIT) -> str:
+    """Краткая сводка по таймерам вне экрана: описание и остаток"""
+    if not models:
+        return ""
+
+    parts = []
+    for model in models[:limit]:
+        icon = "🔔" if model.engine.state == RINGING else "▶"
+        title = model.description.strip() or "Без описания"
+        parts.append(f"{icon} {title} — {format_duration(model.remaining_time)}")
+    if len(models) > limit:
+        parts.append(f"и ещё {len(models) - limit}")
+    return "Вне экрана: " + " · ".join(parts)
+
+
+class VirtualTimerList(ttk.Frame):
+    """Показывает список TimerModel через пул переиспользуемых строк Timer"""
+
+    def __init__(self, parent, models: List[TimerModel]):
+        super().__init__(parent)
+        self.models = models
+        self._rows: List[Timer] = []
+        self._shown = 0
+        self._offset = 0
+        self._end = 0
+        self._short_row = DEFAULT_ROW_HEIGHT
+        self._tall_row = DEFAULT_ROW_HEIGHT
+        self._watched: Set[TimerModel] = set()
+        self._render_pending = False
+        self._summary_pending = False
+        self._summary_models: List[TimerModel] = []
+
+        self.summary_label = ttk.Label(self, cursor="hand2", padding=(5, 5))
+        self.summary_label.bind("<Button-1>", self._on_summary_click)
+
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.viewport = ttk.Frame(self)
+        self.viewport.pack_propagate(False)
+        self.viewport.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.viewport.bind("<Configure>", lambda e: self._schedule_render())
+
+    def refresh(self) -> None:
+        """Список моделей изменился: перерисовать окно и сводку"""
+        current = set(self.models)
+        for model in self._watched - current:
+            model.remove_listener(self._on_model_event)
+        for model in current - self._watched:
+            model.add_listener(self._on_model_event)
+        self._watched = current
+        self._schedule_render()
+
+    def see(self, model: TimerModel) -> None:
+        """Прокручивает список так, чтобы таймер был виден"""
+        if model not in self.models:
+            return
+
+        position = self.models.index(model)
+        visible = self._visible_count()
+        if position < self._offset:
+            self._offset = position
+        elif position >= self._offset + visible:
+            self._offset = position - visible + 1
+        self._schedule_render()
+
+    def yview(self, *args) -> None:
+        """Команда полосы прокрутки в координатах всего списка"""
+        if not args:
+            return
+
+        if args[0] == "moveto":
+            self._offset = int(float(args[1]) * len(self.models))
+        elif args[0] == "scroll":
+            step = self._visible_count() if args[2] == "pages" else 1
+            self._offset += int(args[1]) * step
+        self._render()
+
+    def scroll(self, units: int) -> None:
+        """Прокрутка колесом мыши на units таймеров"""
+        if units:
+            self._offset += units
+            self._render()
+
+    def _visible_count(self) -> int:
+        """Сколько строк гарантированно помещается целиком"""
+        height = self.viewport.winfo_height()
+        if height <= 1:
+            return 1
+        return max(1, height // self._tall_row)
+
+    def _render_count(self) -> int:
+        """Сколько строк нужно, чтобы заполнить окно до низа"""
+        height = self.viewport.winfo_height()
+        if height <= 1:
+            return 1
+        return height // self._short_row + 1
+
+    def _schedule_render(self) -> None:
+        if self._render_pending:
+            return
+        self._render_pending = True
+        self.after_idle(self._render)
+
+    def _render(self) -> None:
+        self._render_pending = False
+        total = len(self.models)
+        offset, start, end = visible_window(
+            total, self._offset, self._visible_count(), 0
+        )
+        end = min(total, offset + max(end - offset, self._render_count()))
+        window = self.models[offset:end]
+
+        for index, model in enumerate(window):
+            if index == len(self._rows):
+                self._rows.append(Timer(self.viewport, model=model))
+            else:
+                self._rows[index].bind_model(model)
+            if index >= self._shown:
+                self._rows[index].pack(fill=tk.X)
+
+        for row in self._rows[len(window) : self._shown]:
+            row.pack_forget()
+            row.unbind_model()
+        self._shown = len(window)
+
+        self._offset = offset
+        self._end = offset + self._measure_rows()
+        self._update_scrollbar()
+        self._update_summary()
+
+    def _measure_rows(self) -> int:
+        """
+        Запоминает высоты строк (с пресетами строка выше) и возвращает,
+        сколько строк хотя бы частично попало в окно
+        """
+        self.viewport.update_idletasks()
+        heights = [row.winfo_reqheight() for row in self._rows[: self._shown]]
+        if heights and all(height > 1 for height in heights):
+            self._short_row = min(heights)
+            self._tall_row = max(heights)
+        else:
+            return self._shown
+
+        height = self.viewport.winfo_height()
+        top = 0
+        on_screen = 0
+        for row_height in heights:
+            if top >= height:
+                break
+            on_screen += 1
+            top += row_height
+        return on_screen
+
+    def _update_scrollbar(self) -> None:
+        total = len(self.models)
+        visible = self._visible_count()
+        if total <= visible:
+            self.scrollbar.set(0, 1)
+            return
+        self.scrollbar.set(self._offset / total, (self._offset + visible) / total)
+
+    def _on_model_event(self, event: str) -> None:
+        if self._summary_pending:
+            return
+        self._summary_pending = True
+        self.after_idle(self._update_summary)
+
+    def _update_summary(self) -> None:
+        self._summary_pending = False
+        self._summary_models = offscreen_running(self.models, self._offset, self._end)
+        text = summary_text(self._summary_models)
+        if text:
+            self.summary_label.configure(text=text)
+            self.summary_label.pack(side=tk.BOTTOM, fill=tk.X, before=self.scrollbar)
+        else:
+            self.summary_label.pack_forget()
+
+    def _on_summary_click(self, event=None) -> None:
+        if self._summary_models:
+            self.see(self._summary_models[0])
@@ -0,0 +1,169 @@
+"""
+Виртуализированный список поверх ttk.Treeview.
+
+Ключевые особенности:
+- В дереве живут только видимые строки и небольшой запас сверху и снизу
+- Строки адресуются ключом модели; при обновлении меняются только
+  изменившиеся строки, остальные остаются на месте вместе с выделением
+- Полоса прокрутки показывает положение во всей модели, а не в окне
+Связи: CalorieTrackerTab (база продуктов, приемы пищи), PushupTrackerTab
+"""
+
+from tkinter import ttk
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+DEFAULT_MARGIN = 5
+DEFAULT_ROW_HEIGHT = 20
+
+
+class VirtualRow(NamedTuple):
+    key: str
+    values: tuple
+    tags: tuple = ()
+
+
+def visible_window(
+    total: int, offset: int, visible: int, margin: int
+) -> Tuple[int, int, int]:
+    """Возвращает (offset, start, end): первую видимую строку и границы окна"""
+    offset = max(0, min(offset, total - visible))
+    start = max(0, offset - margin)
+    end = min(total, offset + visible + margin)
+    return offset, start, end
+
+
+class VirtualTreeview:
+    """Показывает модель строк в Treeview, материализуя только окно вокруг offset"""
+
+    def __init__(
+        self,
+        tree: ttk.Treeview,
+        scrollbar: Optional[ttk.Scrollbar] = None,
+        margin: int = DEFAULT_MARGIN,
+    ):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.margin = margin
+        self._rows: List[VirtualRow] = []
+        self._positions: Dict[str, int] = {}
+        self._rendered: Dict[str, VirtualRow] = {}
+        self._order: List[str] = []
+        self._offset = 0
+        self._start = 0
+        self._render_pending = False
+
+        tree.configure(yscrollcommand=self._on_tree_scroll)
+        tree.bind("<Configure>", lambda e: self._schedule_render(), add="+")
+        if scrollbar is not None:
+            scrollbar.configure(command=self.yview)
+
+    def set_rows(self, rows: Iterable[VirtualRow]) -> None:
+        """Заменяет модель и обновляет только изменившиеся видимые строки"""
+        self._rows = list(rows)
+        self._positions = {row.key: i for i, row in enumerate(self._rows)}
+        self._render()
+
+    def index_of(self, key: str) -> int:
+        """Позиция строки в модели по ключу (iid элемента дерева)"""
+        return self._positions[key]
+
+    def see(self, key: str) -> None:
+        """Прокручивает модель так, чтобы строка была видна"""
+        position = self._positions.get(key)
+        if position is None:
+            return
+
+        visible = self._visible_count()
+        if position < self._offset or position >= self._offset + visible:
+            self._offset = position
+            self._render()
+        self.tree.see(key)
+
+    def yview(self, *args) -> None:
+        """Команда полосы прокрутки в координатах всей модели"""
+        if not args:
+            return
+
+        total = len(self._rows)
+        if args[0] == "moveto":
+            self._offset = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = self._visible_count() if args[2] == "pages" else 1
+            self._offset += int(args[1]) * step
+        self._render()
+
+    def _visible_count(self) -> int:
+        height = self.tree.winfo_height()
+        if height <= 1:
+            return int(self.tree.cget("height"))
+
+        style = self.tree.cget("style") or "Treeview"
+        row_height = ttk.Style().lookup(style, "rowheight") or DEFAULT_ROW_HEIGHT
+        return max(1, height // int(row_height))
+
+    def _schedule_render(self) -> None:
+        if self._render_pending:
+            return
+        self._render_pending = True
+        self.tree.after_idle(self._render)
+
+    def _render(self) -> None:
+        self._render_pending = False
+        visible = self._visible_count()
+        offset, start, end = visible_window(
+            len(self._rows), self._offset, visible, self.margin
+        )
+        window = self._rows[start:end]
+        self._apply(window)
+
+        self._offset = offset
+        self._start = start
+        if window:
+            self.tree.yview_moveto((offset - start) / len(window))
+        self._update_scrollbar(visible)
+
+    def _apply(self, window: List[VirtualRow]) -> None:
+        """Приводит элементы дерева к окну модели минимальным числом операций"""
+        wanted = {row.key for row in window}
+        order = []
+        for key in self._order:
+            if key in wanted:
+                order.append(key)
+            else:
+                self.tree.delete(key)
+                del self._rendered[key]
+
+        for pos, row in enumerate(window):
+            old = self._rendered.get(row.key)
+            if old is None:
+                self.tree.insert("", pos, iid=row.key, values=row.values, tags=row.tags)
+                order.insert(pos, row.key)
+            elif old != row:
+                self.tree.item(row.key, values=row.values, tags=row.tags)
+
+            if order[pos] != row.key:
+                self.tree.move(row.key, "", pos)
+                order.remove(row.key)
+                order.insert(pos, row.key)
+            self._rendered[row.key] = row
+
+        self._order = order
+
+    def _on_tree_scroll(self, first: str, last: str) -> None:
+        """Прокрутка внутри окна (колесо, клавиши) сдвигает окно по модели"""
+        offset = self._start + round(float(first) * len(self._order))
+        if offset != self._offset:
+            self._offset = offset
+            self._schedule_render()
+            return
+        self._update_scrollbar(self._visible_count())
+
+    def _update_scrollbar(self, visible: int) -> None:
+        if self.scrollbar is None:
+            return
+
+        total = len(self._rows)
+        if total <= visible:
+            self.scrollbar.set(0, 1)
+            return
+        self.scrollbar.set(self._offset / total, (self._offset + visible) / total)
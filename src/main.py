@@ -1,12 +1,36 @@
 import os
 import sys
 
-from windows.main_window import MainWindow
+from utils.startup_profiler import profiler
+
+PROFILE_FLAG = "--profile-startup"
+
+
+def main() -> None:
+    if PROFILE_FLAG in sys.argv:
+        profiler.enable()
+
+    with profiler.phase("импорты"):
+        from windows.main_window import MainWindow
+
+    app = MainWindow()
+
+    if profiler.enabled:
+        painted_from = profiler.now()
+
+        def report_first_paint() -> None:
+            app.update_idletasks()
+            profiler.record("первая отрисовка", profiler.now() - painted_from)
+            print(profiler.finish())
+
+        app.after_idle(report_first_paint)
+
+    app.mainloop()
+
 
 if __name__ == "__main__":
     if getattr(sys, "frozen", False):
         os.environ["PYTHONVERBOSE"] = "0"
         os.environ["PYTHONOPTIMIZE"] = "2"
 
-    app = MainWindow()
-    app.mainloop()
+    main()
@@ -0,0 +1,82 @@
+"""
+Кэш итогов калорий и БЖУ по приемам пищи.
+
+Ответственность:
+- Хранит суммы по ключу (date, meal_type), считая их один раз
+- Поддерживает суммы инкрементально при добавлении и удалении записей
+- Точечно сбрасывает итоги приема пищи, если записи изменены иначе
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+MACROS = ["protein", "fat", "carbs"]
+
+
+class MealTotals:
+    """Суммы одного приема пищи; счётчики отличают 0 от «нет данных»"""
+
+    __slots__ = ("calories", "sums", "counts")
+
+    def __init__(self):
+        self.calories = 0
+        self.sums = {macro: 0 for macro in MACROS}
+        self.counts = {macro: 0 for macro in MACROS}
+
+    def add(self, entry: dict, sign: int = 1) -> None:
+        self.calories += sign * entry["calories"]
+        for macro in MACROS:
+            if entry.get(macro) is not None:
+                self.sums[macro] += sign * entry[macro]
+                self.counts[macro] += sign
+
+    def merge(self, other: "MealTotals") -> None:
+        self.calories += other.calories
+        for macro in MACROS:
+            self.sums[macro] += other.sums[macro]
+            self.counts[macro] += other.counts[macro]
+
+    def macros(self) -> Dict[str, Optional[int]]:
+        return {
+            macro: self.sums[macro] if self.counts[macro] else None
+            for macro in MACROS
+        }
+
+
+class AggregateCache:
+    """Итоги по (date, meal_type) с точечной инвалидацией"""
+
+    def __init__(self):
+        self._totals: Dict[Tuple[str, str], MealTotals] = {}
+
+    def get(self, date: str, meal_type: str, entries: List[dict]) -> MealTotals:
+        """Возвращает итоги приема пищи, считая их только при промахе"""
+        key = (date, meal_type)
+        totals = self._totals.get(key)
+        if totals is None:
+            totals = MealTotals()
+            for entry in entries:
+                totals.add(entry)
+            self._totals[key] = totals
+        return totals
+
+    def combine(self, parts: Iterable[MealTotals]) -> MealTotals:
+        result = MealTotals()
+        for part in parts:
+            result.merge(part)
+        return result
+
+    def entry_added(self, date: str, meal_type: str, entry: dict) -> None:
+        totals = self._totals.get((date, meal_type))
+        if totals is not None:
+            totals.add(entry)
+
+    def entry_removed(self, date: str, meal_type: str, entry: dict) -> None:
+        totals = self._totals.get((date, meal_type))
+        if totals is not None:
+            totals.add(entry, sign=-1)
+
+    def invalidate(self, date: str, meal_type: str) -> None:
+        self._totals.pop((date, meal_type), None)
+
+    def clear(self) -> None:
+        self._totals.clear()
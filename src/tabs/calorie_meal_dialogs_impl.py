@@ -25,7 +25,7 @@ def show_add_product_dialog_impl(
 
     Принимает tab_instance для доступа к storage, current_date и методам.
     """
-    products = tab_instance.storage.get_all_products()
+    storage = tab_instance.storage
 
     dialog = tk.Toplevel(tab_instance)
     dialog.title("Редактировать запись" if edit_mode else "Добавить продукт")
@@ -92,29 +92,26 @@ def show_add_product_dialog_impl(
     product_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
     listbox_scroll.pack(side=tk.RIGHT, fill=tk.Y)
 
-    all_products = sorted(products.keys())
-    for product in all_products:
-        product_listbox.insert(tk.END, product)
+    def fill_listbox(names, selected=""):
+        product_listbox.delete(0, tk.END)
+        for product in names:
+            product_listbox.insert(tk.END, product)
 
-    if edit_mode and edit_data:
-        product_name = edit_data.get("product", "")
-        if product_name in all_products:
-            idx = all_products.index(product_name)
+        if selected in names:
+            idx = names.index(selected)
             product_listbox.selection_set(idx)
             product_listbox.see(idx)
-    elif all_products:
-        product_listbox.selection_set(0)
-
-    def filter_products(*args):
-        search_text = product_search.get().lower()
-        product_listbox.delete(0, tk.END)
+        elif names:
+            product_listbox.selection_set(0)
 
-        filtered = [p for p in all_products if search_text in p.lower()]
-        for product in filtered:
-            product_listbox.insert(tk.END, product)
+    initial_products = storage.search_products("")
+    edited_product = edit_data.get("product", "") if edit_mode else ""
+    if edited_product not in initial_products and storage.get_product(edited_product):
+        initial_products.insert(0, edited_product)
+    fill_listbox(initial_products, edited_product)
 
-        if filtered:
-            product_listbox.selection_set(0)
+    def filter_products(*args):
+        fill_listbox(storage.search_products(product_search.get()))
 
     product_search.trace("w", filter_products)
 
@@ -0,0 +1,65 @@
+"""
+Обратный индекс продуктов для хранилища калорий.
+
+Ответственность:
+- Хранит для каждого продукта множество позиций (date, meal_type, idx)
+- Позволяет переименовывать и удалять продукт за O(записей продукта)
+  вместо обхода всей истории
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+
+Location = Tuple[str, str, int]
+
+
+class ProductEntryIndex:
+    """Индекс product -> {(date, meal_type, idx)}"""
+
+    def __init__(self):
+        self._locations: Dict[str, Set[Location]] = {}
+
+    def rebuild(self, daily_entries: Dict[str, Dict[str, List[dict]]]) -> None:
+        """Строит индекс заново по всем записям"""
+        self._locations = {}
+        for date, meals in daily_entries.items():
+            for meal_type, entries in meals.items():
+                self.index_meal(date, meal_type, entries)
+
+    def add(self, product: Optional[str], location: Location) -> None:
+        if product is None:
+            return
+        self._locations.setdefault(product, set()).add(location)
+
+    def discard(self, product: Optional[str], location: Location) -> None:
+        locations = self._locations.get(product)
+        if locations is None:
+            return
+
+        locations.discard(location)
+        if not locations:
+            del self._locations[product]
+
+    def get(self, product: str) -> Set[Location]:
+        return set(self._locations.get(product, ()))
+
+    def pop(self, product: str) -> Set[Location]:
+        return self._locations.pop(product, set())
+
+    def index_meal(self, date: str, meal_type: str, entries: List[dict]) -> None:
+        """Добавляет в индекс все записи приема пищи"""
+        for idx, entry in enumerate(entries):
+            self.add(entry.get("product"), (date, meal_type, idx))
+
+    def unindex_meal(self, date: str, meal_type: str, entries: List[dict]) -> None:
+        """Убирает из индекса все записи приема пищи"""
+        for idx, entry in enumerate(entries):
+            self.discard(entry.get("product"), (date, meal_type, idx))
+
+    def shift_after(
+        self, date: str, meal_type: str, entries: List[dict], removed_idx: int
+    ) -> None:
+        """Сдвигает позиции записей, стоявших после удалённой"""
+        for idx in range(removed_idx, len(entries)):
+            product = entries[idx].get("product")
+            self.discard(product, (date, meal_type, idx + 1))
+            self.add(product, (date, meal_type, idx))
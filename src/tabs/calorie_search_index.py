@@ -0,0 +1,148 @@
+"""
+Поисковый индекс по названиям продуктов.
+
+Ответственность:
+- Отсортированный список названий для префиксного поиска через bisect
+- Триграммный индекс для поиска подстрок и нечёткого поиска с опечатками
+- Индекс букв и пар букв для подстрок короче триграммы
+- Ранжирование: точное совпадение, префикс, начало слова, подстрока, похожие
+- Инкрементальное обновление при добавлении, переименовании и удалении
+"""
+
+import bisect
+from typing import Dict, Iterable, List, Set, Tuple
+
+SEARCH_LIMIT = 200
+FUZZY_THRESHOLD = 0.4
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _short_grams(text: str) -> Set[str]:
+    """Все подстроки длиной 1 и 2 - ключи для коротких запросов"""
+    return {text[i : i + n] for n in (1, 2) for i in range(len(text) - n + 1)}
+
+
+class ProductSearchIndex:
+    """Индекс названий продуктов: сортированный список + n-граммы"""
+
+    def __init__(self):
+        self._sorted: List[Tuple[str, str]] = []
+        self._trigrams: Dict[str, Set[str]] = {}
+        self._short: Dict[str, Set[str]] = {}
+        self._lower: Dict[str, str] = {}
+
+    def rebuild(self, names: Iterable[str]) -> None:
+        self._sorted = []
+        self._trigrams = {}
+        self._short = {}
+        self._lower = {}
+        for name in names:
+            self._index(name)
+        self._sorted = sorted((lower, name) for name, lower in self._lower.items())
+
+    def add(self, name: str) -> None:
+        if name in self._lower:
+            return
+        self._index(name)
+        bisect.insort(self._sorted, (name.lower(), name))
+
+    def remove(self, name: str) -> None:
+        lower = self._lower.pop(name, None)
+        if lower is None:
+            return
+
+        pos = bisect.bisect_left(self._sorted, (lower, name))
+        if pos < len(self._sorted) and self._sorted[pos] == (lower, name):
+            del self._sorted[pos]
+
+        for grams, index in (
+            (_trigrams(lower), self._trigrams),
+            (_short_grams(lower), self._short),
+        ):
+            for gram in grams:
+                names = index.get(gram)
+                if names is None:
+                    continue
+                names.discard(name)
+                if not names:
+                    del index[gram]
+
+    def _index(self, name: str) -> None:
+        lower = name.lower()
+        self._lower[name] = lower
+        for trigram in _trigrams(lower):
+            self._trigrams.setdefault(trigram, set()).add(name)
+        for gram in _short_grams(lower):
+            self._short.setdefault(gram, set()).add(name)
+
+    def search(self, query: str, limit: int = SEARCH_LIMIT) -> List[str]:
+        """Возвращает до limit названий, лучшие совпадения первыми"""
+        query = query.strip().lower()
+        if not query:
+            return [name for _, name in self._sorted[:limit]]
+
+        ranked = self._rank_substring(query)
+        if len(ranked) < limit:
+            found = {match[-1] for match in ranked}
+            ranked += self._rank_fuzzy(query, found)
+
+        ranked.sort()
+        return [match[-1] for match in ranked[:limit]]
+
+    def _candidates(self, query: str) -> Iterable[str]:
+        """
+        Названия, содержащие все триграммы запроса; для запросов короче
+        триграммы - названия с этой буквой или парой букв
+        """
+        if len(query) < 3:
+            return self._short.get(query, ())
+
+        sets = [self._trigrams.get(query[i : i + 3]) for i in range(len(query) - 2)]
+        if not all(sets):
+            return ()
+        sets.sort(key=len)
+        return set.intersection(*sets)
+
+    def _rank_substring(self, query: str) -> List[Tuple[int, float, str, str]]:
+        """Совпадения подстроки: (ранг, позиция, ключ сортировки, название)"""
+        ranked = []
+        for name in self._candidates(query):
+            lower = self._lower[name]
+            pos = lower.find(query)
+            if pos < 0:
+                continue
+
+            if lower == query:
+                rank = 0
+            elif pos == 0:
+                rank = 1
+            elif lower[pos - 1] in " -,.(":
+                rank = 2
+            else:
+                rank = 3
+            ranked.append((rank, pos, lower, name))
+        return ranked
+
+    def _rank_fuzzy(
+        self, query: str, found: Set[str]
+    ) -> List[Tuple[int, float, str, str]]:
+        """Похожие названия по доле общих триграмм"""
+        query_trigrams = _trigrams(query)
+        shared: Dict[str, int] = {}
+        for trigram in query_trigrams:
+            for name in self._trigrams.get(trigram, ()):
+                shared[name] = shared.get(name, 0) + 1
+
+        ranked = []
+        for name, count in shared.items():
+            if name in found:
+                continue
+            lower = self._lower[name]
+            similarity = count / len(query_trigrams | _trigrams(lower))
+            if similarity >= FUZZY_THRESHOLD:
+                ranked.append((4, -similarity, lower, name))
+        return ranked
@@ -0,0 +1,441 @@
+"""
+SQLite-хранилище для трекинга калорий.
+
+Ответственность:
+- Тот же публичный API, что и у CalorieStorage
+- Продукты и записи в таблицах с индексами по (date, meal_type) и product
+- Переименование продукта - один UPDATE, итоги дня - агрегаты SQL
+- Поиск продуктов по индексу названий в памяти
+- В памяти ничего не держит: история читается запросами по дням
+- Переносит данные из calories.json при первом запуске и заново, если
+  JSON-хранилище менялось после переноса (переключение бэкенда туда и обратно)
+"""
+
+import sqlite3
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from tabs.calorie_search_index import SEARCH_LIMIT, ProductSearchIndex
+from utils.journal_storage import JournalStorage
+
+MEAL_TYPES = ["breakfast", "lunch", "dinner", "snack"]
+MACROS = ["protein", "fat", "carbs"]
+PRODUCT_FIELDS = [
+    "calories",
+    "protein",
+    "fat",
+    "carbs",
+    "serving_size",
+    "calories_per_serving",
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    name TEXT PRIMARY KEY,
+    calories INTEGER NOT NULL,
+    protein INTEGER,
+    fat INTEGER,
+    carbs INTEGER,
+    serving_size INTEGER,
+    calories_per_serving INTEGER
+);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL,
+    meal_type TEXT NOT NULL,
+    product TEXT NOT NULL,
+    amount REAL NOT NULL,
+    is_grams INTEGER NOT NULL,
+    calories INTEGER NOT NULL,
+    protein INTEGER,
+    fat INTEGER,
+    carbs INTEGER,
+    time TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_entries_date_meal ON entries (date, meal_type);
+CREATE INDEX IF NOT EXISTS idx_entries_product ON entries (product);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+MULTIPLIER_SQL = "(CASE WHEN is_grams THEN amount / 100.0 ELSE amount END)"
+
+
+class SqliteCalorieStorage:
+    """
+    Хранилище продуктов и записей калорий в SQLite.
+
+    Изменения копятся в открытой транзакции и фиксируются в save(),
+    как и у JSON-хранилища.
+    """
+
+    def __init__(self, path: str = "calories.db", legacy_path: str = "calories.json"):
+        self._conn = sqlite3.connect(path)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(SCHEMA)
+        self._migrate_from_json(legacy_path)
+        self._search_index = ProductSearchIndex()
+        self._search_index.rebuild(
+            row["name"] for row in self._conn.execute("SELECT name FROM products")
+        )
+
+    def add_product_to_db(
+        self,
+        name: str,
+        calories: int,
+        protein: Optional[int] = None,
+        fat: Optional[int] = None,
+        carbs: Optional[int] = None,
+        serving_size: Optional[int] = None,
+        calories_per_serving: Optional[int] = None,
+    ) -> None:
+        """Добавляет продукт в базу с автоматическим расчётом калорий"""
+        if calories_per_serving and serving_size and not calories:
+            calories = int((calories_per_serving / serving_size) * 100)
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO products VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (name, calories, protein, fat, carbs, serving_size, calories_per_serving),
+        )
+        self._search_index.add(name)
+
+    def update_product_in_db(
+        self,
+        old_name: str,
+        name: str,
+        calories: int,
+        protein: Optional[int] = None,
+        fat: Optional[int] = None,
+        carbs: Optional[int] = None,
+        serving_size: Optional[int] = None,
+        calories_per_serving: Optional[int] = None,
+    ) -> None:
+        """Обновляет продукт и пересчитывает его записи одним UPDATE"""
+        if old_name != name:
+            self._conn.execute("DELETE FROM products WHERE name = ?", (old_name,))
+            self._search_index.remove(old_name)
+
+        self.add_product_to_db(
+            name, calories, protein, fat, carbs, serving_size, calories_per_serving
+        )
+        self._recalculate_entries_for_product(old_name, name)
+
+    def _recalculate_entries_for_product(self, old_name: str, new_name: str) -> None:
+        """Переименовывает и пересчитывает записи по индексу product"""
+        product = self._get_product(new_name)
+        if product is None:
+            return
+
+        macro_sql = ", ".join(
+            f"{macro} = CASE WHEN :{macro} THEN "
+            f"CAST(:{macro} * {MULTIPLIER_SQL} AS INTEGER) ELSE NULL END"
+            for macro in MACROS
+        )
+        self._conn.execute(
+            f"UPDATE entries SET product = :new_name, "
+            f"calories = CAST(:calories * {MULTIPLIER_SQL} AS INTEGER), {macro_sql} "
+            f"WHERE product IN (:old_name, :new_name)",
+            {**product, "old_name": old_name, "new_name": new_name},
+        )
+
+    def remove_product_from_db(self, name: str) -> None:
+        """Удаляет продукт из базы и всех приемов пищи"""
+        cursor = self._conn.execute("DELETE FROM products WHERE name = ?", (name,))
+        if cursor.rowcount:
+            self._conn.execute("DELETE FROM entries WHERE product = ?", (name,))
+            self._search_index.remove(name)
+
+    def get_product(self, name: str) -> Optional[dict]:
+        """Возвращает продукт по названию"""
+        return self._get_product(name)
+
+    def search_products(self, query: str, limit: int = SEARCH_LIMIT) -> List[str]:
+        """Ищет продукты по названию, лучшие совпадения первыми"""
+        return self._search_index.search(query, limit)
+
+    def _get_product(self, name: str) -> Optional[dict]:
+        row = self._conn.execute(
+            "SELECT * FROM products WHERE name = ?", (name,)
+        ).fetchone()
+        return self._product_from_row(row) if row else None
+
+    def _product_from_row(self, row: sqlite3.Row) -> dict:
+        return {field: row[field] for field in PRODUCT_FIELDS}
+
+    def _calculate_multiplier(self, amount: float, is_grams: bool) -> float:
+        """Вычисляет множитель для расчёта калорий и БЖУ"""
+        return amount / 100.0 if is_grams else amount
+
+    def _nutrients(self, product: dict, multiplier: float) -> dict:
+        """Считает калории и БЖУ записи так же, как JSON-хранилище"""
+        nutrients = {"calories": int(product["calories"] * multiplier)}
+        for macro in MACROS:
+            nutrients[macro] = (
+                int(product[macro] * multiplier) if product[macro] else None
+            )
+        return nutrients
+
+    def get_all_products(self) -> Dict[str, dict]:
+        """Возвращает всю базу продуктов"""
+        rows = self._conn.execute("SELECT * FROM products")
+        return {row["name"]: self._product_from_row(row) for row in rows}
+
+    def get_entries_for_product(self, name: str) -> List[Tuple[str, str, int]]:
+        """Возвращает позиции (date, meal_type, idx) всех записей с продуктом"""
+        rows = self._conn.execute(
+            "SELECT date, meal_type, idx FROM ("
+            "SELECT product, date, meal_type, "
+            "ROW_NUMBER() OVER (PARTITION BY date, meal_type ORDER BY id) - 1 AS idx "
+            "FROM entries WHERE (date, meal_type) IN "
+            "(SELECT date, meal_type FROM entries WHERE product = ?)"
+            ") WHERE product = ? ORDER BY date, meal_type, idx",
+            (name, name),
+        )
+        return [(row["date"], row["meal_type"], row["idx"]) for row in rows]
+
+    def add_meal_entry(
+        self,
+        date: str,
+        meal_type: str,
+        product_name: str,
+        amount: float = 1.0,
+        is_grams: bool = False,
+    ) -> None:
+        """Добавляет запись о приеме пищи"""
+        product = self._get_product(product_name)
+        if product is None:
+            return
+
+        nutrients = self._nutrients(
+            product, self._calculate_multiplier(amount, is_grams)
+        )
+        self._conn.execute(
+            "INSERT INTO entries (date, meal_type, product, amount, is_grams, "
+            "calories, protein, fat, carbs, time) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                date,
+                meal_type,
+                product_name,
+                amount,
+                is_grams,
+                nutrients["calories"],
+                nutrients["protein"],
+                nutrients["fat"],
+                nutrients["carbs"],
+                time.strftime("%H:%M"),
+            ),
+        )
+
+    def _entry_id(self, date: str, meal_type: str, index: int) -> Optional[int]:
+        """Находит id записи по её позиции в приеме пищи"""
+        if index < 0:
+            return None
+
+        row = self._conn.execute(
+            "SELECT id FROM entries WHERE date = ? AND meal_type = ? "
+            "ORDER BY id LIMIT 1 OFFSET ?",
+            (date, meal_type, index),
+        ).fetchone()
+        return row["id"] if row else None
+
+    def update_meal_entry(
+        self,
+        date: str,
+        meal_type: str,
+        index: int,
+        product_name: str,
+        amount: float,
+        is_grams: bool,
+    ) -> None:
+        """Обновляет запись о приеме пищи"""
+        entry_id = self._entry_id(date, meal_type, index)
+        product = self._get_product(product_name)
+        if entry_id is None or product is None:
+            return
+
+        nutrients = self._nutrients(
+            product, self._calculate_multiplier(amount, is_grams)
+        )
+        self._conn.execute(
+            "UPDATE entries SET product = ?, amount = ?, is_grams = ?, "
+            "calories = ?, protein = ?, fat = ?, carbs = ? WHERE id = ?",
+            (
+                product_name,
+                amount,
+                is_grams,
+                nutrients["calories"],
+                nutrients["protein"],
+                nutrients["fat"],
+                nutrients["carbs"],
+                entry_id,
+            ),
+        )
+
+    def remove_meal_entry(self, date: str, meal_type: str, index: int) -> None:
+        """Удаляет запись о приеме пищи"""
+        entry_id = self._entry_id(date, meal_type, index)
+        if entry_id is not None:
+            self._conn.execute("DELETE FROM entries WHERE id = ?", (entry_id,))
+
+    def _entry_from_row(self, row: sqlite3.Row) -> dict:
+        return {
+            "product": row["product"],
+            "amount": row["amount"],
+            "is_grams": bool(row["is_grams"]),
+            "calories": row["calories"],
+            "protein": row["protein"],
+            "fat": row["fat"],
+            "carbs": row["carbs"],
+            "time": row["time"],
+        }
+
+    def get_day_data(self, date: str) -> Dict[str, List[dict]]:
+        """Возвращает все записи за день"""
+        day_data: Dict[str, List[dict]] = {meal: [] for meal in MEAL_TYPES}
+        rows = self._conn.execute(
+            "SELECT * FROM entries WHERE date = ? ORDER BY id", (date,)
+        )
+        for row in rows:
+            day_data.setdefault(row["meal_type"], []).append(self._entry_from_row(row))
+        return day_data
+
+    def _totals(self, where: str, params: tuple) -> sqlite3.Row:
+        return self._conn.execute(
+            "SELECT COALESCE(SUM(calories), 0) AS calories, SUM(protein) AS protein, "
+            f"SUM(fat) AS fat, SUM(carbs) AS carbs FROM entries WHERE {where}",
+            params,
+        ).fetchone()
+
+    def get_day_total_calories(self, date: str) -> int:
+        """Подсчитывает общее количество калорий за день"""
+        return self._totals("date = ?", (date,))["calories"]
+
+    def get_day_total_macros(self, date: str) -> Dict[str, Optional[int]]:
+        """Подсчитывает общее количество БЖУ за день"""
+        row = self._totals("date = ?", (date,))
+        return {macro: row[macro] for macro in MACROS}
+
+    def get_meal_total_calories(self, date: str, meal_type: str) -> int:
+        """Подсчитывает калории для конкретного приема пищи"""
+        return self._totals("date = ? AND meal_type = ?", (date, meal_type))[
+            "calories"
+        ]
+
+    def get_meal_total_macros(
+        self, date: str, meal_type: str
+    ) -> Dict[str, Optional[int]]:
+        """Подсчитывает БЖУ для конкретного приема пищи"""
+        row = self._totals("date = ? AND meal_type = ?", (date, meal_type))
+        return {macro: row[macro] for macro in MACROS}
+
+    def get_range_totals(self, start: str, end: str) -> Dict[str, Optional[int]]:
+        """Суммирует калории и БЖУ за период дат включительно (YYYY-MM-DD)"""
+        row = self._totals("date BETWEEN ? AND ?", (start, end))
+        return {"calories": row["calories"], **{macro: row[macro] for macro in MACROS}}
+
+    def load_async(self, on_loaded: Callable[[], None]) -> None:
+        """
+        Интерфейс CalorieStorage: данные читаются запросами по требованию,
+        а соединение создано с check_same_thread, поэтому загружать в
+        фоне нечего и on_loaded вызывается сразу.
+        """
+        on_loaded()
+
+    def save(self) -> None:
+        """Фиксирует накопленные изменения"""
+        try:
+            self._conn.commit()
+        except sqlite3.Error as e:
+            print(f"Ошибка сохранения калорий: {e}")
+
+    def close(self) -> None:
+        self.save()
+        self._conn.close()
+
+    def _migrate_from_json(self, legacy_path: str) -> None:
+        """
+        Переносит данные из JSON-хранилища в пустую базу. Если JSON менялся
+        после прошлого переноса, данные базы заменяются данными JSON: это
+        последнее, с чем работал пользователь.
+        """
+        journal = JournalStorage(legacy_path)
+        source_time = journal.modified_time()
+        if source_time is None:
+            return
+
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'legacy_mtime'"
+        ).fetchone()
+        has_data = self._conn.execute("SELECT 1 FROM products LIMIT 1").fetchone()
+        if row is None and has_data:
+            # База перенесена до учёта времени - считаем её актуальной
+            self._set_legacy_mtime(source_time)
+            self._conn.commit()
+            return
+        if row is not None and source_time <= float(row["value"]):
+            return
+
+        try:
+            data = journal.load() or {}
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"Ошибка переноса калорий в SQLite: {e}")
+            return
+
+        if has_data:
+            print(f"{legacy_path} изменён после переноса, данные SQLite заменены")
+            self._conn.execute("DELETE FROM entries")
+            self._conn.execute("DELETE FROM products")
+
+        for name, product in data.get("products", {}).items():
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO products VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (name, *(product.get(field) for field in PRODUCT_FIELDS)),
+                )
+            except (sqlite3.Error, AttributeError) as e:
+                print(f"Пропущен продукт {name!r} при переносе в SQLite: {e}")
+
+        for date, meals in data.get("entries", {}).items():
+            for meal_type, entries in meals.items():
+                for entry in entries:
+                    self._insert_legacy_entry(date, meal_type, entry)
+
+        self._set_legacy_mtime(journal.modified_time() or source_time)
+        self._conn.commit()
+
+    def _set_legacy_mtime(self, value: float) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta VALUES ('legacy_mtime', ?)", (repr(value),)
+        )
+
+    def _insert_legacy_entry(self, date: str, meal_type: str, entry: dict) -> None:
+        """Переносит запись; неполные записи пропускаются, а не срывают перенос"""
+        if not isinstance(entry, dict) or not entry.get("product"):
+            print(f"Пропущена запись без продукта при переносе в SQLite: {entry}")
+            return
+
+        try:
+            self._conn.execute(
+                "INSERT INTO entries (date, meal_type, product, amount, is_grams, "
+                "calories, protein, fat, carbs, time) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    date,
+                    meal_type,
+                    entry["product"],
+                    entry.get("amount", 1.0),
+                    entry.get("is_grams", False),
+                    entry.get("calories", 0),
+                    entry.get("protein"),
+                    entry.get("fat"),
+                    entry.get("carbs"),
+                    entry.get("time"),
+                ),
+            )
+        except sqlite3.Error as e:
+            print(f"Пропущена запись {entry} при переносе в SQLite: {e}")
@@ -4,12 +4,24 @@
 Ответственность:
 - Управление базой продуктов (CRUD)
 - Управление записями приемов пищи
-- Персистентность в JSON
+- Персистентность в журнальном JSON-хранилище
 - Автоматический пересчет при изменении продуктов
+- Обратный индекс продукт -> записи для быстрых rename/delete
+- Кэш итогов по приемам пищи с инкрементальным обновлением
+- Поисковый индекс по названиям продуктов
+- Чтение и запись журнала в IOExecutor, если он передан
 """
 
-import json
-from typing import Dict, List, Optional
+import copy
+from concurrent.futures import Future
+from datetime import date as Date, timedelta
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from tabs.calorie_aggregates import AggregateCache, MealTotals
+from tabs.calorie_product_index import ProductEntryIndex
+from tabs.calorie_search_index import SEARCH_LIMIT, ProductSearchIndex
+from utils.io_executor import IOExecutor, log_errors
+from utils.journal_storage import JournalStorage
 
 
 class CalorieStorage:
@@ -19,13 +31,38 @@ class CalorieStorage:
     Структура данных:
     - products_db: база продуктов с калориями, БЖУ и размером порции
     - daily_entries: записи по дням с разделением на приемы пищи
+
+    С исполнителем данные читаются через load_async(), а save() пишет
+    журнал в фоне; до окончания загрузки изменения не сохраняются, а
+    после загрузки сливаются с прочитанными данными.
     """
 
-    def __init__(self):
+    def __init__(self, executor: Optional[IOExecutor] = None):
         self._products_db: Dict[str, dict] = {}
         self._daily_entries: Dict[str, Dict[str, List[dict]]] = {}
         self._modified: bool = False
-        self._load()
+        self._dirty_products: Set[str] = set()
+        self._dirty_dates: Set[str] = set()
+        self._journal = JournalStorage("calories.json")
+        self._product_index = ProductEntryIndex()
+        self._aggregates = AggregateCache()
+        self._search_index = ProductSearchIndex()
+        self._executor = executor
+        self._loaded = False
+        if executor is None:
+            self._load()
+
+    def load_async(self, on_loaded: Callable[[], None]) -> None:
+        """Читает данные в IOExecutor; on_loaded вызывается в потоке Tk"""
+        self._executor.submit(
+            self._journal.path,
+            self._journal.load,
+            callback=lambda future: self._on_loaded(future, on_loaded),
+        )
+
+    def _on_loaded(self, future: Future, on_loaded: Callable[[], None]) -> None:
+        self._load(future)
+        on_loaded()
 
     def add_product_to_db(
         self,
@@ -49,7 +86,8 @@ class CalorieStorage:
             "serving_size": serving_size,
             "calories_per_serving": calories_per_serving,
         }
-        self._modified = True
+        self._search_index.add(name)
+        self._mark_product(name)
 
     def update_product_in_db(
         self,
@@ -65,6 +103,7 @@ class CalorieStorage:
         """Обновляет продукт и пересчитывает все записи"""
         if old_name != name and old_name in self._products_db:
             del self._products_db[old_name]
+            self._search_index.remove(old_name)
 
         if calories_per_serving and serving_size and not calories:
             calories = int((calories_per_serving / serving_size) * 100)
@@ -77,7 +116,9 @@ class CalorieStorage:
             "serving_size": serving_size,
             "calories_per_serving": calories_per_serving,
         }
-        self._modified = True
+        self._search_index.add(name)
+        self._mark_product(old_name)
+        self._mark_product(name)
         self._recalculate_entries_for_product(old_name, name)
 
     def remove_product_from_db(self, name: str) -> None:
@@ -86,20 +127,34 @@ class CalorieStorage:
             return
 
         del self._products_db[name]
+        self._search_index.remove(name)
         self._remove_product_from_all_meals(name)
+        self._mark_product(name)
+
+    def _mark_product(self, name: str) -> None:
+        """Отмечает продукт для записи в журнал"""
+        self._dirty_products.add(name)
         self._modified = True
 
-    def _remove_product_from_all_meals(self, product_name: str) -> None:
-        """Удаляет все записи с продуктом"""
-        for date in self._daily_entries:
-            for meal_type in self._daily_entries[date]:
-                self._daily_entries[date][meal_type] = [
-                    entry
-                    for entry in self._daily_entries[date][meal_type]
-                    if entry.get("product") != product_name
-                ]
+    def _mark_date(self, date: str) -> None:
+        """Отмечает день для записи в журнал"""
+        self._dirty_dates.add(date)
         self._modified = True
 
+    def _remove_product_from_all_meals(self, product_name: str) -> None:
+        """Удаляет все записи с продуктом, затрагивая только его приемы пищи"""
+        locations = self._product_index.get(product_name)
+        meals = {(date, meal_type) for date, meal_type, _ in locations}
+
+        for date, meal_type in meals:
+            entries = self._daily_entries[date][meal_type]
+            self._product_index.unindex_meal(date, meal_type, entries)
+            kept = [entry for entry in entries if entry.get("product") != product_name]
+            self._daily_entries[date][meal_type] = kept
+            self._product_index.index_meal(date, meal_type, kept)
+            self._aggregates.invalidate(date, meal_type)
+            self._mark_date(date)
+
     def _recalculate_entries_for_product(
         self, old_name: str, new_name: str
     ) -> None:
@@ -108,20 +163,20 @@ class CalorieStorage:
             return
 
         product = self._products_db[new_name]
-
-        for date in self._daily_entries:
-            for meal_type in self._daily_entries[date]:
-                for entry in self._daily_entries[date][meal_type]:
-                    if entry.get("product") not in [old_name, new_name]:
-                        continue
-
-                    entry["product"] = new_name
-                    multiplier = self._calculate_multiplier(
-                        entry.get("amount", 1.0), entry.get("is_grams", False)
-                    )
-                    self._update_entry_nutrients(entry, product, multiplier)
-
-        self._modified = True
+        locations = self._product_index.pop(old_name)
+        locations |= self._product_index.pop(new_name)
+
+        for date, meal_type, idx in locations:
+            entry = self._daily_entries[date][meal_type][idx]
+            self._aggregates.entry_removed(date, meal_type, entry)
+            entry["product"] = new_name
+            multiplier = self._calculate_multiplier(
+                entry.get("amount", 1.0), entry.get("is_grams", False)
+            )
+            self._update_entry_nutrients(entry, product, multiplier)
+            self._aggregates.entry_added(date, meal_type, entry)
+            self._product_index.add(new_name, (date, meal_type, idx))
+            self._mark_date(date)
 
     def _calculate_multiplier(self, amount: float, is_grams: bool) -> float:
         """Вычисляет множитель для расчёта калорий и БЖУ"""
@@ -144,6 +199,18 @@ class CalorieStorage:
         """Возвращает всю базу продуктов"""
         return self._products_db.copy()
 
+    def get_product(self, name: str) -> Optional[dict]:
+        """Возвращает продукт по названию"""
+        return self._products_db.get(name)
+
+    def search_products(self, query: str, limit: int = SEARCH_LIMIT) -> List[str]:
+        """Ищет продукты по названию, лучшие совпадения первыми"""
+        return self._search_index.search(query, limit)
+
+    def get_entries_for_product(self, name: str) -> List[Tuple[str, str, int]]:
+        """Возвращает позиции (date, meal_type, idx) всех записей с продуктом"""
+        return sorted(self._product_index.get(name))
+
     def add_meal_entry(
         self,
         date: str,
@@ -170,8 +237,11 @@ class CalorieStorage:
         entry = self._create_meal_entry(
             product_name, amount, is_grams, product, multiplier
         )
-        self._daily_entries[date][meal_type].append(entry)
-        self._modified = True
+        entries = self._daily_entries[date][meal_type]
+        entries.append(entry)
+        self._product_index.add(product_name, (date, meal_type, len(entries) - 1))
+        self._aggregates.entry_added(date, meal_type, entry)
+        self._mark_date(date)
 
     def _create_meal_entry(
         self,
@@ -217,11 +287,15 @@ class CalorieStorage:
         multiplier = self._calculate_multiplier(amount, is_grams)
 
         entry = self._daily_entries[date][meal_type][index]
+        self._product_index.discard(entry.get("product"), (date, meal_type, index))
+        self._product_index.add(product_name, (date, meal_type, index))
+        self._aggregates.entry_removed(date, meal_type, entry)
         entry["product"] = product_name
         entry["amount"] = amount
         entry["is_grams"] = is_grams
         self._update_entry_nutrients(entry, product, multiplier)
-        self._modified = True
+        self._aggregates.entry_added(date, meal_type, entry)
+        self._mark_date(date)
 
     def _is_valid_meal_entry(self, date: str, meal_type: str, index: int) -> bool:
         """Проверяет валидность индекса записи"""
@@ -236,8 +310,14 @@ class CalorieStorage:
         if not self._is_valid_meal_entry(date, meal_type, index):
             return
 
-        del self._daily_entries[date][meal_type][index]
-        self._modified = True
+        entries = self._daily_entries[date][meal_type]
+        self._product_index.discard(
+            entries[index].get("product"), (date, meal_type, index)
+        )
+        self._aggregates.entry_removed(date, meal_type, entries[index])
+        del entries[index]
+        self._product_index.shift_after(date, meal_type, entries, index)
+        self._mark_date(date)
 
     def get_day_data(self, date: str) -> Dict[str, List[dict]]:
         """Возвращает все записи за день"""
@@ -245,74 +325,149 @@ class CalorieStorage:
             date, {"breakfast": [], "lunch": [], "dinner": [], "snack": []}
         )
 
+    def _meal_totals(self, date: str, meal_type: str) -> MealTotals:
+        """Возвращает итоги приема пищи из кэша"""
+        entries = self.get_day_data(date).get(meal_type, [])
+        return self._aggregates.get(date, meal_type, entries)
+
+    def _day_totals(self, date: str) -> MealTotals:
+        """Складывает кэшированные итоги приемов пищи за день"""
+        return self._aggregates.combine(
+            self._meal_totals(date, meal_type) for meal_type in self.get_day_data(date)
+        )
+
     def get_day_total_calories(self, date: str) -> int:
         """Подсчитывает общее количество калорий за день"""
-        day_data = self.get_day_data(date)
-        return sum(
-            sum(entry["calories"] for entry in meal_entries)
-            for meal_entries in day_data.values()
-        )
+        return self._day_totals(date).calories
 
     def get_day_total_macros(self, date: str) -> Dict[str, Optional[int]]:
         """Подсчитывает общее количество БЖУ за день"""
-        day_data = self.get_day_data(date)
-        return self._calculate_macros(
-            [entry for entries in day_data.values() for entry in entries]
-        )
+        return self._day_totals(date).macros()
 
     def get_meal_total_calories(self, date: str, meal_type: str) -> int:
         """Подсчитывает калории для конкретного приема пищи"""
-        day_data = self.get_day_data(date)
-        return sum(entry["calories"] for entry in day_data.get(meal_type, []))
+        return self._meal_totals(date, meal_type).calories
 
     def get_meal_total_macros(
         self, date: str, meal_type: str
     ) -> Dict[str, Optional[int]]:
         """Подсчитывает БЖУ для конкретного приема пищи"""
-        day_data = self.get_day_data(date)
-        return self._calculate_macros(day_data.get(meal_type, []))
-
-    def _calculate_macros(self, entries: List[dict]) -> Dict[str, Optional[int]]:
-        """Вычисляет суммарные БЖУ для списка записей"""
-        totals = {"protein": 0, "fat": 0, "carbs": 0}
-        has_data = {"protein": False, "fat": False, "carbs": False}
-
-        for entry in entries:
-            for macro in ["protein", "fat", "carbs"]:
-                if entry.get(macro) is not None:
-                    totals[macro] += entry[macro]
-                    has_data[macro] = True
-
-        return {
-            macro: totals[macro] if has_data[macro] else None
-            for macro in ["protein", "fat", "carbs"]
-        }
+        return self._meal_totals(date, meal_type).macros()
+
+    def get_range_totals(self, start: str, end: str) -> Dict[str, Optional[int]]:
+        """Суммирует калории и БЖУ за период дат включительно (YYYY-MM-DD)"""
+        current = Date.fromisoformat(start)
+        last = Date.fromisoformat(end)
+        days = []
+        while current <= last:
+            day = current.isoformat()
+            if day in self._daily_entries:
+                days.append(self._day_totals(day))
+            current += timedelta(days=1)
+
+        totals = self._aggregates.combine(days)
+        return {"calories": totals.calories, **totals.macros()}
 
     def save(self) -> None:
-        """Сохраняет данные в JSON файл"""
-        if not self._modified:
+        """Дописывает изменённые продукты и дни в журнал"""
+        if not self._modified or not self._loaded:
             return
 
-        data = {"products": self._products_db, "entries": self._daily_entries}
+        sets = []
+        deletes = []
+        for name in self._dirty_products:
+            if name in self._products_db:
+                sets.append((["products", name], self._products_db[name]))
+            else:
+                deletes.append(["products", name])
+        for date in self._dirty_dates:
+            if date in self._daily_entries:
+                sets.append((["entries", date], self._daily_entries[date]))
+            else:
+                deletes.append(["entries", date])
+
+        if self._executor is not None:
+            self._executor.submit(
+                self._journal.path,
+                self._journal.commit,
+                copy.deepcopy(sets),
+                deletes,
+                callback=log_errors("Ошибка сохранения калорий"),
+            )
+            self._mark_saved()
+            return
 
         try:
-            with open("calories.json", "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            self._modified = False
+            self._journal.commit(sets, deletes)
+            self._mark_saved()
         except Exception as e:
             print(f"Ошибка сохранения калорий: {e}")
 
-    def _load(self) -> None:
-        """Загружает данные из JSON файла"""
+    def _mark_saved(self) -> None:
+        self._dirty_products.clear()
+        self._dirty_dates.clear()
+        self._modified = False
+
+    def _load(self, future: Optional[Future] = None) -> None:
+        """
+        Загружает снимок и журнал, старый calories.json читается как снимок.
+
+        future - результат чтения из IOExecutor.
+        """
         try:
-            with open("calories.json", "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self._products_db = data.get("products", {})
-                self._daily_entries = data.get("entries", {})
+            data = (future.result() if future else self._journal.load()) or {}
         except FileNotFoundError:
-            self._products_db = {}
-            self._daily_entries = {}
+            data = {}
         except Exception as e:
             print(f"Ошибка загрузки калорий: {e}")
-            self._products_db = {}
-            self._daily_entries = {}
+            data = {}
+
+        products = data.get("products", {})
+        entries = data.get("entries", {})
+        pending = self._modified
+        if pending:
+            self._merge_pending(products, entries)
+
+        self._products_db = products
+        self._daily_entries = entries
+        self._product_index.rebuild(self._daily_entries)
+        self._search_index.rebuild(self._products_db)
+        self._aggregates = AggregateCache()
+        if not pending:
+            self._mark_saved()
+        self._loaded = True
+
+    def _merge_pending(
+        self, products: Dict[str, dict], entries: Dict[str, Dict[str, List[dict]]]
+    ) -> None:
+        """
+        Переносит изменения, сделанные до окончания загрузки, в прочитанные
+        данные: продукты заменяются, записи дописываются к записям дня.
+        Грязные отметки остаются, чтобы save() записал результат.
+        """
+        for name in self._dirty_products:
+            if name in self._products_db:
+                products[name] = self._products_db[name]
+            else:
+                products.pop(name, None)
+
+        for date in self._dirty_dates:
+            day = entries.setdefault(date, {})
+            for meal_type, meal_entries in self._daily_entries.get(date, {}).items():
+                day.setdefault(meal_type, []).extend(meal_entries)
+
+
+def create_calorie_storage(
+    backend: str = "json", executor: Optional[IOExecutor] = None
+):
+    """
+    Создает хранилище калорий выбранного в настройках типа.
+
+    Исполнитель используется только JSON-хранилищем: соединение SQLite
+    привязано к потоку, в котором создано.
+    """
+    if backend == "sqlite":
+        from tabs.calorie_sqlite_storage import SqliteCalorieStorage
+
+        return SqliteCalorieStorage()
+    return CalorieStorage(executor)
@@ -4,12 +4,14 @@ from datetime import datetime, timedelta
 from tkinter import messagebox, ttk
 from typing import List
 
-from tabs.calorie_storage import CalorieStorage
+from components.virtual_treeview import VirtualRow, VirtualTreeview
+from tabs.calorie_storage import create_calorie_storage
 from tabs.calorie_dialogs import ProductDatabaseDialog, CSVImportDialog
 from tabs.calorie_meal_dialogs_impl import (
     show_add_product_dialog_impl,
     create_product_from_dialog_impl,
 )
+from utils.io_executor import get_io_executor
 
 
 class CalorieTrackerTab(ttk.Frame):
@@ -19,10 +21,19 @@ class CalorieTrackerTab(ttk.Frame):
 
     def __init__(self, parent, settings_tab=None):
         super().__init__(parent)
-        self.storage = CalorieStorage()
         self.settings_tab = settings_tab
+        self.storage = create_calorie_storage(
+            self.get_calorie_backend(), get_io_executor(self)
+        )
         self.current_date = time.strftime("%Y-%m-%d")
         self.setup_ui()
+        self.storage.load_async(self._update_all_displays)
+
+    def get_calorie_backend(self) -> str:
+        """Получает тип хранилища калорий из настроек"""
+        if self.settings_tab and hasattr(self.settings_tab, "get_calorie_backend"):
+            return self.settings_tab.get_calorie_backend()
+        return "json"
 
     def get_target_calories(self) -> int:
         """Получает целевое количество калорий из настроек"""
@@ -183,8 +194,8 @@ class CalorieTrackerTab(ttk.Frame):
         tree.column("calories", width=100, anchor="center")
         tree.column("actions", width=60, anchor="center")
 
-        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=tree.yview)
-        tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical")
+        view = VirtualTreeview(tree, scrollbar)
 
         tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -196,6 +207,7 @@ class CalorieTrackerTab(ttk.Frame):
 
         self.meal_frames[meal_type] = {
             "tree": tree,
+            "view": view,
             "calories_label": calories_label,
             "macros_label": macros_label,
         }
@@ -280,10 +292,8 @@ class CalorieTrackerTab(ttk.Frame):
 
         self.products_tree.tag_configure("selected", background="#0078D7", foreground="white")
 
-        scrollbar = ttk.Scrollbar(
-            tree_frame, orient="vertical", command=self.products_tree.yview
-        )
-        self.products_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical")
+        self.products_view = VirtualTreeview(self.products_tree, scrollbar)
 
         self.products_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -308,8 +318,7 @@ class CalorieTrackerTab(ttk.Frame):
             messagebox.showinfo("Ошибка", "Выберите продукт для редактирования")
             return
 
-        item = selection[0]
-        product_name = self.products_tree.item(item)["values"][0]
+        product_name = selection[0]
         self._show_add_product_to_db_dialog(edit_mode=True, product_name=product_name)
 
     def _remove_selected_product(self):
@@ -319,8 +328,7 @@ class CalorieTrackerTab(ttk.Frame):
             messagebox.showinfo("Ошибка", "Выберите продукт для удаления")
             return
 
-        item = selection[0]
-        product_name = self.products_tree.item(item)["values"][0]
+        product_name = selection[0]
 
         if messagebox.askyesno(
             "Подтверждение",
@@ -340,7 +348,7 @@ class CalorieTrackerTab(ttk.Frame):
         col = tree.identify_column(event.x)
 
         if col == "#4" and item:
-            index = tree.index(item)
+            index = self.meal_frames[meal_type]["view"].index_of(item)
             if messagebox.askyesno("Подтверждение", "Удалить эту запись?"):
                 self.storage.remove_meal_entry(self.current_date, meal_type, index)
                 self.storage.save()
@@ -357,7 +365,7 @@ class CalorieTrackerTab(ttk.Frame):
         if not item:
             return
 
-        index = tree.index(item)
+        index = self.meal_frames[meal_type]["view"].index_of(item)
         self._show_add_product_dialog(meal_type, edit_mode=True, edit_index=index)
 
     def _prev_day(self):
@@ -430,17 +438,15 @@ class CalorieTrackerTab(ttk.Frame):
         if meal_type not in self.meal_frames:
             return
 
-        tree = self.meal_frames[meal_type]["tree"]
+        view = self.meal_frames[meal_type]["view"]
         calories_label = self.meal_frames[meal_type]["calories_label"]
         macros_label = self.meal_frames[meal_type]["macros_label"]
 
-        for item in tree.get_children():
-            tree.delete(item)
-
         day_data = self.storage.get_day_data(self.current_date)
         entries = day_data.get(meal_type, [])
 
-        for entry in entries:
+        rows = []
+        for i, entry in enumerate(entries):
             is_grams = entry.get("is_grams", False)
             amount = entry.get("amount", 1.0)
 
@@ -449,16 +455,9 @@ class CalorieTrackerTab(ttk.Frame):
             else:
                 amount_text = f"{amount}x"
 
-            tree.insert(
-                "",
-                "end",
-                values=(
-                    entry["product"],
-                    amount_text,
-                    f"{entry['calories']} ккал",
-                    "✕",
-                ),
-            )
+            values = (entry["product"], amount_text, f"{entry['calories']} ккал", "✕")
+            rows.append(VirtualRow(str(i), values))
+        view.set_rows(rows)
 
         total_calories = self.storage.get_meal_total_calories(
             self.current_date, meal_type
@@ -483,24 +482,17 @@ class CalorieTrackerTab(ttk.Frame):
 
     def _update_products_display(self, filter_text: str = ""):
         """Обновляет отображение базы продуктов с учетом фильтра"""
-        for item in self.products_tree.get_children():
-            self.products_tree.delete(item)
-
-        products = self.storage.get_all_products()
-        filter_lower = filter_text.lower()
-
-        for name, data in sorted(products.items()):
-            if filter_lower and filter_lower not in name.lower():
-                continue
-
+        rows = []
+        for name in self.storage.search_products(filter_text):
+            data = self.storage.get_product(name)
             protein = data.get("protein") or "-"
             fat = data.get("fat") or "-"
             carbs = data.get("carbs") or "-"
             serving = f"{data.get('serving_size')}г" if data.get("serving_size") else "-"
 
-            self.products_tree.insert(
-                "", "end", values=(name, data["calories"], protein, fat, carbs, serving)
-            )
+            values = (name, data["calories"], protein, fat, carbs, serving)
+            rows.append(VirtualRow(name, values))
+        self.products_view.set_rows(rows)
 
     def _filter_products(self):
         """Фильтрует продукты по поисковому запросу"""
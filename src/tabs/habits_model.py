@@ -0,0 +1,209 @@
+"""
+Модель привычки.
+
+Ответственность:
+- Компактное хранение привычки в __slots__ вместо свободного словаря
+- Время окна - минуты от полуночи, напоминания и выполнение - timestamp
+- Разбор и проверка данных один раз при загрузке (from_json),
+  обратное преобразование при сохранении (to_json); испорченные
+  отметки времени и окно не теряют саму привычку
+- Доступ в стиле словаря (habit["name"], habit.get) для кода вкладки
+"""
+
+from datetime import datetime
+from typing import Any, Optional, Union
+
+MINUTES_PER_DAY = 24 * 60
+
+Timestamp = Union[None, float, int, str, datetime]
+
+
+def parse_minutes(text: str) -> int:
+    """Переводит "ЧЧ:ММ" в минуты от полуночи; допускается "24:00" """
+    hours, minutes = text.split(":")
+    total = int(hours) * 60 + int(minutes)
+    if not 0 <= total <= MINUTES_PER_DAY:
+        raise ValueError(f"Некорректное время: {text}")
+    return total
+
+
+def format_minutes(minutes: int) -> str:
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def to_timestamp(value: Timestamp) -> Optional[float]:
+    """Приводит datetime, ISO-строку или число к timestamp"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).timestamp()
+    return float(value)
+
+
+def lenient_timestamp(value: Timestamp) -> Optional[float]:
+    """Как to_timestamp, но испорченное значение становится None"""
+    try:
+        return to_timestamp(value)
+    except (ValueError, TypeError, OverflowError, OSError):
+        return None
+
+
+def lenient_minutes(text: Any, default: int) -> int:
+    try:
+        return parse_minutes(text)
+    except (ValueError, TypeError, AttributeError):
+        print(f"Некорректное время привычки: {text!r}")
+        return default
+
+
+def _to_iso(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+class Habit:
+    """Привычка с предразобранным окном времени и напоминаниями"""
+
+    __slots__ = (
+        "name",
+        "interval",
+        "start",
+        "end",
+        "enabled",
+        "completed",
+        "completed_repeats",
+        "repeats",
+        "notifications",
+        "comment",
+        "last_reminder",
+        "completed_time",
+    )
+
+    _CONVERTERS = {
+        "last_reminder": to_timestamp,
+        "completed_time": to_timestamp,
+        "interval": int,
+    }
+    _KEYS = frozenset(__slots__) | {"start_time", "end_time"}
+
+    def __init__(
+        self,
+        name: str,
+        interval: int,
+        start: int,
+        end: int,
+        enabled: bool = True,
+        completed: bool = False,
+        completed_repeats: int = 0,
+        repeats: int = 1,
+        notifications: bool = True,
+        comment: str = "",
+        last_reminder: Optional[float] = None,
+        completed_time: Optional[float] = None,
+    ):
+        self.name = name
+        self.interval = interval
+        self.start = start
+        self.end = end
+        self.enabled = enabled
+        self.completed = completed
+        self.completed_repeats = completed_repeats
+        self.repeats = repeats
+        self.notifications = notifications
+        self.comment = comment
+        self.last_reminder = last_reminder
+        self.completed_time = completed_time
+
+    @property
+    def start_time(self) -> str:
+        return format_minutes(self.start)
+
+    @start_time.setter
+    def start_time(self, text: str) -> None:
+        self.start = parse_minutes(text)
+
+    @property
+    def end_time(self) -> str:
+        return format_minutes(self.end)
+
+    @end_time.setter
+    def end_time(self, text: str) -> None:
+        self.end = parse_minutes(text)
+
+    @classmethod
+    def from_json(cls, data: dict) -> "Habit":
+        """
+        Создает привычку из словаря habits.json; KeyError/ValueError, только
+        если нет имени или интервала. Испорченная отметка времени становится
+        None, испорченное окно - целыми сутками.
+        """
+        completed_time = lenient_timestamp(data.get("completed_time"))
+        completed = data.get("completed", False)
+        if completed and completed_time is None and data.get("completed_time"):
+            # Без даты выполнения нельзя понять, сегодняшняя ли это отметка
+            completed = False
+
+        return cls(
+            name=data["name"],
+            interval=int(data["interval"]),
+            start=lenient_minutes(data.get("start_time"), 0),
+            end=lenient_minutes(data.get("end_time"), MINUTES_PER_DAY),
+            enabled=data.get("enabled", True),
+            completed=completed,
+            completed_repeats=data.get("completed_repeats", 0),
+            repeats=data.get("repeats", 1),
+            notifications=data.get("notifications", True),
+            comment=data.get("comment", ""),
+            last_reminder=lenient_timestamp(data.get("last_reminder")),
+            completed_time=completed_time,
+        )
+
+    def to_json(self) -> dict:
+        data = {
+            "name": self.name,
+            "interval": self.interval,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "enabled": self.enabled,
+            "completed": self.completed,
+            "completed_repeats": self.completed_repeats,
+            "repeats": self.repeats,
+            "notifications": self.notifications,
+            "comment": self.comment,
+            "last_reminder": _to_iso(self.last_reminder),
+        }
+        if self.completed_time is not None:
+            data["completed_time"] = _to_iso(self.completed_time)
+        return data
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        converter = self._CONVERTERS.get(key)
+        setattr(self, key, converter(value) if converter else value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._KEYS
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self._KEYS:
+            return default
+        return getattr(self, key)
+
+    def __repr__(self) -> str:
+        return f"Habit({self.name!r}, {self.start_time}-{self.end_time})"
+
+
+def habit_to_json(habit: Union[Habit, dict]) -> dict:
+    """Сериализует привычку; словари, добавленные напрямую, проходят через модель"""
+    if isinstance(habit, dict):
+        habit = Habit.from_json(habit)
+    return habit.to_json()
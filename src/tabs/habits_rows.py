@@ -0,0 +1,205 @@
+"""
+Строки привычек для HabitsTab.
+
+Ответственность:
+- Строка привычки создает виджеты один раз и обновляет их по состоянию
+  привычки (отметки, колокольчик, название, подпись)
+- Список группы сверяет строки по ключу привычки: удаляет лишние,
+  создает новые, перестраивает только строку с изменённой структурой
+  и переупаковывает строки только при смене порядка
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Dict, List, Optional
+
+MAX_VISIBLE_REPEATS = 5
+
+
+def habit_info_text(habit) -> str:
+    """Подпись под названием: комментарий, интервал и окно напоминаний"""
+    info_text = ""
+
+    if habit.get("comment"):
+        info_text += f"\"{habit['comment']}\" "
+
+    if habit.get("notifications", True):
+        interval_text = f"Каждые {habit.get('interval', '')} мин"
+        time_text = f"{habit.get('start_time', '')} - {habit.get('end_time', '')}"
+        if info_text:
+            info_text += f"• {interval_text} • {time_text}"
+        else:
+            info_text = f"{interval_text} • {time_text}"
+
+    return info_text
+
+
+def habit_state(habit) -> tuple:
+    return (
+        habit["name"],
+        habit.get("enabled", True),
+        habit.get("completed_repeats", 0),
+        habit.get("completed", False),
+        habit.get("notifications", True),
+        habit_info_text(habit),
+    )
+
+
+class HabitRow:
+    """Виджеты одной привычки; update() меняет только то, что изменилось"""
+
+    def __init__(self, tab, parent, time_name: str, habit, compact: bool):
+        self.tab = tab
+        self.time_name = time_name
+        self.habit = habit
+        self.compact = compact
+        self.repeats = habit.get("repeats", 1)
+        self.state: Optional[tuple] = None
+        self.checkbox_vars: List[tk.BooleanVar] = []
+
+        self.frame = ttk.Frame(parent)
+        self.enabled_var = tk.BooleanVar(value=habit.get("enabled", True))
+        self.notifications_var = tk.BooleanVar(value=habit.get("notifications", True))
+
+        if not compact:
+            ttk.Checkbutton(
+                self.frame,
+                variable=self.enabled_var,
+                command=lambda: tab.toggle_habit(habit, self.enabled_var.get()),
+                takefocus=0,
+            ).pack(side=tk.LEFT, padx=5)
+
+        self._create_checkboxes()
+
+        self.notify_btn = ttk.Button(
+            self.frame,
+            width=3,
+            command=lambda: tab.toggle_notifications(habit, self.notifications_var),
+            takefocus=0,
+        )
+        self.notify_btn.pack(side=tk.LEFT, padx=3)
+
+        info_frame = ttk.Frame(self.frame)
+        info_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+
+        self.name_label = ttk.Label(info_frame, font=("Segoe UI", 11))
+        self.name_label.pack(anchor=tk.W)
+        self.info_label = ttk.Label(info_frame, font=("Segoe UI", 9))
+
+        self._create_buttons()
+        self.update()
+
+    def _create_checkboxes(self) -> None:
+        checkboxes_frame = ttk.Frame(self.frame)
+        checkboxes_frame.pack(side=tk.LEFT, padx=3)
+
+        for i in range(min(self.repeats, MAX_VISIBLE_REPEATS)):
+            var = tk.BooleanVar()
+            ttk.Checkbutton(
+                checkboxes_frame,
+                variable=var,
+                command=lambda index=i, v=var: self.tab.toggle_repeat(
+                    self.habit, index, v.get()
+                ),
+                style="Orange.TCheckbutton",
+                takefocus=0,
+            ).pack(side=tk.LEFT)
+            self.checkbox_vars.append(var)
+
+        if self.repeats > MAX_VISIBLE_REPEATS:
+            ttk.Label(
+                checkboxes_frame,
+                text=f"+{self.repeats - MAX_VISIBLE_REPEATS}",
+                font=("Segoe UI", 9),
+            ).pack(side=tk.LEFT, padx=(2, 0))
+
+    def _create_buttons(self) -> None:
+        buttons_frame = ttk.Frame(self.frame)
+        buttons_frame.pack(side=tk.RIGHT)
+
+        habit, tab, time_name = self.habit, self.tab, self.time_name
+        commands = []
+        if not self.compact:
+            commands = [
+                ("💬", lambda: tab.add_comment(habit)),
+                ("✏️", lambda: tab.edit_habit(habit, time_name)),
+                ("↑", lambda: tab.move_habit(time_name, habit["name"], -1)),
+                ("↓", lambda: tab.move_habit(time_name, habit["name"], 1)),
+            ]
+        commands.append(("✕", lambda: tab.remove_habit(time_name, habit)))
+
+        for text, command in commands:
+            ttk.Button(
+                buttons_frame, text=text, width=2, command=command, takefocus=0
+            ).pack(side=tk.LEFT, padx=2)
+
+    def matches_structure(self, compact: bool) -> bool:
+        """Можно ли обновить строку на месте, не пересоздавая виджеты"""
+        return self.compact == compact and self.repeats == self.habit.get("repeats", 1)
+
+    def update(self) -> None:
+        state = habit_state(self.habit)
+        if state == self.state:
+            return
+        self.state = state
+
+        name, enabled, completed_repeats, completed, notifications, info = state
+        self.enabled_var.set(enabled)
+        for i, var in enumerate(self.checkbox_vars):
+            var.set(i < completed_repeats or completed)
+
+        self.notifications_var.set(notifications)
+        self.notify_btn.configure(text="🔔" if notifications else "🔕")
+        self.name_label.configure(text=name, foreground="gray" if completed else "")
+
+        if info:
+            self.info_label.configure(text=info)
+            self.info_label.pack(anchor=tk.W)
+        else:
+            self.info_label.pack_forget()
+
+    def destroy(self) -> None:
+        self.frame.destroy()
+
+
+class HabitList:
+    """Строки привычек одной группы, сверяемые по ключу привычки"""
+
+    def __init__(self, tab, time_name: str, frame: ttk.Frame):
+        self.tab = tab
+        self.time_name = time_name
+        self.frame = frame
+        self.rows: Dict[int, HabitRow] = {}
+        self.order: List[int] = []
+
+    def update(self, habits: list) -> None:
+        compact = self.tab.compact_mode.get()
+        visible = [h for h in habits if not compact or h.get("enabled", True)]
+        keys = [id(habit) for habit in visible]
+
+        for key in set(self.rows) - set(keys):
+            self.rows.pop(key).destroy()
+
+        created = False
+        for habit in visible:
+            row = self.rows.get(id(habit))
+            if row is not None and row.matches_structure(compact):
+                row.update()
+                continue
+
+            if row is not None:
+                row.destroy()
+            self.rows[id(habit)] = HabitRow(
+                self.tab, self.frame, self.time_name, habit, compact
+            )
+            created = True
+
+        if created or keys != self.order:
+            self._repack(keys)
+
+    def _repack(self, keys: List[int]) -> None:
+        for key in keys:
+            self.rows[key].frame.pack_forget()
+        for key in keys:
+            self.rows[key].frame.pack(fill=tk.X, pady=5)
+        self.order = keys
@@ -0,0 +1,153 @@
+"""
+Данные привычек без интерфейса.
+
+Ответственность:
+- Группы времени, их настройки и привычки по группам
+- Загрузка habits.json в IOExecutor с миграцией старого формата
+  (плоский список) и сбросом выполнения за прошлые дни
+- Снимок и запись для AutosaveService
+- Уведомление подписчиков (напоминания, вкладка) об окончании загрузки,
+  чтобы напоминания работали без построения вкладки
+"""
+
+import copy
+import json
+from concurrent.futures import Future
+from datetime import date, datetime
+from typing import Callable, Dict, List, Optional
+
+from tabs.habits_model import Habit, habit_to_json
+from utils.autosave import AutosaveService
+from utils.io_executor import IOExecutor
+from utils.journal_storage import JournalStorage
+
+DEFAULT_TIMES = ["Утро", "День", "Вечер", "Ночь"]
+GENERAL_TIME = "Общие"
+
+
+class HabitsStore:
+    """Привычки в памяти с отложенным сохранением в habits.json"""
+
+    def __init__(
+        self,
+        autosave: AutosaveService,
+        executor: IOExecutor,
+        path: str = "habits.json",
+    ):
+        self.default_times = list(DEFAULT_TIMES)
+        self.custom_times: List[str] = []
+        self.all_times = self.default_times.copy()
+        self.habits: Dict[str, list] = {}
+        self.time_settings: Dict[str, dict] = {}
+        self.loaded = False
+        self.journal = JournalStorage(path)
+        self._autosave = autosave
+        self._executor = executor
+        self._listeners: List[Callable[[], None]] = []
+
+        for time_period in self.default_times:
+            self.habits[time_period] = []
+            self.time_settings[time_period] = {"quick_timer_minutes": None}
+
+        autosave.register(self.journal.path, self.snapshot, self.write)
+
+    def load(self) -> None:
+        """Читает снимок и журнал привычек в потоке ввода-вывода"""
+        self._executor.submit(
+            self.journal.path, self.journal.load, callback=self._on_loaded
+        )
+
+    def when_loaded(self, callback: Callable[[], None]) -> None:
+        """Вызывает callback после загрузки; сразу, если данные уже загружены"""
+        if self.loaded:
+            callback()
+            return
+        self._listeners.append(callback)
+
+    def save(self) -> None:
+        """Помечает привычки для отложенного сохранения в файл"""
+        self._autosave.mark_dirty(self.journal.path)
+
+    def snapshot(self) -> Optional[dict]:
+        """Копия данных о привычках для записи в фоновом потоке"""
+        if not self.loaded:
+            return None
+
+        habits_data = {
+            "times": list(self.all_times),
+            "custom_times": list(self.custom_times),
+            "time_settings": copy.deepcopy(self.time_settings),
+            "habits": {},
+        }
+
+        for time_name, habits_list in self.habits.items():
+            habits_data["habits"][time_name] = [
+                habit_to_json(habit) for habit in habits_list
+            ]
+        return habits_data
+
+    def write(self, habits_data: dict) -> None:
+        try:
+            self.journal.sync(habits_data, depth=2)
+        except Exception as e:
+            print(f"Ошибка при сохранении данных о привычках: {e}")
+
+    def _on_loaded(self, future: Future) -> None:
+        """Применяет загруженные данные и оповещает подписчиков"""
+        try:
+            self._apply(future.result())
+        except FileNotFoundError:
+            print("Файл habits.json не найден. Создаем новый список привычек.")
+        except json.JSONDecodeError:
+            print("Ошибка чтения файла habits.json. Файл поврежден.")
+        except Exception as e:
+            print(f"Непредвиденная ошибка при загрузке привычек: {e}")
+
+        self.loaded = True
+        listeners, self._listeners = self._listeners, []
+        for callback in listeners:
+            callback()
+
+    def _apply(self, data) -> None:
+        if isinstance(data, list):
+            if GENERAL_TIME not in self.all_times:
+                self.all_times.append(GENERAL_TIME)
+                self.custom_times.append(GENERAL_TIME)
+                self.habits[GENERAL_TIME] = []
+                self.time_settings[GENERAL_TIME] = {"quick_timer_minutes": None}
+
+            self._load_habit_list(GENERAL_TIME, data)
+        else:
+            self.all_times = data.get("times", self.all_times)
+            self.custom_times = data.get("custom_times", self.custom_times)
+            self.time_settings = data.get("time_settings", self.time_settings)
+
+            for time_name, habits_list in data.get("habits", {}).items():
+                self.habits.setdefault(time_name, [])
+                self._load_habit_list(time_name, habits_list)
+
+        for time_name in self.all_times:
+            self.time_settings.setdefault(time_name, {"quick_timer_minutes": None})
+            self.habits.setdefault(time_name, [])
+
+        self._reset_past_completion()
+
+    def _load_habit_list(self, time_name: str, habits_list: list) -> None:
+        """Разбирает привычки из habits.json, пропуская некорректные"""
+        for habit_data in habits_list:
+            try:
+                habit = Habit.from_json(habit_data)
+            except (KeyError, ValueError, TypeError):
+                print(f"Пропущена привычка с неполными данными: {habit_data}")
+                continue
+            self.habits[time_name].append(habit)
+
+    def _reset_past_completion(self) -> None:
+        current_date = datetime.now().date()
+        for habits_list in self.habits.values():
+            for habit in habits_list:
+                if not habit.completed or habit.completed_time is None:
+                    continue
+                if date.fromtimestamp(habit.completed_time) < current_date:
+                    habit.completed = False
+                    habit.completed_time = None
@@ -1,31 +1,49 @@
 import json
 import tkinter as tk
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from tkinter import messagebox, ttk
-from pygame import mixer
 
+from tabs.habits_model import Habit, parse_minutes
+from tabs.habits_rows import HabitList
+from tabs.habits_store import HabitsStore
 from utils.habit_reminder import HabitReminder
 
 
+def _store_attribute(name):
+    """Атрибут вкладки, который хранится в HabitsStore"""
+    return property(
+        lambda self: getattr(self.store, name),
+        lambda self, value: setattr(self.store, name, value),
+    )
+
+
 class HabitsTab(ttk.Frame):
-    def __init__(self, parent):
+    """
+    Вкладка привычек поверх HabitsStore.
+
+    Данные и напоминания живут отдельно от вкладки и работают до того,
+    как она построена; habits, all_times и прочие атрибуты данных
+    читаются и пишутся прямо в хранилище.
+    """
+
+    habits = _store_attribute("habits")
+    default_times = _store_attribute("default_times")
+    custom_times = _store_attribute("custom_times")
+    all_times = _store_attribute("all_times")
+    time_settings = _store_attribute("time_settings")
+
+    def __init__(self, parent, store: HabitsStore, reminder: HabitReminder):
         super().__init__(parent)
         self.parent = parent
-        self.habits = {}
-        self.default_times = ["Утро", "День", "Вечер", "Ночь"]
-        self.custom_times = []
-        self.all_times = self.default_times.copy()
-        self.time_settings = {}
+        self.store = store
+        self.reminder = reminder
         self.toast_notification = None
         self.stats_window = None
-
-        for time_period in self.default_times:
-            self.habits[time_period] = []
-            self.time_settings[time_period] = {"quick_timer_minutes": None}
+        self.habit_lists = {}
+        self.times_layout = None
 
         self.setup_ui()
-        self.load_habits()
-        self.reminder = HabitReminder(self)
+        self.store.when_loaded(self.update_times_display)
 
     def setup_ui(self):
         main_container = ttk.Frame(self)
@@ -283,13 +301,8 @@ class HabitsTab(ttk.Frame):
                     self.save_habits()
                     break
 
-    def update_times_display(self):
-        for widget in self.times_frame.winfo_children():
-            widget.destroy()
-
-        bg_color = self.winfo_toplevel().cget("bg")
-        self.canvas.configure(bg=bg_color)
-
+    def get_times_layout(self):
+        """Набор видимых групп и колонок; при его смене нужна полная перестройка"""
         width = self.winfo_width()
         if width < 600:
             max_cols = 1
@@ -298,19 +311,43 @@ class HabitsTab(ttk.Frame):
         else:
             max_cols = 3
 
-        current_row = None
-        col_count = 0
-
+        compact = self.compact_mode.get()
+        visible_times = []
         for time_name in self.all_times:
-            if self.compact_mode.get():
-                has_enabled_habits = False
-                for habit in self.habits.get(time_name, []):
-                    if habit.get("enabled", True):
-                        has_enabled_habits = True
-                        break
-                if not has_enabled_habits:
-                    continue
+            if compact and not any(
+                habit.get("enabled", True) for habit in self.habits.get(time_name, [])
+            ):
+                continue
+            quick_timer = self.time_settings.get(time_name, {}).get(
+                "quick_timer_minutes"
+            )
+            visible_times.append((time_name, quick_timer))
 
+        return tuple(visible_times), max_cols, compact
+
+    def update_times_display(self):
+        """Точечно обновляет строки или перестраивает группы при смене раскладки"""
+        layout = self.get_times_layout()
+        if layout != self.times_layout:
+            self.rebuild_times_display(layout)
+            return
+
+        for time_name, _ in layout[0]:
+            self.habit_lists[time_name].update(self.habits.get(time_name, []))
+
+    def rebuild_times_display(self, layout):
+        for widget in self.times_frame.winfo_children():
+            widget.destroy()
+        self.habit_lists = {}
+        self.times_layout = layout
+
+        bg_color = self.winfo_toplevel().cget("bg")
+        self.canvas.configure(bg=bg_color)
+
+        visible_times, max_cols, compact = layout
+        current_row = None
+
+        for col_count, (time_name, _) in enumerate(visible_times):
             if col_count % max_cols == 0:
                 current_row = ttk.Frame(self.times_frame)
                 current_row.pack(fill=tk.X, expand=True, pady=5)
@@ -318,155 +355,20 @@ class HabitsTab(ttk.Frame):
             frame = self.create_time_frame(current_row, time_name)
             frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
 
-            col_count += 1
-
         self.times_frame.update_idletasks()
 
-        if not self.compact_mode.get():
+        if not compact:
             self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
     def update_habits_list(self, time_name, frame):
-        for widget in frame.winfo_children():
-            widget.destroy()
-
         if time_name not in self.habits:
             self.habits[time_name] = []
 
-        for habit in self.habits[time_name]:
-            if self.compact_mode.get() and not habit.get("enabled", True):
-                continue
-
-            habit_frame = ttk.Frame(frame)
-            habit_frame.pack(fill=tk.X, pady=5)
-
-            if not self.compact_mode.get():
-                enabled_var = tk.BooleanVar(value=habit.get("enabled", True))
-                ttk.Checkbutton(
-                    habit_frame,
-                    variable=enabled_var,
-                    command=lambda h=habit, v=enabled_var: self.toggle_habit(
-                        h, v.get()
-                    ),
-                    takefocus=0,
-                ).pack(side=tk.LEFT, padx=5)
-
-            repeats = habit.get("repeats", 1)
-            completed_repeats = habit.get("completed_repeats", 0)
-            completed = habit.get("completed", False)
-
-            checkboxes_frame = ttk.Frame(habit_frame)
-            checkboxes_frame.pack(side=tk.LEFT, padx=3)
-
-            max_visible_repeats = min(repeats, 5)
-
-            for i in range(max_visible_repeats):
-                is_checked = i < completed_repeats or completed
-                checkbox_var = tk.BooleanVar(value=is_checked)
-
-                checkbox = ttk.Checkbutton(
-                    checkboxes_frame,
-                    variable=checkbox_var,
-                    command=lambda h=habit, index=i, var=checkbox_var: self.toggle_repeat(
-                        h, index, var.get()
-                    ),
-                    style="Orange.TCheckbutton",
-                    takefocus=0,
-                )
-                checkbox.pack(side=tk.LEFT)
-
-            if repeats > 5:
-                ttk.Label(
-                    checkboxes_frame, text=f"+{repeats - 5}", font=("Segoe UI", 9)
-                ).pack(side=tk.LEFT, padx=(2, 0))
-
-            notifications_var = tk.BooleanVar(value=habit.get("notifications", True))
-            notify_btn = ttk.Button(
-                habit_frame,
-                text="🔔" if notifications_var.get() else "🔕",
-                width=3,
-                command=lambda h=habit, v=notifications_var: self.toggle_notifications(
-                    h, v
-                ),
-                takefocus=0,
-            )
-            notify_btn.pack(side=tk.LEFT, padx=3)
-
-            info_frame = ttk.Frame(habit_frame)
-            info_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
-
-            name_label = ttk.Label(
-                info_frame, text=habit["name"], font=("Segoe UI", 11)
-            )
-
-            if habit.get("completed", False):
-                name_label.configure(foreground="gray")
-            name_label.pack(anchor=tk.W)
-
-            info_text = ""
-
-            if habit.get("comment"):
-                info_text += f"\"{habit['comment']}\" "
-
-            if habit.get("notifications", True):
-                interval_text = f"Каждые {habit.get('interval', '')} мин"
-                time_text = (
-                    f"{habit.get('start_time', '')} - {habit.get('end_time', '')}"
-                )
-                if info_text:
-                    info_text += f"• {interval_text} • {time_text}"
-                else:
-                    info_text = f"{interval_text} • {time_text}"
-
-            if info_text:
-                ttk.Label(
-                    info_frame,
-                    text=info_text,
-                    font=("Segoe UI", 9),
-                ).pack(anchor=tk.W)
-
-            buttons_frame = ttk.Frame(habit_frame)
-            buttons_frame.pack(side=tk.RIGHT)
-
-            if not self.compact_mode.get():
-                ttk.Button(
-                    buttons_frame,
-                    text="💬",
-                    width=2,
-                    command=lambda h=habit: self.add_comment(h),
-                    takefocus=0,
-                ).pack(side=tk.LEFT, padx=2)
-
-                ttk.Button(
-                    buttons_frame,
-                    text="✏️",
-                    width=2,
-                    command=lambda h=habit, tn=time_name: self.edit_habit(h, tn),
-                    takefocus=0,
-                ).pack(side=tk.LEFT, padx=2)
-
-                ttk.Button(
-                    buttons_frame,
-                    text="↑",
-                    width=2,
-                    command=lambda n=habit["name"]: self.move_habit(time_name, n, -1),
-                    takefocus=0,
-                ).pack(side=tk.LEFT, padx=2)
-
-                ttk.Button(
-                    buttons_frame,
-                    text="↓",
-                    width=2,
-                    command=lambda n=habit["name"]: self.move_habit(time_name, n, 1),
-                    takefocus=0,
-                ).pack(side=tk.LEFT, padx=2)
-
-            ttk.Button(
-                buttons_frame,
-                text="✕",
-                width=2,
-                command=lambda h=habit: self.remove_habit(time_name, h),
-                takefocus=0,
-            ).pack(side=tk.LEFT, padx=2)
+        habit_list = self.habit_lists.get(time_name)
+        if habit_list is None or habit_list.frame is not frame:
+            habit_list = HabitList(self, time_name, frame)
+            self.habit_lists[time_name] = habit_list
+        habit_list.update(self.habits[time_name])
 
     def toggle_completion(self, habit):
         """Отмечает привычку как выполненную или нет, управляет счетчиком выполненных повторений"""
@@ -491,6 +393,7 @@ class HabitsTab(ttk.Frame):
             else:
                 habit["completed"] = False
 
+        self.reminder.reschedule(habit)
         self.save_habits()
         self.update_times_display()
         self.update_stats_display()
@@ -509,6 +412,7 @@ class HabitsTab(ttk.Frame):
                     habit["comment"] = ""
 
             self.set_last_reset_date(current_date)
+            self.reminder.rebuild()
             self.save_habits()
             self.update_times_display()
             self.update_stats_display()
@@ -539,6 +443,7 @@ class HabitsTab(ttk.Frame):
         notifications = not habit.get("notifications", True)
         habit["notifications"] = notifications
         notify_var.set(notifications)
+        self.reminder.reschedule(habit)
         self.save_habits()
         self.update_times_display()
 
@@ -696,13 +601,18 @@ class HabitsTab(ttk.Frame):
 
             start_time = f"{start_hour.get().zfill(2)}:{start_minute.get().zfill(2)}"
             end_time = f"{end_hour.get().zfill(2)}:{end_minute.get().zfill(2)}"
+            try:
+                start, end = parse_minutes(start_time), parse_minutes(end_time)
+            except ValueError:
+                messagebox.showwarning("Ошибка", "Некорректное время")
+                return
 
             comment = comment_text.get("1.0", tk.END).strip()
 
-            habit["name"] = name
-            habit["interval"] = int(interval_entry.get())
-            habit["start_time"] = start_time
-            habit["end_time"] = end_time
+            habit.name = name
+            habit.interval = int(interval_entry.get())
+            habit.start = start
+            habit.end = end
             habit["notifications"] = notifications_var.get()
             habit["repeats"] = repeats
             habit["comment"] = comment
@@ -715,6 +625,7 @@ class HabitsTab(ttk.Frame):
             else:
                 habit["completed"] = False
 
+            self.reminder.reschedule(habit, time_name)
             self.update_times_display()
             self.update_stats_display()
             self.save_habits()
@@ -899,27 +810,29 @@ class HabitsTab(ttk.Frame):
 
             start_time = f"{start_hour.get().zfill(2)}:{start_minute.get().zfill(2)}"
             end_time = f"{end_hour.get().zfill(2)}:{end_minute.get().zfill(2)}"
+            try:
+                start, end = parse_minutes(start_time), parse_minutes(end_time)
+            except ValueError:
+                messagebox.showwarning("Ошибка", "Некорректное время")
+                return
 
             comment = comment_text.get("1.0", tk.END).strip()
 
-            habit = {
-                "name": name,
-                "interval": int(interval_entry.get()),
-                "start_time": start_time,
-                "end_time": end_time,
-                "enabled": True,
-                "completed": False,
-                "completed_repeats": 0,
-                "repeats": repeats,
-                "notifications": notifications_var.get(),
-                "comment": comment,
-                "last_reminder": None,
-            }
+            habit = Habit(
+                name=name,
+                interval=int(interval_entry.get()),
+                start=start,
+                end=end,
+                repeats=repeats,
+                notifications=notifications_var.get(),
+                comment=comment,
+            )
 
             if time_name not in self.habits:
                 self.habits[time_name] = []
 
             self.habits[time_name].append(habit)
+            self.reminder.reschedule(habit, time_name)
             self.update_times_display()
             self.update_stats_display()
             self.save_habits()
@@ -1012,6 +925,7 @@ class HabitsTab(ttk.Frame):
     def toggle_habit(self, habit, enabled):
         """Включает/выключает привычку"""
         habit["enabled"] = enabled
+        self.reminder.reschedule(habit)
         self.save_habits()
 
     def remove_habit(self, time_name, habit):
@@ -1019,6 +933,7 @@ class HabitsTab(ttk.Frame):
         if messagebox.askyesno("Подтверждение", f"Удалить привычку '{habit['name']}'?"):
             if time_name in self.habits and habit in self.habits[time_name]:
                 self.habits[time_name].remove(habit)
+                self.reminder.discard(habit)
                 self.update_times_display()
             self.save_habits()
 
@@ -1036,6 +951,7 @@ class HabitsTab(ttk.Frame):
             if time_name in self.time_settings:
                 del self.time_settings[time_name]
 
+            self.reminder.rebuild()
             self.update_times_display()
             self.save_habits()
 
@@ -1176,13 +1092,8 @@ class HabitsTab(ttk.Frame):
         timer = main_window.timers[-1]
 
         timer_name = f"Привычки: {time_name}"
-        timer.description.delete(0, tk.END)
-        timer.description.insert(0, timer_name)
-        timer.hours.set(str(minutes // 60))
-        timer.minutes.set(str(minutes % 60))
-        timer.seconds.set("0")
-
-        timer.update_presets_visibility()
+        timer.set_description(timer_name)
+        timer.set_duration(minutes * 60)
         timer.start_timer()
 
         self.show_toast_notification(
@@ -1227,165 +1138,8 @@ class HabitsTab(ttk.Frame):
         self.toast_notification.after(duration, self.toast_notification.destroy)
 
     def save_habits(self):
-        """Сохраняет данные о привычках в файл"""
-        habits_data = {
-            "times": self.all_times,
-            "custom_times": self.custom_times,
-            "time_settings": self.time_settings,
-            "habits": {},
-        }
-
-        for time_name, habits_list in self.habits.items():
-            habits_data["habits"][time_name] = []
-            for habit in habits_list:
-                last_reminder = habit.get("last_reminder")
-                if isinstance(last_reminder, datetime):
-                    last_reminder = last_reminder.isoformat()
-
-                habit_data = {
-                    "name": habit["name"],
-                    "interval": habit["interval"],
-                    "start_time": habit["start_time"],
-                    "end_time": habit["end_time"],
-                    "enabled": habit.get("enabled", True),
-                    "completed": habit.get("completed", False),
-                    "completed_repeats": habit.get("completed_repeats", 0),
-                    "repeats": habit.get("repeats", 1),
-                    "notifications": habit.get("notifications", True),
-                    "comment": habit.get("comment", ""),
-                    "last_reminder": last_reminder,
-                }
-
-                if "completed_time" in habit:
-                    habit_data["completed_time"] = habit["completed_time"]
-
-                habits_data["habits"][time_name].append(habit_data)
-
-        try:
-            json_data = json.dumps(habits_data, ensure_ascii=False, indent=2)
-
-            with open("habits.json", "w", encoding="utf-8") as f:
-                f.write(json_data)
-        except Exception as e:
-            print(f"Ошибка при сохранении данных о привычках: {e}")
-
-    def load_habits(self):
-        """Загружает данные о привычках из файла"""
-        try:
-            with open("habits.json", "r", encoding="utf-8") as f:
-                try:
-                    data = json.load(f)
-
-                    if isinstance(data, list):
-                        old_habits = data
-
-                        general_time = "Общие"
-                        if general_time not in self.all_times:
-                            self.all_times.append(general_time)
-                            self.custom_times.append(general_time)
-                            self.habits[general_time] = []
-                            self.time_settings[general_time] = {
-                                "quick_timer_minutes": None
-                            }
-
-                        for habit_data in old_habits:
-                            if not all(
-                                key in habit_data
-                                for key in [
-                                    "name",
-                                    "interval",
-                                    "start_time",
-                                    "end_time",
-                                    "enabled",
-                                ]
-                            ):
-                                print(
-                                    f"Пропущена привычка с неполными данными: {habit_data}"
-                                )
-                                continue
-
-                            if (
-                                "last_reminder" in habit_data
-                                and habit_data["last_reminder"]
-                            ):
-                                try:
-                                    habit_data[
-                                        "last_reminder"
-                                    ] = datetime.fromisoformat(
-                                        habit_data["last_reminder"]
-                                    )
-                                except ValueError:
-                                    habit_data["last_reminder"] = None
-                            else:
-                                habit_data["last_reminder"] = None
-
-                            self.habits[general_time].append(habit_data)
-                    else:
-                        if "times" in data:
-                            self.all_times = data["times"]
-                        if "custom_times" in data:
-                            self.custom_times = data["custom_times"]
-                        if "time_settings" in data:
-                            self.time_settings = data["time_settings"]
-
-                        if "habits" in data:
-                            for time_name, habits_list in data["habits"].items():
-                                if time_name not in self.habits:
-                                    self.habits[time_name] = []
-
-                                for habit_data in habits_list:
-                                    if (
-                                        "last_reminder" in habit_data
-                                        and habit_data["last_reminder"]
-                                    ):
-                                        try:
-                                            habit_data[
-                                                "last_reminder"
-                                            ] = datetime.fromisoformat(
-                                                habit_data["last_reminder"]
-                                            )
-                                        except ValueError:
-                                            habit_data["last_reminder"] = None
-                                    else:
-                                        habit_data["last_reminder"] = None
-
-                                    self.habits[time_name].append(habit_data)
-
-                    for time_name in self.all_times:
-                        if time_name not in self.time_settings:
-                            self.time_settings[time_name] = {
-                                "quick_timer_minutes": None
-                            }
-                        if time_name not in self.habits:
-                            self.habits[time_name] = []
-
-                    self.update_times_display()
-
-                    current_date = datetime.now().date()
-
-                    for time_name, habits_list in self.habits.items():
-                        for habit in habits_list:
-                            if habit.get("completed", False) and habit.get(
-                                "completed_time"
-                            ):
-                                try:
-                                    completed_time = datetime.fromisoformat(
-                                        habit["completed_time"]
-                                    )
-                                    if completed_time.date() < current_date:
-                                        habit["completed"] = False
-                                        habit["completed_time"] = None
-                                except:
-                                    habit["completed"] = False
-                                    habit["completed_time"] = None
-
-                except json.JSONDecodeError:
-                    print("Ошибка чтения файла habits.json. Файл поврежден.")
-
-        except FileNotFoundError:
-            print("Файл habits.json не найден. Создаем новый список привычек.")
-        except Exception as e:
-            print(f"Непредвиденная ошибка при загрузке привычек: {e}")
+        """Помечает привычки для отложенного сохранения в файл"""
+        self.store.save()
 
     def add_copy_paste_menu(self, widget):
         """Добавляет контекстное меню с функциями копирования/вставки к виджету"""
@@ -1769,6 +1523,7 @@ class HabitsTab(ttk.Frame):
         else:
             habit["completed"] = False
 
+        self.reminder.reschedule(habit)
         self.save_habits()
         self.update_times_display()
         self.update_stats_display()
@@ -1784,6 +1539,7 @@ class HabitsTab(ttk.Frame):
                     habit["completed_repeats"] = 0
                     habit["comment"] = ""
 
+            self.reminder.rebuild()
             self.save_habits()
             self.update_times_display()
             self.update_stats_display()
@@ -1,7 +1,12 @@
-import json
+import copy
 import tkinter as tk
 from tkinter import messagebox, ttk
 
+from utils.autosave import get_autosave
+from utils.io_executor import get_io_executor
+from utils.journal_storage import JournalStorage
+from utils.ui_dispatcher import get_dispatcher
+
 
 class MedicationTab(ttk.Frame):
     def __init__(self, parent):
@@ -13,6 +18,15 @@ class MedicationTab(ttk.Frame):
         self.all_intakes = self.default_intakes.copy()
         self.intake_settings = {}
         self.toast_notification = None
+        self.journal = JournalStorage("medications.json")
+        self.dispatcher = get_dispatcher(self)
+        self.autosave = get_autosave(self)
+        self.io_executor = get_io_executor(self)
+        self.medications_loaded = False
+        self.autosave.register(
+            self.journal.path, self.snapshot_medications, self.write_medications
+        )
+        self.intake_widgets = {}
 
         for intake in self.default_intakes:
             self.medications[intake] = []
@@ -228,6 +242,11 @@ class MedicationTab(ttk.Frame):
             takefocus=0,
         )
         mark_all_button.pack(side=tk.LEFT, padx=5)
+        self.intake_widgets[intake_name] = {
+            "frame": frame,
+            "mark_all": mark_all_button,
+            "checks": {},
+        }
 
         buttons_right_frame = ttk.Frame(buttons_frame)
         buttons_right_frame.pack(side=tk.RIGHT)
@@ -281,6 +300,7 @@ class MedicationTab(ttk.Frame):
     def update_intakes_display(self):
         for widget in self.intakes_frame.winfo_children():
             widget.destroy()
+        self.intake_widgets = {}
 
         bg_color = self.winfo_toplevel().cget("bg")
         self.canvas.configure(bg=bg_color)
@@ -311,61 +331,32 @@ class MedicationTab(ttk.Frame):
         if not self.compact_mode.get():
             self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
-    def update_display(self):
-        for intake_name, medications in self.medications.items():
-            for widget in self.intakes_frame.winfo_children():
-                if isinstance(widget, ttk.Frame):
-                    for child in widget.winfo_children():
-                        if (
-                            isinstance(child, ttk.LabelFrame)
-                            and child.cget("text") == intake_name
-                        ):
-                            for control_frame in child.winfo_children():
-                                if isinstance(control_frame, ttk.Frame):
-                                    for button in control_frame.winfo_children():
-                                        if isinstance(button, ttk.Button) and (
-                                            button.cget("text") == "Отметить все"
-                                            or button.cget("text") == "Сбросить все"
-                                        ):
-                                            all_taken = all(
-                                                med.get("taken", False)
-                                                for med in self.medications[intake_name]
-                                            )
-                                            button.configure(
-                                                text="Сбросить все"
-                                                if all_taken
-                                                else "Отметить все"
-                                            )
-                                            break
-
-                            meds_frame = None
-                            for frame in child.winfo_children():
-                                if (
-                                    isinstance(frame, ttk.Frame)
-                                    and not frame.winfo_children()
-                                ):
-                                    continue
-                                if len(frame.winfo_children()) > 0 and isinstance(
-                                    frame.winfo_children()[0], ttk.Frame
-                                ):
-                                    meds_frame = frame
-                                    break
-
-                            if meds_frame:
-                                for i, med in enumerate(medications):
-                                    if i < len(meds_frame.winfo_children()):
-                                        med_frame = meds_frame.winfo_children()[i]
-                                        for child in med_frame.winfo_children():
-                                            if isinstance(child, ttk.Checkbutton):
-                                                var = med.get("var")
-                                                if var and hasattr(var, "set"):
-                                                    var.set(med.get("taken", False))
+    def update_display(self, intake_names=None):
+        """Синхронизирует отметки и кнопку «Отметить все» через реестр виджетов"""
+        if intake_names is None:
+            intake_names = list(self.medications)
+
+        for intake_name in intake_names:
+            widgets = self.intake_widgets.get(intake_name)
+            if widgets is None:
+                continue
+
+            for med in self.medications.get(intake_name, []):
+                check = widgets["checks"].get(id(med))
+                taken = med.get("taken", False)
+                if check is not None and check["var"].get() != taken:
+                    check["var"].set(taken)
+
+            self.update_mark_all_button(intake_name)
 
     def update_medications_list(self, intake_name, frame):
         for widget in frame.winfo_children():
             widget.destroy()
 
         medications = self.medications.get(intake_name, [])
+        checks = {}
+        if intake_name in self.intake_widgets:
+            self.intake_widgets[intake_name]["checks"] = checks
 
         if self.compact_mode.get():
             count = len(medications)
@@ -396,11 +387,10 @@ class MedicationTab(ttk.Frame):
                     if idx < count:
                         med = medications[idx]
                         var = tk.BooleanVar(value=med.get("taken", False))
-                        med["var"] = var
 
-                        def make_update_func(medication, intake_name=intake_name):
+                        def make_update_func(medication, var, intake_name=intake_name):
                             def update():
-                                medication["taken"] = medication["var"].get()
+                                medication["taken"] = var.get()
                                 self.save_medications()
                                 self.update_mark_all_button(intake_name)
 
@@ -410,11 +400,12 @@ class MedicationTab(ttk.Frame):
                             frame,
                             text=med["name"],
                             variable=var,
-                            command=make_update_func(med),
+                            command=make_update_func(med, var),
                         )
                         check.grid(
                             row=row_idx, column=col_idx, sticky="w", padx=5, pady=2
                         )
+                        checks[id(med)] = {"check": check, "var": var}
                         frame.grid_columnconfigure(col_idx, weight=1)
                         idx += 1
         else:
@@ -423,11 +414,10 @@ class MedicationTab(ttk.Frame):
                 med_frame.pack(fill=tk.X, pady=2)
 
                 var = tk.BooleanVar(value=med.get("taken", False))
-                med["var"] = var
 
-                def make_update_func(medication, intake_name=intake_name):
+                def make_update_func(medication, var, intake_name=intake_name):
                     def update():
-                        medication["taken"] = medication["var"].get()
+                        medication["taken"] = var.get()
                         self.save_medications()
                         self.update_mark_all_button(intake_name)
 
@@ -437,9 +427,10 @@ class MedicationTab(ttk.Frame):
                     med_frame,
                     text=med["name"],
                     variable=var,
-                    command=make_update_func(med),
+                    command=make_update_func(med, var),
                 )
                 check.pack(side=tk.LEFT)
+                checks[id(med)] = {"check": check, "var": var}
 
                 buttons_frame = ttk.Frame(med_frame)
                 buttons_frame.pack(side=tk.RIGHT)
@@ -468,31 +459,17 @@ class MedicationTab(ttk.Frame):
                 ).pack(side=tk.LEFT, padx=2)
 
     def update_mark_all_button(self, intake_name):
-        if intake_name in self.medications:
-            all_taken = all(
-                med.get("taken", False) for med in self.medications[intake_name]
-            )
+        widgets = self.intake_widgets.get(intake_name)
+        if widgets is None or intake_name not in self.medications:
+            return
 
-            for widget in self.intakes_frame.winfo_children():
-                if isinstance(widget, ttk.Frame):
-                    for child in widget.winfo_children():
-                        if (
-                            isinstance(child, ttk.LabelFrame)
-                            and child.cget("text") == intake_name
-                        ):
-                            for frame in child.winfo_children():
-                                if isinstance(frame, ttk.Frame):
-                                    for button in frame.winfo_children():
-                                        if isinstance(button, ttk.Button) and (
-                                            button.cget("text") == "Отметить все"
-                                            or button.cget("text") == "Сбросить все"
-                                        ):
-                                            button.configure(
-                                                text="Сбросить все"
-                                                if all_taken
-                                                else "Отметить все"
-                                            )
-                                            return
+        medications = self.medications[intake_name]
+        all_taken = bool(medications) and all(
+            med.get("taken", False) for med in medications
+        )
+        text = "Сбросить все" if all_taken else "Отметить все"
+        if widgets["mark_all"].cget("text") != text:
+            widgets["mark_all"].configure(text=text)
 
     def add_medication(self, intake_name, entry):
         name = entry.get().strip()
@@ -783,13 +760,8 @@ class MedicationTab(ttk.Frame):
         else:
             description += "(все таблетки приняты)"
 
-        timer.description.delete(0, tk.END)
-        timer.description.insert(0, description)
-        timer.hours.set(str(minutes // 60))
-        timer.minutes.set(str(minutes % 60))
-        timer.seconds.set("0")
-
-        timer.update_presets_visibility()
+        timer.set_description(description)
+        timer.set_duration(minutes * 60)
 
         timer.start_timer()
 
@@ -842,13 +814,21 @@ class MedicationTab(ttk.Frame):
         )
 
     def save_medications(self):
+        """Помечает лекарства для отложенного сохранения в файл"""
+        self.autosave.mark_dirty(self.journal.path)
+
+    def snapshot_medications(self):
+        """Копия данных о лекарствах для записи в фоновом потоке"""
+        if not self.medications_loaded:
+            return None
+
         data = {
             "medications": {},
-            "all_intakes": self.all_intakes,
-            "default_intakes": self.default_intakes,
-            "custom_intakes": self.custom_intakes,
+            "all_intakes": list(self.all_intakes),
+            "default_intakes": list(self.default_intakes),
+            "custom_intakes": list(self.custom_intakes),
             "compact_mode": self.compact_mode.get(),
-            "intake_settings": self.intake_settings,
+            "intake_settings": copy.deepcopy(self.intake_settings),
         }
 
         for intake_name, medications in self.medications.items():
@@ -859,41 +839,55 @@ class MedicationTab(ttk.Frame):
                 }
                 for med in medications
             ]
+        return data
 
+    def write_medications(self, data):
         try:
-            with open("medications.json", "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            self.journal.sync(data, depth=2)
         except Exception as e:
             print(f"Ошибка сохранения конфигурации: {e}")
-            messagebox.showerror("Ошибка", "Не удалось сохранить конфигурацию")
+            self.dispatcher.post(
+                lambda: messagebox.showerror(
+                    "Ошибка", "Не удалось сохранить конфигурацию"
+                )
+            )
 
     def load_medications(self):
+        """Читает снимок и журнал лекарств в потоке ввода-вывода"""
+        self.io_executor.submit(
+            self.journal.path,
+            self.journal.load,
+            callback=self.on_medications_loaded,
+        )
+
+    def on_medications_loaded(self, future):
+        """Применяет загруженные данные о лекарствах в потоке Tk"""
+        self.medications_loaded = True
         try:
-            with open("medications.json", "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-                self.all_intakes = data.get("all_intakes", self.default_intakes.copy())
-                self.default_intakes = data.get("default_intakes", self.default_intakes)
-                self.custom_intakes = data.get("custom_intakes", [])
-                self.compact_mode.set(data.get("compact_mode", False))
-                self.intake_settings = data.get("intake_settings", {})
-
-                for intake in self.all_intakes:
-                    if intake not in self.intake_settings:
-                        self.intake_settings[intake] = {"quick_timer_minutes": None}
-
-                self.medications = {}
-                for intake_name, medications in data.get("medications", {}).items():
-                    if intake_name in self.all_intakes:
-                        self.medications[intake_name] = [
-                            {
-                                "name": med["name"],
-                                "taken": med.get("taken", False),
-                            }
-                            for med in medications
-                        ]
-
-                self.update_intakes_display()
+            data = future.result()
+
+            self.all_intakes = data.get("all_intakes", self.default_intakes.copy())
+            self.default_intakes = data.get("default_intakes", self.default_intakes)
+            self.custom_intakes = data.get("custom_intakes", [])
+            self.compact_mode.set(data.get("compact_mode", False))
+            self.intake_settings = data.get("intake_settings", {})
+
+            for intake in self.all_intakes:
+                if intake not in self.intake_settings:
+                    self.intake_settings[intake] = {"quick_timer_minutes": None}
+
+            self.medications = {}
+            for intake_name, medications in data.get("medications", {}).items():
+                if intake_name in self.all_intakes:
+                    self.medications[intake_name] = [
+                        {
+                            "name": med["name"],
+                            "taken": med.get("taken", False),
+                        }
+                        for med in medications
+                    ]
+
+            self.update_intakes_display()
         except FileNotFoundError:
             for intake in self.default_intakes:
                 if intake not in self.medications:
@@ -906,18 +900,16 @@ class MedicationTab(ttk.Frame):
             messagebox.showerror("Ошибка", "Не удалось загрузить сохраненные данные")
 
     def toggle_all_medications(self, intake_name):
-        if intake_name in self.medications:
-            all_taken = all(
-                med.get("taken", False) for med in self.medications[intake_name]
-            )
-
-            new_state = not all_taken
+        if intake_name not in self.medications:
+            return
 
-            for med in self.medications[intake_name]:
-                med["taken"] = new_state
-                if "var" in med and hasattr(med["var"], "set"):
-                    med["var"].set(new_state)
+        all_taken = all(
+            med.get("taken", False) for med in self.medications[intake_name]
+        )
+        new_state = not all_taken
 
-            self.save_medications()
+        for med in self.medications[intake_name]:
+            med["taken"] = new_state
 
-            self.update_display()
+        self.save_medications()
+        self.update_display([intake_name])
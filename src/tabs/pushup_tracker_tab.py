@@ -1,27 +1,60 @@
-import json
 import time
 import tkinter as tk
 from datetime import datetime, timedelta
 from tkinter import messagebox, ttk
-from typing import Dict, List, Optional
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Set
+
+from components.virtual_treeview import VirtualRow, VirtualTreeview
+from utils.io_executor import IOExecutor, get_io_executor, log_errors
+from utils.journal_storage import JournalStorage
 
 
 class PushupStorage:
-    def __init__(self):
+    """
+    Отжимания по дням в журнальном хранилище.
+
+    С исполнителем чтение и запись идут в IOExecutor: до окончания
+    load_async() изменения не сохраняются и заменяются загруженными
+    данными. Без исполнителя хранилище работает синхронно.
+    """
+
+    def __init__(self, executor: Optional[IOExecutor] = None):
         self._data: Dict[str, List[dict]] = {}
         self._modified: bool = False
-        self._load()
+        self._dirty_dates: Set[str] = set()
+        self._journal = JournalStorage("pushups.json")
+        self._executor = executor
+        self._loaded = False
+        if executor is None:
+            self._load()
+
+    def load_async(self, on_loaded: Callable[[], None]) -> None:
+        """Читает данные в IOExecutor; on_loaded вызывается в потоке Tk"""
+        self._executor.submit(
+            self._journal.path,
+            self._journal.load,
+            callback=lambda future: self._on_loaded(future, on_loaded),
+        )
+
+    def _on_loaded(self, future: Future, on_loaded: Callable[[], None]) -> None:
+        self._load(future)
+        on_loaded()
 
     def add(self, date: str, count: int, time: str) -> None:
         if date not in self._data:
             self._data[date] = []
         self._data[date].append({"count": count, "time": time})
-        self._modified = True
+        self._mark_date(date)
 
     def remove(self, date: str, index: int) -> None:
         if date in self._data and 0 <= index < len(self._data[date]):
             del self._data[date][index]
-            self._modified = True
+            self._mark_date(date)
+
+    def _mark_date(self, date: str) -> None:
+        self._dirty_dates.add(date)
+        self._modified = True
 
     def get_date_data(self, date: str) -> list:
         return self._data.get(date, [])
@@ -30,27 +63,41 @@ class PushupStorage:
         return sum(entry["count"] for entry in self.get_date_data(date))
 
     def save(self) -> None:
-        if self._modified:
-            with open("pushups.json", "w") as f:
-                json.dump(self._data, f)
-            self._modified = False
+        if not self._modified or not self._loaded:
+            return
+
+        sets = [([date], list(self._data[date])) for date in self._dirty_dates]
+        self._dirty_dates.clear()
+        self._modified = False
+        if self._executor is None:
+            self._journal.commit(sets)
+            return
+        self._executor.submit(
+            self._journal.path,
+            self._journal.commit,
+            sets,
+            callback=log_errors("Ошибка сохранения отжиманий"),
+        )
 
-    def _load(self) -> None:
+    def _load(self, future: Optional[Future] = None) -> None:
+        """Применяет снимок и журнал; future - результат чтения из IOExecutor"""
         try:
-            with open("pushups.json", "r") as f:
-                self._data = json.load(f)
+            self._data = (future.result() if future else self._journal.load()) or {}
         except FileNotFoundError:
             self._data = {}
+        self._dirty_dates.clear()
+        self._modified = False
+        self._loaded = True
 
 
 class PushupTrackerTab(ttk.Frame):
     def __init__(self, parent):
         super().__init__(parent)
-        self.storage = PushupStorage()
+        self.storage = PushupStorage(get_io_executor(self))
         self.current_date = time.strftime("%Y-%m-%d")
-        self.pushups_today = self.storage.get_date_total(self.current_date)
+        self.pushups_today = 0
         self.setup_ui()
-        self._load_today_data()
+        self.storage.load_async(self._load_today_data)
 
     def setup_ui(self):
         self.main_container = ttk.Frame(self)
@@ -231,10 +278,11 @@ class PushupTrackerTab(ttk.Frame):
         self.history_tree.column("count", width=150, anchor="center")
         self.history_tree.column("actions", width=50, anchor="center")
 
-        scrollbar = ttk.Scrollbar(
-            history_frame, orient="vertical", command=self.history_tree.yview
-        )
-        self.history_tree.configure(yscrollcommand=scrollbar.set)
+        self.history_tree.tag_configure("even", background="#f8f9fa")
+        self.history_tree.tag_bind("clickable", "<Button-1>", self._handle_tree_click)
+
+        scrollbar = ttk.Scrollbar(history_frame, orient="vertical")
+        self.history_view = VirtualTreeview(self.history_tree, scrollbar)
 
         self.history_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -242,21 +290,12 @@ class PushupTrackerTab(ttk.Frame):
     def _update_display(self) -> None:
         entries = self.storage.get_date_data(self.current_date)
 
-        for item in self.history_tree.get_children():
-            self.history_tree.delete(item)
-
+        rows = []
         for i, entry in enumerate(entries):
-            item_id = self.history_tree.insert(
-                "",
-                "end",
-                values=(entry["time"], f"{entry['count']} отжиманий", "✕"),
-                tags=(f"row_{i}", "clickable"),
-            )
-
-            if i % 2 == 0:
-                self.history_tree.tag_configure(f"row_{i}", background="#f8f9fa")
-
-        self.history_tree.tag_bind("clickable", "<Button-1>", self._handle_tree_click)
+            values = (entry["time"], f"{entry['count']} отжиманий", "✕")
+            tags = ("even", "clickable") if i % 2 == 0 else ("clickable",)
+            rows.append(VirtualRow(str(i), values, tags))
+        self.history_view.set_rows(rows)
 
     def _handle_tree_click(self, event):
         region = self.history_tree.identify_region(event.x, event.y)
@@ -265,7 +304,7 @@ class PushupTrackerTab(ttk.Frame):
             col = self.history_tree.identify_column(event.x)
 
             if col == "#3":
-                idx = self.history_tree.index(item)
+                idx = self.history_view.index_of(item)
                 self._remove_entry(idx)
 
     def _setup_tooltips(self):
@@ -2,6 +2,8 @@ import json
 import tkinter as tk
 from tkinter import messagebox, ttk
 
+from utils.io_executor import get_io_executor, read_json
+
 
 class SettingsTab(ttk.Frame):
     """
@@ -14,6 +16,7 @@ class SettingsTab(ttk.Frame):
     def __init__(self, parent, main_window):
         super().__init__(parent)
         self.main_window = main_window
+        self.io_executor = get_io_executor(self)
         self.setup_ui()
         self.load_settings()
 
@@ -113,13 +116,40 @@ class SettingsTab(ttk.Frame):
         )
         calorie_description.pack(anchor=tk.W, padx=(0, 0), pady=(5, 0))
 
+        # Чекбокс: Хранить калории в SQLite
+        self.calorie_sqlite_var = tk.BooleanVar(value=False)
+        sqlite_checkbox = ttk.Checkbutton(
+            calorie_section,
+            text="Хранить историю калорий в SQLite (calories.db)",
+            variable=self.calorie_sqlite_var,
+            command=self.on_setting_changed,
+            takefocus=0
+        )
+        sqlite_checkbox.pack(anchor=tk.W, pady=(10, 0))
+
+        sqlite_description = ttk.Label(
+            calorie_section,
+            text="Быстрее на большой истории: в память не загружаются все дни.\n"
+                 "Данные из calories.json переносятся автоматически. Нужен перезапуск.",
+            foreground="gray",
+            font=("Arial", 9)
+        )
+        sqlite_description.pack(anchor=tk.W, padx=(25, 0), pady=(0, 5))
+
     def load_settings(self):
-        """Загружает настройки из settings.json"""
+        """
+        Загружает настройки из settings.json.
+
+        Читается синхронно: от настроек зависит создание других вкладок
+        (тип хранилища калорий).
+        """
         try:
-            with open("settings.json", "r", encoding="utf-8") as f:
-                settings = json.load(f)
-                self.close_on_exit_var.set(settings.get("close_on_exit", True))
-                self.target_calories_var.set(str(settings.get("target_calories", 2000)))
+            settings = read_json("settings.json")
+            self.close_on_exit_var.set(settings.get("close_on_exit", True))
+            self.target_calories_var.set(str(settings.get("target_calories", 2000)))
+            self.calorie_sqlite_var.set(
+                settings.get("calorie_backend", "json") == "sqlite"
+            )
         except FileNotFoundError:
             # Файл не существует - используем дефолтные значения
             self.close_on_exit_var.set(True)
@@ -148,17 +178,23 @@ class SettingsTab(ttk.Frame):
 
         settings = {
             "close_on_exit": self.close_on_exit_var.get(),
-            "target_calories": target_calories
+            "target_calories": target_calories,
+            "calorie_backend": self.get_calorie_backend()
         }
 
-        try:
-            with open("settings.json", "w", encoding="utf-8") as f:
-                json.dump(settings, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            messagebox.showerror(
-                "Ошибка",
-                f"Не удалось сохранить настройки: {str(e)}"
-            )
+        self.io_executor.save_async(
+            "settings.json", settings, callback=self.on_settings_saved
+        )
+
+    def on_settings_saved(self, future):
+        """Сообщает об ошибке фоновой записи settings.json"""
+        error = future.exception()
+        if error is None:
+            return
+        messagebox.showerror(
+            "Ошибка",
+            f"Не удалось сохранить настройки: {str(error)}"
+        )
 
     def on_setting_changed(self):
         """Вызывается при изменении любой настройки"""
@@ -174,3 +210,7 @@ class SettingsTab(ttk.Frame):
             return int(self.target_calories_var.get())
         except ValueError:
             return 2000
+
+    def get_calorie_backend(self) -> str:
+        """Возвращает тип хранилища калорий: json или sqlite"""
+        return "sqlite" if self.calorie_sqlite_var.get() else "json"
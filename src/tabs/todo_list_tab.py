@@ -2,11 +2,21 @@ import tkinter as tk
 import tkinter.font as tkFont
 from tkinter import ttk
 
+from tabs.todo_storage import TodoItem, TodoStorage
+from utils.autosave import get_autosave
+from utils.io_executor import get_io_executor
+
 
 class TodoListTab(ttk.Frame):
     def __init__(self, parent):
         super().__init__(parent)
-        self.tasks = []
+        self.storage = TodoStorage(executor=get_io_executor(self))
+        self.task_frames = {}
+        self.packed_tasks = set()
+        self.autosave = get_autosave(self)
+        self.autosave.register(
+            self.storage.path, self.storage.snapshot, self.storage.write
+        )
         self.current_filter = "all"
         self.setup_styles()
         self.setup_ui()
@@ -14,6 +24,17 @@ class TodoListTab(ttk.Frame):
         self.completed_font = tkFont.Font(
             family="Segoe UI", size=11, slant="italic", overstrike=1
         )
+        self.storage.load_async(self.on_tasks_loaded)
+
+    def on_tasks_loaded(self):
+        for frame in self.task_frames.values():
+            frame.destroy()
+        self.task_frames.clear()
+        self.packed_tasks.clear()
+
+        for item in self.storage.items:
+            self.create_task_widget(item)
+        self.apply_filter(self.current_filter)
 
     def setup_styles(self):
         style = ttk.Style()
@@ -148,95 +169,113 @@ class TodoListTab(ttk.Frame):
 
     def add_task(self):
         task_text = self.task_entry.get().strip()
-        if task_text and task_text != self.placeholder_text:
-            task_frame = ttk.Frame(self.tasks_frame, style="TaskItem.TFrame")
-            task_frame.pack(fill=tk.X, pady=3)
-            var = tk.BooleanVar()
-            task_frame.var = var
-
-            def update_task_style():
-                if var.get():
-                    label.configure(font=self.completed_font, foreground="#9e9e9e")
-                else:
-                    label.configure(font=self.regular_font, foreground="#2c2c2c")
-                self.apply_filter(self.current_filter)
-
-            check = ttk.Checkbutton(
-                task_frame,
-                variable=var,
-                command=update_task_style,
-                style="Todo.TCheckbutton",
-                takefocus=0,
-            )
-            check.pack(side=tk.LEFT, padx=(5, 10))
-
-            label = ttk.Label(
-                task_frame, text=task_text, style="Task.TLabel", background="#ffffff"
-            )
-            label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        if not task_text or task_text == self.placeholder_text:
+            return
 
-            label.bind("<Double-Button-1>", lambda e: self.edit_task(label))
+        item = self.storage.add(task_text)
+        self.create_task_widget(item)
+        self.schedule_save()
 
-            controls_frame = ttk.Frame(task_frame, style="Todo.TFrame")
-            controls_frame.pack(side=tk.RIGHT, padx=5)
+        self.task_entry.delete(0, tk.END)
+        self.on_entry_focus_out(None)
+        self.canvas.yview_moveto(1.0)
+        self.apply_filter(self.current_filter)
 
-            up_btn = ttk.Button(
-                controls_frame,
-                text="↑",
-                style="Arrow.TButton",
-                takefocus=0,
-                command=lambda: self.move_task_up(task_frame),
-            )
-            up_btn.pack(side=tk.LEFT, padx=2)
-
-            down_btn = ttk.Button(
-                controls_frame,
-                text="↓",
-                style="Arrow.TButton",
-                takefocus=0,
-                command=lambda: self.move_task_down(task_frame),
-            )
-            down_btn.pack(side=tk.LEFT, padx=2)
-
-            delete_btn = ttk.Button(
-                controls_frame,
-                text="✕",
-                command=lambda: self.delete_task(task_frame),
-                takefocus=0,
-                style="Todo.TButton",
-            )
-            delete_btn.pack(side=tk.LEFT, padx=2)
-
-            def on_enter(e):
-                task_frame.configure(style="TaskItemHover.TFrame")
-                controls_frame.pack(side=tk.RIGHT, padx=5)
-
-            def on_leave(e):
-                task_frame.configure(style="TaskItem.TFrame")
-                if not delete_btn.winfo_containing(e.x_root, e.y_root):
-                    controls_frame.pack_forget()
-
-            task_frame.bind("<Enter>", on_enter)
-            task_frame.bind("<Leave>", on_leave)
-
-            self.tasks.append(task_frame)
-            self.task_entry.delete(0, tk.END)
-            self.on_entry_focus_out(None)
-            self.canvas.yview_moveto(1.0)
+    def create_task_widget(self, item: TodoItem):
+        """Создает виджеты задачи; упаковкой управляет apply_filter"""
+        task_frame = ttk.Frame(self.tasks_frame, style="TaskItem.TFrame")
+        var = tk.BooleanVar(value=item.done)
+
+        def update_task_style():
+            self.storage.set_done(item, var.get())
+            self.apply_task_style(item, label)
+            self.schedule_save()
             self.apply_filter(self.current_filter)
 
-    def delete_task(self, task_frame):
-        if task_frame in self.tasks:
-            self.tasks.remove(task_frame)
-        task_frame.destroy()
+        check = ttk.Checkbutton(
+            task_frame,
+            variable=var,
+            command=update_task_style,
+            style="Todo.TCheckbutton",
+            takefocus=0,
+        )
+        check.pack(side=tk.LEFT, padx=(5, 10))
+
+        label = ttk.Label(
+            task_frame, text=item.text, style="Task.TLabel", background="#ffffff"
+        )
+        label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.apply_task_style(item, label)
+
+        label.bind("<Double-Button-1>", lambda e: self.edit_task(item, label))
 
-    def edit_task(self, label):
+        controls_frame = ttk.Frame(task_frame, style="Todo.TFrame")
+        controls_frame.pack(side=tk.RIGHT, padx=5)
+
+        up_btn = ttk.Button(
+            controls_frame,
+            text="↑",
+            style="Arrow.TButton",
+            takefocus=0,
+            command=lambda: self.move_task_up(item),
+        )
+        up_btn.pack(side=tk.LEFT, padx=2)
+
+        down_btn = ttk.Button(
+            controls_frame,
+            text="↓",
+            style="Arrow.TButton",
+            takefocus=0,
+            command=lambda: self.move_task_down(item),
+        )
+        down_btn.pack(side=tk.LEFT, padx=2)
+
+        delete_btn = ttk.Button(
+            controls_frame,
+            text="✕",
+            command=lambda: self.delete_task(item),
+            takefocus=0,
+            style="Todo.TButton",
+        )
+        delete_btn.pack(side=tk.LEFT, padx=2)
+
+        def on_enter(e):
+            task_frame.configure(style="TaskItemHover.TFrame")
+            controls_frame.pack(side=tk.RIGHT, padx=5)
+
+        def on_leave(e):
+            task_frame.configure(style="TaskItem.TFrame")
+            if not delete_btn.winfo_containing(e.x_root, e.y_root):
+                controls_frame.pack_forget()
+
+        task_frame.bind("<Enter>", on_enter)
+        task_frame.bind("<Leave>", on_leave)
+
+        self.task_frames[item.id] = task_frame
+
+    def apply_task_style(self, item: TodoItem, label):
+        if item.done:
+            label.configure(font=self.completed_font, foreground="#9e9e9e")
+        else:
+            label.configure(font=self.regular_font, foreground="#2c2c2c")
+
+    def delete_task(self, item: TodoItem):
+        self.storage.remove(item)
+        self.destroy_task_widget(item)
+        self.schedule_save()
+
+    def destroy_task_widget(self, item: TodoItem):
+        self.packed_tasks.discard(item.id)
+        task_frame = self.task_frames.pop(item.id, None)
+        if task_frame is not None:
+            task_frame.destroy()
+
+    def edit_task(self, item: TodoItem, label):
         task_frame = label.master
-        old_text = label.cget("text")
         edit_entry = ttk.Entry(
             task_frame, font=("Segoe UI", 11), style="TodoEntry.TEntry"
         )
-        edit_entry.insert(0, old_text)
+        edit_entry.insert(0, item.text)
         edit_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
         label.pack_forget()
         edit_entry.focus_set()
@@ -245,68 +284,77 @@ class TodoListTab(ttk.Frame):
             new_text = edit_entry.get().strip()
             if new_text:
                 label.config(text=new_text)
+                self.storage.set_text(item, new_text)
+                self.schedule_save()
             edit_entry.destroy()
             label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            self.apply_filter(self.current_filter)
 
         edit_entry.bind("<Return>", save_edit)
         edit_entry.bind("<FocusOut>", lambda e: save_edit())
 
-    def move_task_up(self, task_frame):
-        index = self.tasks.index(task_frame)
-        if index > 0:
-            self.tasks[index], self.tasks[index - 1] = (
-                self.tasks[index - 1],
-                self.tasks[index],
-            )
-            for task in self.tasks:
-                task.pack_forget()
-                task.pack(fill=tk.X, pady=3)
-
-    def move_task_down(self, task_frame):
-        index = self.tasks.index(task_frame)
-        if index < len(self.tasks) - 1:
-            self.tasks[index], self.tasks[index + 1] = (
-                self.tasks[index + 1],
-                self.tasks[index],
-            )
-            for task in self.tasks:
-                task.pack_forget()
-                task.pack(fill=tk.X, pady=3)
+    def move_task_up(self, item: TodoItem):
+        self.move_task(item, -1)
+
+    def move_task_down(self, item: TodoItem):
+        self.move_task(item, 1)
+
+    def move_task(self, item: TodoItem, direction):
+        """Меняет задачу с соседней в модели и переставляет один виджет"""
+        neighbor = self.storage.move(item, direction)
+        if neighbor is None:
+            return
+
+        self.schedule_save()
+        if item.id not in self.packed_tasks or neighbor.id not in self.packed_tasks:
+            return
+
+        task_frame = self.task_frames[item.id]
+        neighbor_frame = self.task_frames[neighbor.id]
+        if direction < 0:
+            task_frame.pack_configure(before=neighbor_frame)
+        else:
+            task_frame.pack_configure(after=neighbor_frame)
 
     def apply_filter(self, filter_type):
+        """Показывает задачи, подходящие под фильтр; трогает только изменившиеся"""
         self.current_filter = filter_type
-        for task in self.tasks:
-            var = task.var
-
-            task_label = None
-            for child in task.winfo_children():
-                if isinstance(child, ttk.Label):
-                    task_label = child
-                    break
-            task_text = task_label.cget("text") if task_label else ""
-            search_query = self.search_entry.get().strip().lower()
-            matches_search = search_query in task_text.lower() if search_query else True
-
-            if filter_type == "all":
-                if matches_search:
-                    task.pack(fill=tk.X, pady=3)
-                else:
-                    task.pack_forget()
-            elif filter_type == "active":
-                if not var.get() and matches_search:
-                    task.pack(fill=tk.X, pady=3)
-                else:
-                    task.pack_forget()
-            elif filter_type == "completed":
-                if var.get() and matches_search:
-                    task.pack(fill=tk.X, pady=3)
-                else:
-                    task.pack_forget()
+        query = self.search_entry.get().strip().lower()
+
+        previous = None
+        for item in self.storage.items:
+            visible = item.matches(filter_type, query)
+            self.set_task_visible(item, visible, previous)
+            if visible:
+                previous = self.task_frames[item.id]
+
+    def set_task_visible(self, item: TodoItem, visible, previous):
+        """Упаковывает задачу сразу после previous или скрывает её"""
+        if visible == (item.id in self.packed_tasks):
+            return
+
+        task_frame = self.task_frames[item.id]
+        if not visible:
+            task_frame.pack_forget()
+            self.packed_tasks.discard(item.id)
+            return
+
+        position = {}
+        if previous is not None:
+            position = {"after": previous}
+        elif self.packed_tasks:
+            position = {"before": self.tasks_frame.pack_slaves()[0]}
+        task_frame.pack(fill=tk.X, pady=3, **position)
+        self.packed_tasks.add(item.id)
 
     def on_search(self, event):
         self.apply_filter(self.current_filter)
 
     def clear_completed(self):
-        for task in self.tasks[:]:
-            if task.var.get():
-                self.delete_task(task)
+        for item in self.storage.remove_completed():
+            self.destroy_task_widget(item)
+        self.schedule_save()
+
+    def schedule_save(self):
+        """Копит изменения и сохраняет их одной записью через автосохранение"""
+        self.autosave.mark_dirty(self.storage.path)
@@ -0,0 +1,163 @@
+"""
+Модель и хранилище списка задач.
+
+Ответственность:
+- Список задач в порядке отображения с флагом выполнения
+- Кэш текста в нижнем регистре для поиска без обращения к виджетам
+- Атомарное сохранение в todos.json только при наличии изменений;
+  изменения считаются сохранёнными только после успешной записи
+- Чтение файла в IOExecutor, если он передан; задачи, добавленные до
+  окончания загрузки, дописываются после загруженных
+"""
+
+import itertools
+import json
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Tuple
+
+from utils.io_executor import IOExecutor, read_json
+from utils.journal_storage import atomic_write_text
+
+
+class TodoItem:
+    """Задача; search_key обновляется вместе с текстом"""
+
+    __slots__ = ("id", "text", "done", "search_key")
+
+    def __init__(self, item_id: int, text: str, done: bool = False):
+        self.id = item_id
+        self.text = text
+        self.done = done
+        self.search_key = text.lower()
+
+    def matches(self, filter_type: str, query: str) -> bool:
+        """query ожидается уже приведённым к нижнему регистру"""
+        if filter_type == "active" and self.done:
+            return False
+        if filter_type == "completed" and not self.done:
+            return False
+        return not query or query in self.search_key
+
+
+class TodoStorage:
+    """
+    Задачи в памяти с сохранением в todos.json.
+
+    С исполнителем файл читается через load_async(); до окончания
+    загрузки snapshot() ничего не отдаёт на запись. Каждое изменение
+    увеличивает версию; write() запоминает записанную версию только
+    при успехе, поэтому неудачная запись повторится при следующем снимке.
+    """
+
+    def __init__(self, path: str = "todos.json", executor: Optional[IOExecutor] = None):
+        self.path = path
+        self.items: List[TodoItem] = []
+        self._ids = itertools.count()
+        self._version = 0
+        self._saved_version = 0
+        self._executor = executor
+        self._loaded = False
+        if executor is None:
+            self._load()
+
+    def load_async(self, on_loaded: Callable[[], None]) -> None:
+        """Читает файл в IOExecutor; on_loaded вызывается в потоке Tk"""
+        self._executor.load_async(
+            self.path, lambda future: self._on_loaded(future, on_loaded)
+        )
+
+    def _on_loaded(self, future: Future, on_loaded: Callable[[], None]) -> None:
+        self._load(future)
+        on_loaded()
+
+    def add(self, text: str) -> TodoItem:
+        item = TodoItem(next(self._ids), text)
+        self.items.append(item)
+        self._touch()
+        return item
+
+    def remove(self, item: TodoItem) -> None:
+        if item in self.items:
+            self.items.remove(item)
+            self._touch()
+
+    def set_text(self, item: TodoItem, text: str) -> None:
+        item.text = text
+        item.search_key = text.lower()
+        self._touch()
+
+    def set_done(self, item: TodoItem, done: bool) -> None:
+        item.done = done
+        self._touch()
+
+    def move(self, item: TodoItem, direction: int) -> Optional[TodoItem]:
+        """Меняет задачу местами с соседней; возвращает соседа или None"""
+        index = self.items.index(item)
+        new_index = index + direction
+        if not 0 <= new_index < len(self.items):
+            return None
+
+        neighbor = self.items[new_index]
+        self.items[index], self.items[new_index] = neighbor, item
+        self._touch()
+        return neighbor
+
+    def remove_completed(self) -> List[TodoItem]:
+        removed = [item for item in self.items if item.done]
+        if removed:
+            self.items = [item for item in self.items if not item.done]
+            self._touch()
+        return removed
+
+    def save(self) -> None:
+        """Записывает файл атомарно, если с прошлого сохранения были изменения"""
+        data = self.snapshot()
+        if data is not None:
+            self.write(data)
+
+    def snapshot(self) -> Optional[Tuple[int, dict]]:
+        """(версия, копия задач) для записи или None, если всё уже записано"""
+        if self._version == self._saved_version or not self._loaded:
+            return None
+
+        return self._version, {
+            "tasks": [{"text": item.text, "done": item.done} for item in self.items]
+        }
+
+    def write(self, data: Tuple[int, dict]) -> None:
+        """Атомарная запись снимка; безопасна для фонового потока"""
+        version, document = data
+        try:
+            atomic_write_text(
+                self.path, json.dumps(document, ensure_ascii=False, indent=2)
+            )
+        except Exception as e:
+            print(f"Ошибка сохранения задач: {e}")
+            return
+        self._saved_version = max(self._saved_version, version)
+
+    def _touch(self) -> None:
+        self._version += 1
+
+    def _load(self, future: Optional[Future] = None) -> None:
+        """
+        Разбирает todos.json; future - результат чтения из IOExecutor.
+        Задачи, добавленные до загрузки, остаются в конце списка.
+        """
+        self._loaded = True
+        pending, self.items = self.items, []
+        if not pending:
+            self._saved_version = self._version
+
+        try:
+            data = future.result() if future else read_json(self.path)
+        except FileNotFoundError:
+            data = {}
+        except Exception as e:
+            print(f"Ошибка загрузки задач: {e}")
+            data = {}
+
+        for task in data.get("tasks", []):
+            item = TodoItem(next(self._ids), task["text"], task.get("done", False))
+            self.items.append(item)
+        self.items.extend(pending)
@@ -0,0 +1,106 @@
+"""
+Отложенное автосохранение с объединением изменений.
+
+Ключевые особенности:
+- Вкладки регистрируют источник данных (снимок + запись) под ключом и
+  помечают его грязным при каждом изменении
+- Серия изменений за окно (по умолчанию 500 мс) даёт одну запись:
+  один after() на весь сервис, а не таймер на каждое изменение
+- Снимок берётся в главном потоке, сериализация и запись на диск
+  выполняются в IOExecutor по очереди файла; более ранний ещё не
+  записанный снимок того же ключа заменяется новым
+- flush() синхронно дописывает всё накопленное (вызывается в quit_app)
+Связи: MainWindow (владелец), IOExecutor, HabitsTab, MedicationTab,
+TodoListTab
+"""
+
+import threading
+import tkinter as tk
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from utils.io_executor import IOExecutor, get_io_executor
+
+AUTOSAVE_WINDOW_MS = 500
+
+Snapshot = Callable[[], Any]
+Writer = Callable[[Any], None]
+
+
+class AutosaveService:
+    def __init__(
+        self, widget, executor: IOExecutor, window_ms: int = AUTOSAVE_WINDOW_MS
+    ):
+        self._widget = widget
+        self._executor = executor
+        self._window_ms = window_ms
+        self._sources: Dict[str, Tuple[Snapshot, Writer]] = {}
+        self._dirty: Dict[str, None] = {}
+        self._after_id: Optional[str] = None
+        self._pending: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def register(self, key: str, snapshot: Snapshot, write: Writer) -> None:
+        """
+        key - путь к файлу: записи одного файла упорядочены с другими
+        операциями IOExecutor над ним. snapshot() вызывается в главном
+        потоке и возвращает независимую от виджетов копию данных
+        (None - записывать нечего); write(data) выполняется в фоновом потоке.
+        """
+        self._sources[key] = (snapshot, write)
+
+    def mark_dirty(self, key: str) -> None:
+        self._dirty[key] = None
+        if self._after_id is None:
+            self._after_id = self._widget.after(self._window_ms, self._commit)
+
+    def flush(self) -> None:
+        """Снимает все грязные источники и ждёт окончания записи"""
+        if self._after_id is not None:
+            try:
+                self._widget.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+        self._commit()
+        self._executor.wait()
+
+    def _commit(self) -> None:
+        self._after_id = None
+        dirty, self._dirty = self._dirty, {}
+        for key in dirty:
+            snapshot, _ = self._sources[key]
+            try:
+                data = snapshot()
+            except Exception as e:
+                print(f"Ошибка подготовки автосохранения {key}: {e}")
+                continue
+            if data is not None:
+                self._submit(key, data)
+
+    def _submit(self, key: str, data: Any) -> None:
+        with self._lock:
+            queued = key in self._pending
+            self._pending[key] = data
+        if not queued:
+            self._executor.submit(key, self._write, key)
+
+    def _write(self, key: str) -> None:
+        with self._lock:
+            data = self._pending.pop(key)
+        _, write = self._sources[key]
+        try:
+            write(data)
+        except Exception as e:
+            print(f"Ошибка автосохранения {key}: {e}")
+
+
+def get_autosave(widget) -> AutosaveService:
+    """
+    Возвращает общий сервис автосохранения корневого окна, создавая его
+    при первом обращении. Вызывать из главного потока.
+    """
+    root = widget._root()
+    autosave = getattr(root, "autosave", None)
+    if autosave is None:
+        autosave = AutosaveService(root, get_io_executor(root))
+        root.autosave = autosave
+    return autosave
@@ -1,87 +1,165 @@
-import threading
+"""
+Напоминания о привычках.
+
+Ключевые особенности:
+- Очередь с приоритетом по моменту следующего напоминания вместо опроса
+  всех привычек каждые 30 секунд
+- Момент напоминания считается один раз из окна и интервала привычки
+  и пересчитывается только при её изменении, выполнении или откладывании
+- Один after() в главном потоке Tk, взведённый на ближайший дедлайн
+- Работает от HabitsStore и главного окна, не дожидаясь построения
+  вкладки привычек
+Связи: HabitsStore (данные), MainWindow (владелец), HabitsTab (источник
+изменений), UIDispatcher
+"""
+
+import heapq
+import itertools
+import math
 import time
 import tkinter as tk
 from datetime import datetime, timedelta
 from tkinter import ttk
+from typing import Dict, List, Optional, Tuple
 
-from pygame import mixer
-
+from tabs.habits_model import MINUTES_PER_DAY, Habit
 from utils.constants import SOUNDS
-from utils.sound_utils import SoundPlayer
+from utils.sound_utils import SoundPlayer, audio_engine
+from utils.ui_dispatcher import get_dispatcher
+
+MAX_SLEEP_SECONDS = 15 * 60
+SNOOZE_MINUTES = 5
+
+
+def next_reminder_at(habit: Habit, now: float) -> Optional[float]:
+    """Timestamp следующего напоминания или None, если напоминать не нужно"""
+    if not habit.enabled or not habit.notifications or habit.completed:
+        return None
+
+    end = min(habit.end, MINUTES_PER_DAY - 1)
+    if habit.start > end:
+        return None
+
+    candidate = now
+    if habit.last_reminder is not None:
+        candidate = max(now, habit.last_reminder + habit.interval * 60)
+
+    day = datetime.fromtimestamp(candidate).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    window_start = day + timedelta(minutes=habit.start)
+    if candidate <= (day + timedelta(minutes=end)).timestamp():
+        return max(candidate, window_start.timestamp())
+    return (window_start + timedelta(days=1)).timestamp()
 
 
 class HabitReminder:
-    def __init__(self, parent):
+    def __init__(self, parent, store):
         self.parent = parent
+        self.store = store
         self.sound_player = SoundPlayer()
-
-        if not mixer.get_init():
-            mixer.init()
-        try:
-            self.notification_sound = mixer.Sound(SOUNDS["HABIT_NOTIFICATION"])
-        except:
-            self.notification_sound = None
-            print("Не удалось загрузить habit.mp3")
-
-        self.check_thread = threading.Thread(target=self.check_habits, daemon=True)
-        self.check_thread.start()
-
-    def check_habits(self):
-        while True:
-            current_time = datetime.now()
-
-            for time_name in self.parent.habits:
-                for habit in self.parent.habits[time_name]:
-                    if (
-                        not habit["enabled"]
-                        or not habit.get("notifications", True)
-                        or habit.get("completed", False)
-                    ):
-                        continue
-
-                    try:
-                        start_time = datetime.strptime(
-                            habit["start_time"], "%H:%M"
-                        ).time()
-
-                        if habit["end_time"] == "24:00":
-                            end_time = datetime.strptime("23:59", "%H:%M").time()
-                        else:
-                            end_time = datetime.strptime(
-                                habit["end_time"], "%H:%M"
-                            ).time()
-
-                        if start_time <= current_time.time() <= end_time:
-                            last_reminder = habit.get("last_reminder")
-
-                            if last_reminder is None:
-                                habit["last_reminder"] = current_time
-                                self.show_notification(habit, time_name)
-                                self.parent.save_habits()
-                            else:
-                                if isinstance(last_reminder, str):
-                                    last_reminder = datetime.fromisoformat(
-                                        last_reminder
-                                    )
-
-                                if (
-                                    current_time - last_reminder
-                                ).total_seconds() >= habit["interval"] * 60:
-                                    self.show_notification(habit, time_name)
-                                    habit["last_reminder"] = current_time
-                                    self.parent.save_habits()
-
-                    except ValueError as e:
-                        print(f"Ошибка обработки привычки: {e}")
-                        continue
-
-            time.sleep(30)
+        self.dispatcher = get_dispatcher(parent)
+        self._heap: List[Tuple[float, int, int]] = []
+        self._entries: Dict[int, Tuple[float, int, Habit, str]] = {}
+        self._counter = itertools.count()
+        self._after_id = None
+
+        store.when_loaded(self.rebuild)
+
+    def rebuild(self):
+        """Пересчитывает очередь для всех привычек (загрузка, сброс, удаление групп)"""
+        self._heap = []
+        self._entries = {}
+        for time_name, habits in self.store.habits.items():
+            for habit in habits:
+                self._schedule(habit, time_name)
+        self._arm()
+
+    def reschedule(self, habit, time_name=None):
+        """Пересчитывает напоминание одной привычки после её изменения"""
+        if time_name is None:
+            time_name = self._find_time_name(habit)
+        if time_name is None:
+            self.discard(habit)
+            return
+
+        self._schedule(habit, time_name)
+        self._arm()
+
+    def discard(self, habit):
+        """Убирает привычку из очереди; запись в куче отбрасывается лениво"""
+        self._entries.pop(id(habit), None)
+        self._arm()
+
+    def _find_time_name(self, habit) -> Optional[str]:
+        for time_name, habits in self.store.habits.items():
+            if any(item is habit for item in habits):
+                return time_name
+        return None
+
+    def _schedule(self, habit, time_name):
+        fire_at = next_reminder_at(habit, time.time())
+        if fire_at is None:
+            self._entries.pop(id(habit), None)
+            return
+
+        seq = next(self._counter)
+        self._entries[id(habit)] = (fire_at, seq, habit, time_name)
+        heapq.heappush(self._heap, (fire_at, seq, id(habit)))
+
+    def _is_current(self, item: Tuple[float, int, int]) -> bool:
+        entry = self._entries.get(item[2])
+        return entry is not None and entry[1] == item[1]
+
+    def _arm(self):
+        """Взводит один after() на ближайший актуальный дедлайн"""
+        while self._heap and not self._is_current(self._heap[0]):
+            heapq.heappop(self._heap)
+
+        if self._after_id is not None:
+            self.parent.after_cancel(self._after_id)
+            self._after_id = None
+        if not self._heap:
+            return
+
+        delay = min(max(0.0, self._heap[0][0] - time.time()), MAX_SLEEP_SECONDS)
+        self._after_id = self.parent.after(math.ceil(delay * 1000), self._fire_due)
+
+    def _fire_due(self):
+        """Показывает напоминания, чей срок наступил, и засыпает до следующего"""
+        self._after_id = None
+        now = time.time()
+        while self._heap and self._heap[0][0] <= now:
+            item = heapq.heappop(self._heap)
+            if not self._is_current(item):
+                continue
+
+            _, _, habit, time_name = self._entries.pop(item[2])
+            self._remind(habit, time_name)
+        self._arm()
+
+    def _remind(self, habit, time_name):
+        """Проверяет, что привычка всё ещё ждёт напоминания, и показывает его"""
+        current_time = time.time()
+        fire_at = next_reminder_at(habit, current_time)
+        if fire_at is not None and fire_at <= current_time:
+            habit.last_reminder = current_time
+            self.post_notification(habit, time_name)
+        self._schedule(habit, time_name)
+
+    def post_notification(self, habit, time_name):
+        """Передаёт показ уведомления и сохранение в главный поток"""
+
+        def notify():
+            self.show_notification(habit, time_name)
+            self.store.save()
+
+        self.dispatcher.post(notify, key=("habit_reminder", time_name, habit["name"]))
 
     def show_notification(self, habit, time_name):
         try:
-            if self.notification_sound:
-                self.notification_sound.play(loops=-1)
-            else:
+            sound = SOUNDS["HABIT_NOTIFICATION"]
+            if not audio_engine.play(sound, owner=self, loops=-1):
                 self.sound_player.play_notification()
 
             notification = tk.Toplevel(self.parent)
@@ -121,22 +199,20 @@ class HabitReminder:
             btn_frame.pack(fill=tk.X, pady=(10, 0))
 
             def close_notification():
-                if self.notification_sound:
-                    self.notification_sound.stop()
+                audio_engine.stop(self)
                 notification.destroy()
 
             def snooze():
-                if self.notification_sound:
-                    self.notification_sound.stop()
-                habit["last_reminder"] = datetime.now() - timedelta(
-                    minutes=habit["interval"] - 5
+                audio_engine.stop(self)
+                habit.last_reminder = (
+                    time.time() - (habit.interval - SNOOZE_MINUTES) * 60
                 )
-                self.parent.save_habits()
+                self.reschedule(habit, time_name)
+                self.store.save()
                 notification.destroy()
 
             def start_timer():
-                if self.notification_sound:
-                    self.notification_sound.stop()
+                audio_engine.stop(self)
 
                 if hasattr(self.parent, "parent") and hasattr(
                     self.parent.parent, "timers_tab"
@@ -171,8 +247,7 @@ class HabitReminder:
             ).pack(side=tk.LEFT)
 
             def auto_close():
-                if self.notification_sound:
-                    self.notification_sound.stop()
+                audio_engine.stop(self)
                 notification.destroy()
 
             notification.protocol("WM_DELETE_WINDOW", close_notification)
@@ -180,15 +255,11 @@ class HabitReminder:
 
         except Exception as e:
             print(f"Ошибка при показе уведомления: {e}")
-            if self.notification_sound:
-                self.notification_sound.stop()
+            audio_engine.stop(self)
 
     def __del__(self):
         """Очистка ресурсов при удалении объекта"""
         try:
-            if self.notification_sound:
-                self.notification_sound.stop()
-            if mixer.get_init():
-                mixer.quit()
+            audio_engine.stop(self)
         except:
             pass
@@ -0,0 +1,148 @@
+"""
+Кэш картинок полноэкранного уведомления таймера.
+
+Ключевые особенности:
+- Прозрачность по цветовому ключу делается один раз векторными
+  операциями Pillow (point/ImageChops), без цикла по пикселям
+- Готовый RGBA сохраняется на диск, ключ - mtime исходника и размер экрана
+- Объекты PhotoImage переиспользуются между уведомлениями
+Связи: TimerNotification, MainWindow (прогрев кэша)
+"""
+
+import os
+import tempfile
+import threading
+from typing import Dict, Tuple
+
+from PIL import Image, ImageChops, ImageTk
+
+from utils.constants import IMAGES
+from utils.ui_dispatcher import get_dispatcher
+
+CACHE_DIR = "image_cache"
+KEY_COLOR = (30, 30, 30)
+MAX_IMAGE_SIZE = (1000, 1400)
+
+_images: Dict[Tuple[str, float, int, int], Image.Image] = {}
+_photos: Dict[Tuple[str, float, int, int], ImageTk.PhotoImage] = {}
+
+
+def key_transparency(image: Image.Image, color=KEY_COLOR) -> Image.Image:
+    """Делает прозрачными пиксели цвета color"""
+    image = image.convert("RGBA")
+    red, green, blue, alpha = image.split()
+
+    masks = [
+        channel.point([255 if value == target else 0 for value in range(256)])
+        for channel, target in zip((red, green, blue), color)
+    ]
+    keyed = ImageChops.multiply(ImageChops.multiply(masks[0], masks[1]), masks[2])
+
+    image.putalpha(ImageChops.darker(alpha, ImageChops.invert(keyed)))
+    return image
+
+
+def fit_image(image: Image.Image, screen_size: Tuple[int, int]) -> Image.Image:
+    """Уменьшает картинку, чтобы она влезла в половину экрана"""
+    max_width = min(MAX_IMAGE_SIZE[0], screen_size[0] // 2)
+    max_height = min(MAX_IMAGE_SIZE[1], screen_size[1])
+    ratio = min(max_width / image.size[0], max_height / image.size[1])
+    if ratio >= 1:
+        return image
+
+    new_size = tuple(max(1, int(dim * ratio)) for dim in image.size)
+    return image.resize(new_size, Image.Resampling.LANCZOS)
+
+
+def _cache_path(source: str, mtime: float, screen_size: Tuple[int, int]) -> str:
+    name = os.path.splitext(os.path.basename(source))[0]
+    width, height = screen_size
+    return os.path.join(CACHE_DIR, f"{name}_{int(mtime)}_{width}x{height}.png")
+
+
+def _save_atomic(image: Image.Image, path: str) -> None:
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            image.save(f, format="PNG")
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def _load_or_process(
+    source: str, mtime: float, screen_size: Tuple[int, int]
+) -> Image.Image:
+    path = _cache_path(source, mtime, screen_size)
+    if os.path.exists(path):
+        try:
+            with Image.open(path) as cached:
+                return cached.convert("RGBA")
+        except OSError as e:
+            print(f"Ошибка чтения кэша картинки: {e}")
+
+    with Image.open(source) as original:
+        image = key_transparency(fit_image(original, screen_size))
+
+    try:
+        _save_atomic(image, path)
+    except OSError as e:
+        print(f"Ошибка сохранения кэша картинки: {e}")
+    return image
+
+
+def load_processed_image(source: str, screen_size: Tuple[int, int]) -> Image.Image:
+    """Возвращает обработанную картинку из памяти, дискового кэша или готовит её"""
+    mtime = os.path.getmtime(source)
+    key = (source, mtime, *screen_size)
+
+    image = _images.get(key)
+    if image is None:
+        image = _load_or_process(source, mtime, screen_size)
+        _images[key] = image
+    return image
+
+
+def get_photo(widget, source: str) -> ImageTk.PhotoImage:
+    """Возвращает PhotoImage для source, создавая его один раз на экран"""
+    screen_size = (widget.winfo_screenwidth(), widget.winfo_screenheight())
+    key = (source, os.path.getmtime(source), *screen_size)
+
+    photo = _photos.get(key)
+    if photo is None:
+        image = load_processed_image(source, screen_size)
+        photo = ImageTk.PhotoImage(image, master=widget)
+        _photos[key] = photo
+    return photo
+
+
+def get_notification_images(widget) -> Tuple[ImageTk.PhotoImage, ImageTk.PhotoImage]:
+    return (
+        get_photo(widget, IMAGES["LEFT_IMAGE"]),
+        get_photo(widget, IMAGES["RIGHT_IMAGE"]),
+    )
+
+
+def warm_up(widget) -> None:
+    """
+    Заранее готовит картинки, чтобы первое уведомление открылось сразу.
+
+    Обработка Pillow идёт в фоновом потоке, PhotoImage создаётся
+    в главном потоке через диспетчер.
+    """
+    screen_size = (widget.winfo_screenwidth(), widget.winfo_screenheight())
+    dispatcher = get_dispatcher(widget)
+
+    def prepare():
+        try:
+            for source in (IMAGES["LEFT_IMAGE"], IMAGES["RIGHT_IMAGE"]):
+                load_processed_image(source, screen_size)
+        except Exception as e:
+            print(f"Ошибка подготовки картинок уведомления: {e}")
+            return
+        dispatcher.post(lambda: get_notification_images(widget))
+
+    threading.Thread(target=prepare, daemon=True).start()
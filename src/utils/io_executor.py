@@ -0,0 +1,150 @@
+"""
+Фоновый ввод-вывод для JSON-хранилищ.
+
+Ключевые особенности:
+- Общий пул потоков: чтение и запись файлов не блокируют цикл Tk
+- Операции с одним ключом (обычно путь к файлу) выполняются строго по
+  очереди в порядке постановки, разные файлы - параллельно
+- submit/load_async/save_async возвращают Future; callback получает
+  завершённый Future и вызывается в потоке Tk через UIDispatcher
+- wait() дожидается всех поставленных операций (выход из приложения)
+Связи: MainWindow (владелец), AutosaveService, SettingsTab, хранилища вкладок
+"""
+
+import collections
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from typing import Any, Callable, Deque, Dict, Hashable, Optional, Tuple
+
+from utils.journal_storage import atomic_write_text
+from utils.ui_dispatcher import UIDispatcher, get_dispatcher
+
+IO_WORKERS = 4
+
+Callback = Callable[[Future], None]
+Task = Tuple[Future, Callable[..., Any], tuple]
+
+
+def read_json(path: str) -> Any:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_json(path: str, data: Any) -> None:
+    atomic_write_text(path, json.dumps(data, ensure_ascii=False, indent=2))
+
+
+def log_errors(message: str) -> Callback:
+    """callback для submit, который печатает ошибку фоновой операции"""
+
+    def callback(future: Future) -> None:
+        error = future.exception()
+        if error is not None:
+            print(f"{message}: {error}")
+
+    return callback
+
+
+class IOExecutor:
+    def __init__(
+        self,
+        dispatcher: Optional[UIDispatcher] = None,
+        max_workers: int = IO_WORKERS,
+    ):
+        self._dispatcher = dispatcher
+        self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix="io")
+        self._lock = threading.Lock()
+        self._chains: Dict[Hashable, Deque[Task]] = {}
+
+    def submit(
+        self,
+        key: Hashable,
+        fn: Callable[..., Any],
+        *args: Any,
+        callback: Optional[Callback] = None,
+    ) -> Future:
+        """
+        Ставит fn(*args) в очередь ключа key и возвращает Future.
+
+        callback(future) вызывается после завершения; при наличии
+        диспетчера - в потоке Tk.
+        """
+        future: Future = Future()
+        if callback is not None:
+            future.add_done_callback(lambda done: self._deliver(callback, done))
+
+        with self._lock:
+            chain = self._chains.get(key)
+            idle = chain is None
+            if idle:
+                chain = self._chains[key] = collections.deque()
+            chain.append((future, fn, args))
+
+        if idle:
+            self._pool.submit(self._drain, key)
+        return future
+
+    def load_async(
+        self,
+        path: str,
+        callback: Optional[Callback] = None,
+        loader: Callable[[str], Any] = read_json,
+    ) -> Future:
+        return self.submit(path, loader, path, callback=callback)
+
+    def save_async(
+        self,
+        path: str,
+        data: Any,
+        callback: Optional[Callback] = None,
+        writer: Callable[[str, Any], None] = write_json,
+    ) -> Future:
+        """data должна быть снимком: после вызова её нельзя менять"""
+        return self.submit(path, writer, path, data, callback=callback)
+
+    def wait(self) -> None:
+        """Дожидается окончания всех уже поставленных операций"""
+        with self._lock:
+            keys = list(self._chains)
+        wait_futures([self.submit(key, lambda: None) for key in keys])
+
+    def shutdown(self) -> None:
+        self.wait()
+        self._pool.shutdown(wait=True)
+
+    def _drain(self, key: Hashable) -> None:
+        while True:
+            with self._lock:
+                chain = self._chains[key]
+                if not chain:
+                    del self._chains[key]
+                    return
+                future, fn, args = chain.popleft()
+
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def _deliver(self, callback: Callback, future: Future) -> None:
+        if self._dispatcher is None:
+            callback(future)
+            return
+        self._dispatcher.post(lambda: callback(future))
+
+
+def get_io_executor(widget) -> IOExecutor:
+    """
+    Возвращает общий исполнитель ввода-вывода корневого окна, создавая
+    его при первом обращении. Вызывать из главного потока.
+    """
+    root = widget._root()
+    executor = getattr(root, "io_executor", None)
+    if executor is None:
+        executor = IOExecutor(get_dispatcher(root))
+        root.io_executor = executor
+    return executor
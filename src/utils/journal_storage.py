@@ -0,0 +1,243 @@
+"""
+Журнальное хранилище JSON-документов.
+
+Ключевые особенности:
+- Изменение дописывается в <файл>.journal одной строкой JSON
+  вместо перезаписи всего файла; пока снимка нет, он создаётся сразу
+- Журнал периодически сворачивается в снимок в фоновом потоке
+- Снимок пишется атомарно: временный файл + os.replace
+- Недописанная после сбоя последняя строка журнала отрезается при
+  загрузке, чтобы следующая запись не склеилась с ней
+- Существующие JSON-файлы читаются как исходный снимок и при первом
+  сворачивании переписываются в компактном виде
+Связи: CalorieStorage, PushupStorage, HabitsTab, MedicationTab;
+load/commit/sync вызываются из IOExecutor по очереди файла
+"""
+
+import copy
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+COMPACT_THRESHOLD = 500
+
+
+def atomic_write_text(path: str, text: str) -> None:
+    """Записывает файл целиком через временный файл и os.replace"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+class JournalStorage:
+    """
+    JSON-документ в виде снимка и журнала изменений.
+
+    Запись журнала - {"op": "set"|"del", "path": [...], "value": ...}, где
+    path - цепочка ключей вложенных словарей. Записи идемпотентны, поэтому
+    повторное применение журнала поверх свежего снимка безопасно.
+    """
+
+    def __init__(self, path: str, compact_threshold: int = COMPACT_THRESHOLD):
+        self._path = path
+        self._journal_path = f"{path}.journal"
+        self._compact_threshold = compact_threshold
+        self._lock = threading.Lock()
+        self._document: Any = None
+        self._journal_records = 0
+        self._compaction: Optional[threading.Thread] = None
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def modified_time(self) -> Optional[float]:
+        """Время последнего изменения снимка или журнала; None - файлов нет"""
+        times = [
+            os.path.getmtime(path)
+            for path in (self._path, self._journal_path)
+            if os.path.exists(path)
+        ]
+        return max(times) if times else None
+
+    def load(self) -> Any:
+        """
+        Читает снимок, применяет журнал и возвращает копию документа.
+
+        FileNotFoundError - если нет ни снимка, ни журнала.
+        """
+        snapshot_exists = os.path.exists(self._path)
+        journal_exists = os.path.exists(self._journal_path)
+        if not snapshot_exists and not journal_exists:
+            raise FileNotFoundError(self._path)
+
+        with self._lock:
+            self._document = self._read_snapshot() if snapshot_exists else None
+            self._journal_records = self._replay() if journal_exists else 0
+            return copy.deepcopy(self._document)
+
+    def set(self, path: Sequence[str], value: Any) -> None:
+        self.commit([(path, value)])
+
+    def delete(self, path: Sequence[str]) -> None:
+        self.commit([], [path])
+
+    def commit(
+        self,
+        sets: Iterable[Tuple[Sequence[str], Any]],
+        deletes: Iterable[Sequence[str]] = (),
+    ) -> None:
+        """Дописывает пачку изменений в журнал одной операцией записи"""
+        records = [{"op": "del", "path": list(path)} for path in deletes]
+        records += [
+            {"op": "set", "path": list(path), "value": value} for path, value in sets
+        ]
+        self._append(records)
+
+    def sync(self, document: Any, depth: int = 1) -> None:
+        """
+        Сравнивает документ с сохранённым и журналирует только отличия.
+
+        depth - на сколько уровней словарей спускаться: изменения глубже
+        записываются целым поддеревом.
+        """
+        records: List[dict] = []
+        self._diff(self._document, document, [], depth, records)
+        self._append(records)
+
+    def compact(self) -> None:
+        """Сворачивает журнал в снимок"""
+        with self._lock:
+            self._write_snapshot()
+
+    def _write_snapshot(self) -> None:
+        """Пишет снимок и очищает журнал; вызывается под блокировкой"""
+        atomic_write_text(self._path, _dumps(self._document))
+        if os.path.exists(self._journal_path):
+            with open(self._journal_path, "w", encoding="utf-8"):
+                pass
+        self._journal_records = 0
+
+    def _append(self, records: List[dict]) -> None:
+        if not records:
+            return
+
+        lines = [_dumps(record) for record in records]
+        with self._lock:
+            for line in lines:
+                self._apply(json.loads(line))
+
+            if not os.path.exists(self._path):
+                self._write_snapshot()
+                return
+
+            with open(self._journal_path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            self._journal_records += len(lines)
+
+        self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        if self._journal_records < self._compact_threshold:
+            return
+        if self._compaction and self._compaction.is_alive():
+            return
+
+        self._compaction = threading.Thread(target=self._compact_safely, daemon=True)
+        self._compaction.start()
+
+    def _compact_safely(self) -> None:
+        try:
+            self.compact()
+        except Exception as e:
+            print(f"Ошибка сворачивания журнала {self._journal_path}: {e}")
+
+    def _read_snapshot(self) -> Any:
+        with open(self._path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _replay(self) -> int:
+        """
+        Применяет журнал. Недописанная последняя строка (без перевода строки)
+        отрезается; если она всё же целая, к ней дописывается перевод строки.
+        """
+        count = 0
+        complete = 0
+        torn_tail_valid = False
+        with open(self._journal_path, "rb") as f:
+            for line in f:
+                torn = not line.endswith(b"\n")
+                if not line.strip():
+                    complete += len(line)
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    print(f"Пропущена повреждённая запись в {self._journal_path}")
+                    if not torn:
+                        complete += len(line)
+                    continue
+                self._apply(record)
+                count += 1
+                if torn:
+                    torn_tail_valid = True
+                else:
+                    complete += len(line)
+
+        if torn_tail_valid:
+            with open(self._journal_path, "a", encoding="utf-8") as f:
+                f.write("\n")
+        elif complete < os.path.getsize(self._journal_path):
+            os.truncate(self._journal_path, complete)
+        return count
+
+    def _apply(self, record: dict) -> None:
+        path = record["path"]
+        if not path:
+            self._document = record.get("value")
+            return
+
+        if not isinstance(self._document, dict):
+            self._document = {}
+
+        node = self._document
+        for key in path[:-1]:
+            if not isinstance(node.get(key), dict):
+                node[key] = {}
+            node = node[key]
+
+        if record["op"] == "set":
+            node[path[-1]] = record["value"]
+        else:
+            node.pop(path[-1], None)
+
+    def _diff(
+        self, old: Any, new: Any, path: List[str], depth: int, records: List[dict]
+    ) -> None:
+        if depth <= 0 or not isinstance(old, dict) or not isinstance(new, dict):
+            if old != new:
+                records.append({"op": "set", "path": path, "value": new})
+            return
+
+        for key in old:
+            if key not in new:
+                records.append({"op": "del", "path": path + [key]})
+
+        for key, value in new.items():
+            if key not in old:
+                records.append({"op": "set", "path": path + [key], "value": value})
+            else:
+                self._diff(old[key], value, path + [key], depth - 1, records)
@@ -1,28 +1,284 @@
 import platform
 import os
+import shutil
 import time
 import threading
-import pygame
-from pygame import mixer
 import subprocess
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
 
 if platform.system() == "Windows":
     import winsound
 
+SOUND_CACHE_SIZE = 16
+MIXER_CHANNELS = 8
+MAX_MIXER_CHANNELS = 64
+
+FREEDESKTOP_SOUNDS = "/usr/share/sounds/freedesktop/stereo"
+SYSTEM_SOUNDS = {
+    "complete": os.path.join(FREEDESKTOP_SOUNDS, "complete.oga"),
+    "message": os.path.join(FREEDESKTOP_SOUNDS, "message.oga"),
+}
+
+# Команды читаются построчно: "play <путь>" и "stop". Пока предыдущий
+# звук ещё играет, новый play пропускается - звенящие таймеры не плодят
+# процессы paplay
+PAPLAY_HELPER_SCRIPT = """
+pid=
+while read -r cmd path; do
+  case "$cmd" in
+    play)
+      if [ -z "$pid" ] || ! kill -0 "$pid" 2>/dev/null; then
+        paplay "$path" &
+        pid=$!
+      fi
+      ;;
+    stop)
+      [ -n "$pid" ] && kill "$pid" 2>/dev/null
+      pid=
+      ;;
+  esac
+done
+[ -n "$pid" ] && kill "$pid" 2>/dev/null
+"""
+
+
+def get_mixer():
+    """pygame.mixer, импортируемый при первом обращении: pygame грузится долго"""
+    from pygame import mixer
+
+    return mixer
+
+
+class AudioEngine:
+    """
+    Общий звуковой движок приложения.
+
+    mixer инициализируется один раз и не перезапускается при остановке
+    звука. Декодированные mixer.Sound хранятся в LRU-кэше по пути, поэтому
+    повторный сигнал - это только вызов Channel.play. Каждый владелец
+    (таймер, напоминание) получает свой канал: несколько таймеров звенят
+    одновременно, и остановка одного не глушит остальные.
+    """
+
+    def __init__(
+        self,
+        mixer_loader: Callable[[], Any] = get_mixer,
+        cache_size: int = SOUND_CACHE_SIZE,
+        channels: int = MIXER_CHANNELS,
+        max_channels: int = MAX_MIXER_CHANNELS,
+    ):
+        self._mixer_loader = mixer_loader
+        self._cache_size = cache_size
+        self._initial_channels = channels
+        self._max_channels = max_channels
+        self._mixer = None
+        self._failed = False
+        self._sounds: "OrderedDict[str, Any]" = OrderedDict()
+        self._channels: Dict[Hashable, Tuple[int, Any]] = {}
+        self._lock = threading.RLock()
+
+    def ensure_init(self) -> bool:
+        """Инициализирует mixer при первом вызове; False - звук недоступен"""
+        with self._lock:
+            if self._mixer is not None:
+                return True
+            if self._failed:
+                return False
+            try:
+                mixer = self._mixer_loader()
+                if not mixer.get_init():
+                    mixer.init()
+                mixer.set_num_channels(self._initial_channels)
+            except Exception as e:
+                print(f"Ошибка инициализации mixer: {e}")
+                self._failed = True
+                return False
+            self._mixer = mixer
+            return True
+
+    def get_sound(self, path: str) -> Optional[Any]:
+        """Декодированный звук из кэша; None, если файл не читается"""
+        with self._lock:
+            sound = self._sounds.get(path)
+            if sound is not None:
+                self._sounds.move_to_end(path)
+                return sound
+            if not self.ensure_init():
+                return None
+            try:
+                sound = self._mixer.Sound(path)
+            except Exception as e:
+                print(f"Ошибка загрузки звука {path}: {e}")
+                return None
+            self._sounds[path] = sound
+            if len(self._sounds) > self._cache_size:
+                self._sounds.popitem(last=False)
+            return sound
+
+    def preload(self, path: str) -> None:
+        self.get_sound(path)
+
+    def play(self, path: str, owner: Hashable, loops: int = 0) -> bool:
+        """
+        Проигрывает звук на канале владельца, заменяя его прежний звук.
+        Возвращает False, если звук воспроизвести не удалось.
+        """
+        with self._lock:
+            sound = self.get_sound(path)
+            if sound is None:
+                return False
+            self.stop(owner)
+            index, channel = self._free_channel()
+            try:
+                channel.play(sound, loops=loops)
+            except Exception as e:
+                print(f"Ошибка воспроизведения звука: {e}")
+                return False
+            self._channels[owner] = (index, channel)
+            return True
+
+    def is_playing(self, owner: Hashable) -> bool:
+        with self._lock:
+            entry = self._channels.get(owner)
+            return entry is not None and entry[1].get_busy()
+
+    def stop(self, owner: Hashable) -> None:
+        """Мгновенно глушит только звук этого владельца"""
+        with self._lock:
+            entry = self._channels.pop(owner, None)
+            if entry is None:
+                return
+            try:
+                entry[1].stop()
+            except Exception:
+                pass
+
+    def quit(self) -> None:
+        with self._lock:
+            self._channels.clear()
+            self._sounds.clear()
+            if self._mixer is None:
+                return
+            try:
+                self._mixer.quit()
+            except Exception:
+                pass
+            self._mixer = None
+
+    def _free_channel(self) -> Tuple[int, Any]:
+        # Каналы доигравших разовых звуков возвращаются в общий пул
+        for owner, (_, channel) in list(self._channels.items()):
+            if not channel.get_busy():
+                del self._channels[owner]
+
+        reserved = {index for index, _ in self._channels.values()}
+        count = self._mixer.get_num_channels()
+        for index in range(count):
+            channel = self._mixer.Channel(index)
+            if index not in reserved and not channel.get_busy():
+                return index, channel
+
+        if count < self._max_channels:
+            self._mixer.set_num_channels(min(count * 2, self._max_channels))
+            return count, self._mixer.Channel(count)
+
+        # Все каналы заняты: освобождаем самый старый
+        owner = next(iter(self._channels))
+        index, channel = self._channels.pop(owner)
+        channel.stop()
+        return index, channel
+
+
+audio_engine = AudioEngine()
+
+
+class SystemSoundHelper:
+    """
+    Постоянный процесс-помощник для paplay, если mixer недоступен.
+
+    Процесс запускается при первом звуке и получает команды через pipe:
+    play не ждёт окончания звука, stop глушит его сразу. Помощник играет
+    один звук на всех, поэтому stop(owner) глушит его, только если owner
+    последним вызвал play.
+    """
+
+    def __init__(self, command=("sh", "-c", PAPLAY_HELPER_SCRIPT)):
+        self._command = list(command)
+        self._process: Optional[subprocess.Popen] = None
+        self._available: Optional[bool] = None
+        self._owner: Optional[Hashable] = None
+        self._lock = threading.Lock()
+
+    def play(self, path: str, owner: Optional[Hashable] = None) -> bool:
+        """False - paplay недоступен и звук не поставлен"""
+        self._owner = owner
+        return self._send(f"play {path}")
+
+    def stop(self, owner: Optional[Hashable] = None) -> None:
+        """Без owner глушит звук безусловно"""
+        if owner is not None and owner is not self._owner:
+            return
+        self._owner = None
+        if self._process is not None:
+            self._send("stop")
+
+    def close(self) -> None:
+        with self._lock:
+            process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+
+    def _send(self, command: str) -> bool:
+        with self._lock:
+            process = self._ensure_process()
+            if process is None:
+                return False
+            try:
+                process.stdin.write(command + "\n")
+                process.stdin.flush()
+            except (OSError, ValueError):
+                self._process = None
+                return False
+            return True
+
+    def _ensure_process(self) -> Optional[subprocess.Popen]:
+        if self._process is not None and self._process.poll() is None:
+            return self._process
+        if self._available is None:
+            self._available = shutil.which("paplay") is not None
+        if not self._available:
+            return None
+        try:
+            self._process = subprocess.Popen(
+                self._command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        except OSError as e:
+            print(f"Ошибка запуска помощника звука: {e}")
+            self._available = False
+            self._process = None
+        return self._process
+
+
+system_sound_helper = SystemSoundHelper()
+
 
 class SoundPlayer:
     def __init__(self):
         self.system = platform.system()
-        self.init_mixer()
         self.is_playing = False
         self.stop_flag = False
 
     def init_mixer(self):
-        if not mixer.get_init():
-            try:
-                mixer.init()
-            except Exception as e:
-                print(f"Ошибка инициализации mixer: {e}")
+        return audio_engine.ensure_init()
 
     def play_beep(self, frequency=1000, duration=1000):
         self.is_playing = True
@@ -34,35 +290,35 @@ class SoundPlayer:
             except ImportError:
                 print("\a")
         else:
-            try:
-                subprocess.run(
-                    ["paplay", "/usr/share/sounds/freedesktop/stereo/complete.oga"]
-                )
-            except:
-                print("\a")
+            self.play_system_sound(SYSTEM_SOUNDS["complete"])
 
         if not self.stop_flag:
             self.is_playing = False
 
+    def play_beep_loop(self):
+        """
+        Зацикленный сигнал на канале mixer. False - mixer недоступен,
+        и вызывающий повторяет play_beep сам.
+        """
+        if self.system == "Windows":
+            return False
+        return audio_engine.play(SYSTEM_SOUNDS["complete"], owner=self, loops=-1)
+
+    def play_system_sound(self, path):
+        """
+        Не блокирует: .oga декодируется один раз и играет через mixer,
+        иначе звук ставится в очередь помощника paplay.
+        """
+        if audio_engine.play(path, owner=self):
+            return
+        if not system_sound_helper.play(path, owner=self):
+            print("\a")
+
     def stop(self):
         self.stop_flag = True
         self.is_playing = False
-
-        try:
-            if mixer.get_init():
-                mixer.music.stop()
-                mixer.stop()
-                mixer.quit()
-        except:
-            pass
-
-        try:
-            mixer.init()
-            mixer.music.stop()
-            mixer.stop()
-            mixer.quit()
-        except:
-            pass
+        audio_engine.stop(self)
+        system_sound_helper.stop(self)
 
     def play_notification(self):
         if self.system == "Windows":
@@ -71,20 +327,8 @@ class SoundPlayer:
             except ImportError:
                 print("\a")
         else:
-            try:
-                subprocess.run(
-                    ["paplay", "/usr/share/sounds/freedesktop/stereo/message.oga"]
-                )
-            except:
-                print("\a")
+            self.play_system_sound(SYSTEM_SOUNDS["message"])
 
     def play_custom_sound(self, sound_file):
-        try:
-            if mixer.get_init():
-                sound = mixer.Sound(sound_file)
-                sound.play()
-            else:
-                self.play_notification()
-        except Exception as e:
-            print(f"Ошибка воспроизведения звука: {e}")
+        if not audio_engine.play(sound_file, owner=self):
             self.play_notification()
@@ -0,0 +1,68 @@
+"""
+Профилирование холодного старта.
+
+Ключевые особенности:
+- Включается флагом --profile-startup в main.py, иначе phase() ничего
+  не измеряет
+- Фазы (импорты, тема, вкладки, трей, первая отрисовка) записываются
+  в порядке завершения; вкладки, построенные после старта, печатаются
+  отдельной строкой при построении
+- Модуль без тяжёлых зависимостей: импортируется раньше всего остального
+Связи: main.py, MainWindow, LazyNotebook
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Tuple
+
+STARTUP_TARGET_MS = 1000
+
+
+class StartupProfiler:
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.enabled = False
+        self.finished = False
+        self.phases: List[Tuple[str, float]] = []
+        self._clock = clock
+        self._start = clock()
+
+    def enable(self) -> None:
+        self.enabled = True
+        self._start = self._clock()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.record(name, self._clock() - start)
+
+    def record(self, name: str, seconds: float) -> None:
+        if self.finished:
+            print(f"[старт] {name}: {seconds * 1000:.1f} мс")
+            return
+        self.phases.append((name, seconds))
+
+    def now(self) -> float:
+        return self._clock()
+
+    def finish(self) -> str:
+        """Завершает холодный старт и возвращает отчёт по фазам"""
+        self.finished = True
+        total_ms = (self._clock() - self._start) * 1000
+        width = max((len(name) for name, _ in self.phases), default=0)
+
+        lines = ["Холодный старт:"]
+        for name, seconds in self.phases:
+            lines.append(f"  {name:<{width}}  {seconds * 1000:8.1f} мс")
+        verdict = "в пределах цели" if total_ms <= STARTUP_TARGET_MS else "выше цели"
+        lines.append(f"  Итого: {total_ms:.1f} мс ({verdict} {STARTUP_TARGET_MS} мс)")
+        return "\n".join(lines)
+
+
+profiler = StartupProfiler()
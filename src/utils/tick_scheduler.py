@@ -0,0 +1,101 @@
+"""
+Единый планировщик тиков для всех таймеров.
+
+Ключевые особенности:
+- Работает в главном потоке Tk через after(), без отдельных потоков
+- Хранит дедлайны time.monotonic() в куче и просыпается один раз
+  для всех сработавших задач
+- Всегда взведён ровно один after() на ближайший дедлайн
+Связи: MainWindow (владелец), Timer (подписчик)
+"""
+
+import heapq
+import itertools
+import math
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+DUE_TOLERANCE = 0.001
+
+
+class TickScheduler:
+    def __init__(self, widget, clock: Callable[[], float] = time.monotonic):
+        self._widget = widget
+        self._clock = clock
+        self._heap: List[Tuple[float, int]] = []
+        self._callbacks: Dict[int, Callable[[], None]] = {}
+        self._handles = itertools.count(1)
+        self._after_id: Optional[str] = None
+        self._armed_deadline: Optional[float] = None
+
+    def now(self) -> float:
+        return self._clock()
+
+    def call_at(self, deadline: float, callback: Callable[[], None]) -> int:
+        """Планирует callback на монотонный момент deadline, возвращает handle"""
+        handle = next(self._handles)
+        self._callbacks[handle] = callback
+        heapq.heappush(self._heap, (deadline, handle))
+        self._arm()
+        return handle
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> int:
+        return self.call_at(self.now() + delay, callback)
+
+    def cancel(self, handle: Optional[int]) -> None:
+        """Отменяет задачу; запись в куче удаляется лениво при следующем проходе"""
+        if handle is None:
+            return
+        self._callbacks.pop(handle, None)
+
+    def pending_count(self) -> int:
+        return len(self._callbacks)
+
+    def _drop_cancelled(self) -> None:
+        while self._heap and self._heap[0][1] not in self._callbacks:
+            heapq.heappop(self._heap)
+
+    def _arm(self) -> None:
+        self._drop_cancelled()
+        if not self._heap:
+            return
+
+        deadline = self._heap[0][0]
+        if self._armed_deadline is not None and self._armed_deadline <= deadline:
+            return
+
+        if self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+
+        delay_ms = max(0, math.ceil((deadline - self.now()) * 1000))
+        self._armed_deadline = deadline
+        self._after_id = self._widget.after(delay_ms, self._run)
+
+    def _pop_due(self) -> List[Callable[[], None]]:
+        limit = self.now() + DUE_TOLERANCE
+        due = []
+        while self._heap and self._heap[0][0] <= limit:
+            _, handle = heapq.heappop(self._heap)
+            callback = self._callbacks.pop(handle, None)
+            if callback:
+                due.append(callback)
+        return due
+
+    def _run(self) -> None:
+        """
+        Выполняет все сработавшие задачи за один проход.
+
+        Следующий after() взводится до вызова callback'ов: обработчик может
+        запустить вложенный цикл событий (wait_window), и остальные таймеры
+        не должны при этом останавливаться.
+        """
+        self._after_id = None
+        self._armed_deadline = None
+        due = self._pop_due()
+        self._arm()
+
+        for callback in due:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Ошибка в задаче планировщика: {e}")
@@ -1,11 +1,9 @@
 import tkinter as tk
 from tkinter import ttk
 
-from PIL import Image, ImageTk
-from pygame import mixer
 import threading
 
-from utils.constants import IMAGES
+from utils.image_cache import get_notification_images
 
 
 class TimerNotification(tk.Toplevel):
@@ -40,33 +38,7 @@ class TimerNotification(tk.Toplevel):
         right_image_frame.place(relx=0.9, rely=0.5, anchor="center")
 
         try:
-            left_pil = Image.open(IMAGES["LEFT_IMAGE"]).convert("RGBA")
-            right_pil = Image.open(IMAGES["RIGHT_IMAGE"]).convert("RGBA")
-
-            new_size = (1000, 1400)
-
-            def resize_image(image, max_size):
-                ratio = min(max_size[0] / image.size[0], max_size[1] / image.size[1])
-                new_size = tuple(int(dim * ratio) for dim in image.size)
-                return image.resize(new_size, Image.Resampling.LANCZOS)
-
-            left_pil = Image.open(IMAGES["LEFT_IMAGE"]).convert("RGBA")
-            right_pil = Image.open(IMAGES["RIGHT_IMAGE"]).convert("RGBA")
-
-            def process_transparency(image):
-                data = image.getdata()
-                new_data = [
-                    (30, 30, 30, 0) if item[:3] == (30, 30, 30) else item
-                    for item in data
-                ]
-                image.putdata(new_data)
-                return image
-
-            left_pil = process_transparency(left_pil)
-            right_pil = process_transparency(right_pil)
-
-            left_image = ImageTk.PhotoImage(left_pil)
-            right_image = ImageTk.PhotoImage(right_pil)
+            left_image, right_image = get_notification_images(self)
 
             left_label = tk.Label(
                 left_image_frame,
@@ -267,15 +239,16 @@ class TimerNotification(tk.Toplevel):
                 button_frame.grid(row=row, column=col, padx=5, pady=5, sticky="nsew")
                 button_frame.grid_columnconfigure(0, weight=1)
 
-                hours = int(timer.hours.get() or 0)
-                minutes = int(timer.minutes.get() or 0)
-                seconds = int(timer.seconds.get() or 0)
+                duration = timer.engine.duration
+                hours = duration // 3600
+                minutes = duration % 3600 // 60
+                seconds = duration % 60
                 time_str = f"{hours}:{minutes:02d}:{seconds:02d}"
 
                 shortcut_num = i + 1
                 btn = tk.Button(
                     button_frame,
-                    text=f"{timer.description.get()}\n{time_str}\nCTRL + {shortcut_num}",
+                    text=f"{timer.description}\n{time_str}\nCTRL + {shortcut_num}",
                     command=lambda t=timer: self.start_next_timer(t),
                     font=("Segoe UI", 12),
                     bg="#2C2C2C",
@@ -334,13 +307,10 @@ class TimerNotification(tk.Toplevel):
         self.sound_btn.configure(text="🔊" if self.sound_enabled else "🔈")
 
         if not self.sound_enabled:
-            if mixer.get_init():
-                mixer.music.stop()
             if self.current_timer:
-                self.current_timer.is_running = False
+                self.current_timer.stop_alarm()
         else:
             if self.current_timer:
-                self.current_timer.is_running = True
                 self.current_timer.play_alarm()
 
     def quick_pushup(self):
@@ -513,21 +483,12 @@ class TimerNotification(tk.Toplevel):
         parent = self.parent
         temp_timer = self.current_timer
 
-        temp_timer.hours.set("0")
-        temp_timer.minutes.set(str(minutes))
-        temp_timer.seconds.set("0")
-        temp_timer.paused_time = 0
-
-        total_seconds = minutes * 60
-        temp_timer.remaining_time = total_seconds
-        temp_timer.initial_time = total_seconds
-
         self.destroy()
 
         def delayed_start():
             temp_timer.stop_alarm()
 
-            temp_timer.start_timer()
+            temp_timer.engine.snooze(minutes * 60)
 
         parent.after(200, delayed_start)
 
@@ -552,7 +513,7 @@ class TimerNotification(tk.Toplevel):
             self.current_timer.main_window = None
             timer.main_window = existing_window
             existing_window.timer = timer
-            existing_window.description_label.configure(text=timer.description.get())
+            existing_window.description_label.configure(text=timer.display_title())
             existing_window.draw_progress()
 
         timer.start_timer()
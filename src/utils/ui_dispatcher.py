@@ -0,0 +1,92 @@
+"""
+Диспетчер изменений UI из фоновых потоков.
+
+Ключевые особенности:
+- Фоновые потоки не трогают виджеты напрямую, а кладут callback в очередь
+- Очередь без блокировок: deque.append/popleft атомарны под GIL
+- Один периодический after() в главном потоке применяет изменения пачкой
+- Повторные обновления с одним ключом схлопываются: за кадр
+  выполняется только последнее
+Связи: MainWindow (владелец), HabitReminder, иконка в трее
+"""
+
+import collections
+import tkinter as tk
+from typing import Callable, Deque, Dict, Hashable, Optional, Tuple
+
+PUMP_INTERVAL_MS = 33
+
+
+class UIDispatcher:
+    def __init__(self, widget, interval_ms: int = PUMP_INTERVAL_MS):
+        self._widget = widget
+        self._interval_ms = interval_ms
+        self._queue: Deque[Tuple[Optional[Hashable], Optional[Callable]]] = (
+            collections.deque()
+        )
+        self._latest: Dict[Hashable, Callable[[], None]] = {}
+        self._after_id: Optional[str] = None
+
+    def post(
+        self, callback: Callable[[], None], key: Optional[Hashable] = None
+    ) -> None:
+        """
+        Ставит изменение UI в очередь; безопасно вызывать из любого потока.
+
+        Если указан key, более ранние невыполненные изменения с тем же
+        ключом заменяются этим.
+        """
+        if key is None:
+            self._queue.append((None, callback))
+            return
+
+        self._latest[key] = callback
+        self._queue.append((key, None))
+
+    def start(self) -> None:
+        if self._after_id is None:
+            self._after_id = self._widget.after(self._interval_ms, self._pump)
+
+    def stop(self) -> None:
+        if self._after_id is None:
+            return
+        try:
+            self._widget.after_cancel(self._after_id)
+        except tk.TclError:
+            pass
+        self._after_id = None
+
+    def flush(self) -> None:
+        """Выполняет всё, что накопилось в очереди к текущему моменту"""
+        for _ in range(len(self._queue)):
+            key, callback = self._queue.popleft()
+            if key is not None:
+                callback = self._latest.pop(key, None)
+            if callback is None:
+                continue
+
+            try:
+                callback()
+            except tk.TclError:
+                pass
+            except Exception as e:
+                print(f"Ошибка применения изменения UI: {e}")
+
+    def _pump(self) -> None:
+        self._after_id = None
+        self.flush()
+        self.start()
+
+
+def get_dispatcher(widget) -> UIDispatcher:
+    """
+    Возвращает общий диспетчер корневого окна, создавая его при первом
+    обращении. Вызывать из главного потока.
+    """
+    root = widget._root()
+    dispatcher = getattr(root, "ui_dispatcher", None)
+    if dispatcher is None:
+        dispatcher = UIDispatcher(root)
+        dispatcher.start()
+        root.ui_dispatcher = dispatcher
+    return dispatcher
@@ -1,22 +1,24 @@
 import tkinter as tk
 from tkinter import ttk
 
+RING_PADDING = 20
+INNER_PADDING = 10
+EXTENT_PRECISION = 1
+RESIZE_DEBOUNCE_MS = 16
+
 
 class MainTimerWindow(tk.Toplevel):
     def __init__(self, parent, timer):
         super().__init__(parent)
         self.timer = timer
+        self.drawn_extent = None
+        self.drawn_text = None
+        self.resize_after_id = None
+        self.pending_size = None
+        self.layout_size = None
         self.setup_window()
         self.setup_ui()
         self.setup_bindings()
-
-        if not self.timer.initial_time:
-            self.timer.initial_time = (
-                int(self.timer.hours.get() or 0) * 3600
-                + int(self.timer.minutes.get() or 0) * 60
-                + int(self.timer.seconds.get() or 0)
-            )
-
         self.draw_progress()
 
     def is_destroyed(self):
@@ -28,45 +30,40 @@ class MainTimerWindow(tk.Toplevel):
             return True
 
     def draw_progress(self):
+        """Обновляет существующую дугу и надпись, не пересоздавая элементы"""
         try:
-            self.canvas.delete("progress")
+            engine = self.timer.engine
+            progress = engine.progress()
+            extent = round(-359.999 * (1 - progress), EXTENT_PRECISION)
 
-            if self.timer.initial_time and self.timer.initial_time > 0:
-                progress = self.timer.remaining_time / self.timer.initial_time
-            else:
-                progress = 1.0
-
-            progress = max(0, min(1, progress))
-
-            padding = 20
-            x0 = padding
-            y0 = padding
-            x1 = self.canvas_size - padding
-            y1 = self.canvas_size - padding
-
-            self.progress_arc = self.canvas.create_arc(
-                x0,
-                y0,
-                x1,
-                y1,
-                start=90,
-                extent=-359.999 * (1 - progress),
-                fill="#4A90E2",
-                width=2,
-                tags="progress",
-            )
+            if extent != self.drawn_extent:
+                self.canvas.itemconfigure(self.progress_arc, extent=extent)
+                self.drawn_extent = extent
 
             if hasattr(self, "time_label"):
-                hours = self.timer.remaining_time // 3600
-                minutes = (self.timer.remaining_time % 3600) // 60
-                seconds = self.timer.remaining_time % 60
-                self.time_label.configure(
-                    text=f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                )
+                hours = engine.remaining_time // 3600
+                minutes = (engine.remaining_time % 3600) // 60
+                seconds = engine.remaining_time % 60
+                text = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+                if text != self.drawn_text:
+                    self.time_label.configure(text=text)
+                    self.drawn_text = text
 
         except (tk.TclError, AttributeError, TypeError) as e:
             print(f"Ошибка в draw_progress: {e}")
 
+    def layout_canvas(self):
+        """Подгоняет координаты постоянных элементов под размер холста"""
+        x0 = y0 = RING_PADDING
+        x1 = y1 = self.canvas_size - RING_PADDING
+        inner0 = RING_PADDING + INNER_PADDING
+        inner1 = self.canvas_size - inner0
+
+        self.canvas.configure(width=self.canvas_size, height=self.canvas_size)
+        self.canvas.coords(self.background_arc, x0, y0, x1, y1)
+        self.canvas.coords(self.progress_arc, x0, y0, x1, y1)
+        self.canvas.coords(self.inner_circle, inner0, inner0, inner1, inner1)
+
     def setup_window(self):
         self.title("")
         self.attributes("-topmost", True)
@@ -109,11 +106,8 @@ class MainTimerWindow(tk.Toplevel):
 
         self.canvas.place(relx=0.5, rely=0.5, anchor="center")
 
-        padding = 20
-        x0 = padding
-        y0 = padding
-        x1 = self.canvas_size - padding
-        y1 = self.canvas_size - padding
+        x0 = y0 = RING_PADDING
+        x1 = y1 = self.canvas_size - RING_PADDING
 
         self.background_arc = self.canvas.create_arc(
             x0,
@@ -131,7 +125,7 @@ class MainTimerWindow(tk.Toplevel):
             x0, y0, x1, y1, start=90, extent=0, fill="#4A90E2", width=2, tags="progress"
         )
 
-        inner_padding = padding + 10
+        inner_padding = RING_PADDING + INNER_PADDING
         self.inner_circle = self.canvas.create_oval(
             inner_padding,
             inner_padding,
@@ -154,7 +148,7 @@ class MainTimerWindow(tk.Toplevel):
             font=("Roboto", 14),
             bg="#1e1e1e",
             fg="white",
-            text=self.timer.description.get(),
+            text=self.timer.display_title(),
         )
         self.description_label.place(relx=0.5, rely=0.6, anchor="center")
 
@@ -265,49 +259,33 @@ class MainTimerWindow(tk.Toplevel):
             pass
 
     def on_resize(self, event):
-        if event.widget == self:
-            window_width = event.width
-            window_height = event.height
-
-            new_size = min(window_width, window_height) - 100
-            self.canvas_size = max(300, new_size)
-
-            self.canvas.configure(width=self.canvas_size, height=self.canvas_size)
-
-            self.canvas.delete("static")
-            self.canvas.delete("progress")
-
-            padding = 20
-            x0 = padding
-            y0 = padding
-            x1 = self.canvas_size - padding
-            y1 = self.canvas_size - padding
-
-            self.background_arc = self.canvas.create_arc(
-                x0,
-                y0,
-                x1,
-                y1,
-                start=90,
-                extent=359.999,
-                fill="#2D2D2D",
-                width=2,
-                tags="static",
-            )
-
-            inner_padding = padding + 10
-            self.inner_circle = self.canvas.create_oval(
-                inner_padding,
-                inner_padding,
-                self.canvas_size - inner_padding,
-                self.canvas_size - inner_padding,
-                fill="#1A1A1A",
-                tags="static",
-            )
-
-            self.draw_progress()
+        """Копит события <Configure> и перестраивает холст раз в кадр"""
+        if event.widget != self:
+            return
+
+        self.pending_size = (event.width, event.height)
+        if self.resize_after_id is None:
+            self.resize_after_id = self.after(RESIZE_DEBOUNCE_MS, self.apply_resize)
 
+    def apply_resize(self):
+        self.resize_after_id = None
+        if self.pending_size is None:
+            return
+
+        window_width, window_height = self.pending_size
+        self.pending_size = None
+
+        new_size = max(300, min(window_width, window_height) - 100)
+        if new_size == self.layout_size:
+            return
+
+        try:
+            self.canvas_size = new_size
+            self.layout_size = new_size
+            self.layout_canvas()
             self.update_ui()
+        except tk.TclError:
+            pass
 
     def update_ui(self):
         self.time_label.place(relx=0.5, rely=0.45, anchor="center")
@@ -1,34 +1,37 @@
-import json
 import platform
 import threading
 import tkinter as tk
 from tkinter import messagebox, ttk
 
-import pystray
-from PIL import Image, ImageTk
-from pygame import mixer
 from ttkthemes import ThemedTk
 
-from components.timer import Timer
-from tabs.calorie_tracker_tab import CalorieTrackerTab
-from tabs.habits_tab import HabitsTab
-from tabs.medication_tab import MedicationTab
-from tabs.pushup_tracker_tab import PushupTrackerTab
-from tabs.settings_tab import SettingsTab
-from tabs.todo_list_tab import TodoListTab
+from components.lazy_notebook import LazyNotebook
+from components.timer_model import TimerModel
+from components.timer_sequence import long_focus_sequence, pomodoro_sequence
+from components.virtual_timer_list import VirtualTimerList
+from tabs.habits_store import HabitsStore
+from utils.autosave import get_autosave
 from utils.constants import IMAGES
+from utils.habit_reminder import HabitReminder
+from utils.io_executor import get_io_executor, log_errors, read_json, write_json
+from utils.sound_utils import audio_engine, system_sound_helper
+from utils.startup_profiler import profiler
+from utils.tick_scheduler import TickScheduler
+from utils.ui_dispatcher import UIDispatcher
+
+WARM_UP_DELAY_MS = 1000
+TIMERS_CHECKPOINT_MS = 5000
 
 
 class MainWindow(ThemedTk):
     def __init__(self):
         try:
-            with open("theme_settings.json", "r") as f:
-                settings = json.load(f)
-                initial_theme = settings.get("theme", "ubuntu")
+            initial_theme = read_json("theme_settings.json").get("theme", "ubuntu")
         except:
             initial_theme = "ubuntu"
 
-        super().__init__(theme=initial_theme)
+        with profiler.phase("тема"):
+            super().__init__(theme=initial_theme)
         self.selected_theme = initial_theme
         self.create_theme_menu()
         self.is_wsl = self.check_wsl()
@@ -39,10 +42,26 @@ class MainWindow(ThemedTk):
         self.setup_global_styles()
         self.title("Мульти-таймер")
         self.timers = []
+        self.tick_scheduler = TickScheduler(self)
+        self.ui_dispatcher = UIDispatcher(self)
+        self.ui_dispatcher.start()
+        self.io_executor = get_io_executor(self)
+        self.timers_loaded = False
+        self.saved_timers_data = None
+        self.saved_settings = None
+        self.autosave = get_autosave(self)
+        self.autosave.register("timers.json", self.snapshot_timers, self.write_timers)
+        self.after(TIMERS_CHECKPOINT_MS, self.checkpoint_timers)
+        with profiler.phase("напоминания о привычках"):
+            self.habits_store = HabitsStore(self.autosave, self.io_executor)
+            self.habit_reminder = HabitReminder(self, self.habits_store)
+            self.habits_store.load()
         self.setup_ui()
+        self.after(WARM_UP_DELAY_MS, self.warm_up_images)
 
         if not self.is_wsl:
-            self.create_tray_icon()
+            with profiler.phase("трей"):
+                self.create_tray_icon()
 
         window_width = 1050
         window_height = 700
@@ -57,6 +76,12 @@ class MainWindow(ThemedTk):
         else:
             self.protocol("WM_DELETE_WINDOW", self.hide_window)
 
+    def warm_up_images(self):
+        """Готовит картинки уведомлений после старта: PIL грузится долго"""
+        from utils.image_cache import warm_up
+
+        warm_up(self)
+
     def create_theme_menu(self):
         menu_bar = tk.Menu(self)
         self.config(menu=menu_bar)
@@ -77,9 +102,11 @@ class MainWindow(ThemedTk):
             self.set_theme(theme_name)
             self.selected_theme = theme_name
             self.setup_global_styles()
-            with open("theme_settings.json", "w") as f:
-                json.dump({"theme": theme_name}, f)
-
+            self.io_executor.save_async(
+                "theme_settings.json",
+                {"theme": theme_name},
+                callback=log_errors("Ошибка сохранения темы"),
+            )
         except Exception as e:
             messagebox.showerror("Ошибка", f"Не удалось применить тему: {str(e)}")
 
@@ -131,48 +158,119 @@ class MainWindow(ThemedTk):
         self.timers_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.timers_tab, text="Таймеры")
 
-        self.pushups_tab = ttk.Frame(self.notebook)
-        self.notebook.add(self.pushups_tab, text="Отжимания")
+        self.tabs = LazyNotebook(self.notebook)
+        self.pushups_tab = self.tabs.add(
+            "pushups", "Отжимания", self.create_pushups_tab
+        )
+        self.medication_tab = self.tabs.add(
+            "medication", "Таблетки", self.create_medication_tab
+        )
+        self.todo_tab = self.tabs.add("todo", "Задачи", self.create_todo_tab)
+        self.habits_tab = self.tabs.add("habits", "Привычки", self.create_habits_tab)
+        self.calorie_tab = self.tabs.add("calories", "Калории", self.create_calorie_tab)
+        self.settings_tab_frame = self.tabs.add(
+            "settings", "Настройки", self.create_settings_tab
+        )
 
-        self.medication_tab = ttk.Frame(self.notebook)
-        self.notebook.add(self.medication_tab, text="Таблетки")
+        with profiler.phase("вкладка timers"):
+            self.setup_timers_ui()
 
-        self.todo_tab = ttk.Frame(self.notebook)
-        self.notebook.add(self.todo_tab, text="Задачи")
+        style = ttk.Style()
+        style.configure("TNotebook.Tab", focuscolor="none")
 
-        self.habits_tab = ttk.Frame(self.notebook)
-        self.notebook.add(self.habits_tab, text="Привычки")
+        self.timers_tab_index = self.notebook.index(self.timers_tab)
 
-        self.calorie_tab = ttk.Frame(self.notebook)
-        self.notebook.add(self.calorie_tab, text="Калории")
+    # Модули вкладок импортируются при построении вкладки, а не при старте
 
-        self.settings_tab_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.settings_tab_frame, text="Настройки")
+    def create_pushups_tab(self, frame):
+        from tabs.pushup_tracker_tab import PushupTrackerTab
 
-        self.setup_timers_ui()
+        return PushupTrackerTab(frame)
 
-        self.pushup_tracker = PushupTrackerTab(self.pushups_tab)
-        self.pushup_tracker.pack(expand=True, fill=tk.BOTH)
+    def create_medication_tab(self, frame):
+        from tabs.medication_tab import MedicationTab
 
-        self.habits_tracker = HabitsTab(self.habits_tab)
-        self.habits_tracker.pack(expand=True, fill=tk.BOTH)
+        return MedicationTab(frame)
 
-        self.todo_list = TodoListTab(self.todo_tab)
-        self.todo_list.pack(expand=True, fill=tk.BOTH)
+    def create_todo_tab(self, frame):
+        from tabs.todo_list_tab import TodoListTab
 
-        self.medication_tracker = MedicationTab(self.medication_tab)
-        self.medication_tracker.pack(expand=True, fill=tk.BOTH)
+        return TodoListTab(frame)
 
-        self.settings_tab = SettingsTab(self.settings_tab_frame, self)
-        self.settings_tab.pack(expand=True, fill=tk.BOTH)
+    def create_habits_tab(self, frame):
+        from tabs.habits_tab import HabitsTab
 
-        self.calorie_tracker = CalorieTrackerTab(self.calorie_tab, self.settings_tab)
-        self.calorie_tracker.pack(expand=True, fill=tk.BOTH)
+        return HabitsTab(frame, self.habits_store, self.habit_reminder)
 
-        style = ttk.Style()
-        style.configure("TNotebook.Tab", focuscolor="none")
+    def create_calorie_tab(self, frame):
+        from tabs.calorie_tracker_tab import CalorieTrackerTab
 
-        self.timers_tab_index = self.notebook.index(self.timers_tab)
+        # Настройки читаются через окно, чтобы не строить вкладку настроек
+        return CalorieTrackerTab(frame, self)
+
+    def create_settings_tab(self, frame):
+        from tabs.settings_tab import SettingsTab
+
+        return SettingsTab(frame, self)
+
+    @property
+    def pushup_tracker(self):
+        return self.tabs.get("pushups")
+
+    @property
+    def habits_tracker(self):
+        return self.tabs.get("habits")
+
+    @property
+    def todo_list(self):
+        return self.tabs.get("todo")
+
+    @property
+    def medication_tracker(self):
+        return self.tabs.get("medication")
+
+    @property
+    def settings_tab(self):
+        return self.tabs.get("settings")
+
+    def read_settings(self):
+        """
+        settings.json без построения вкладки настроек. Пока вкладка не
+        построена, настройки не меняются, поэтому файл читается один раз.
+        """
+        if self.saved_settings is None:
+            try:
+                self.saved_settings = read_json("settings.json")
+            except FileNotFoundError:
+                self.saved_settings = {}
+            except Exception as e:
+                print(f"Ошибка загрузки настроек: {e}")
+                self.saved_settings = {}
+            if not isinstance(self.saved_settings, dict):
+                self.saved_settings = {}
+        return self.saved_settings
+
+    def get_close_on_exit(self) -> bool:
+        if self.tabs.is_built("settings"):
+            return self.settings_tab.get_close_on_exit()
+        return bool(self.read_settings().get("close_on_exit", True))
+
+    def get_calorie_backend(self) -> str:
+        if self.tabs.is_built("settings"):
+            return self.settings_tab.get_calorie_backend()
+        return self.read_settings().get("calorie_backend", "json")
+
+    def get_target_calories(self) -> int:
+        if self.tabs.is_built("settings"):
+            return self.settings_tab.get_target_calories()
+        try:
+            return int(self.read_settings().get("target_calories", 2000))
+        except (TypeError, ValueError):
+            return 2000
+
+    @property
+    def calorie_tracker(self):
+        return self.tabs.get("calories")
 
     def setup_timers_ui(self):
         self.main_frame = ttk.Frame(self.timers_tab)
@@ -214,33 +312,10 @@ class MainWindow(ThemedTk):
             takefocus=0,
         ).pack(side=tk.RIGHT, padx=5)
 
-        self.timers_frame = ttk.Frame(self.main_frame)
-        self.timers_frame.pack(expand=True, fill=tk.BOTH)
-
-        self.canvas = tk.Canvas(self.timers_frame, bd=0, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(
-            self.timers_frame, orient="vertical", command=self.canvas.yview
-        )
-
-        self.scrollable_frame = ttk.Frame(self.canvas)
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")),
-        )
-
-        self.window_id = self.canvas.create_window(
-            (0, 0),
-            window=self.scrollable_frame,
-            anchor="nw",
-            width=self.timers_frame.winfo_width(),
-        )
-        self.canvas.bind("<Configure>", self._on_canvas_configure)
-        self.canvas.configure(yscrollcommand=scrollbar.set)
-
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # Строки создаются только для видимых таймеров и переиспользуются
+        self.timer_list = VirtualTimerList(self.main_frame, self.timers)
+        self.timer_list.pack(expand=True, fill=tk.BOTH)
+        self.timer_list.bind_all("<MouseWheel>", self._on_mousewheel)
 
         style = ttk.Style()
         style.configure("Accent.TButton", padding=8, font=("Arial", 10, "bold"))
@@ -250,88 +325,55 @@ class MainWindow(ThemedTk):
 
     def _on_mousewheel(self, event):
         """Обработка прокрутки колесиком мыши"""
-        self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        self.timer_list.scroll(int(-1 * (event.delta / 120)))
 
-    def _on_canvas_configure(self, event):
-        self.canvas.itemconfig(self.window_id, width=event.width)
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    def create_timer(self):
+        """Новая модель таймера; строку для неё создаст список при показе"""
+        return TimerModel(self, self.tick_scheduler, on_delete=self.remove_timer)
 
     def add_default_timers(self):
-        work_timer = Timer(self, on_delete=self.remove_timer)
-        work_timer.pack(in_=self.scrollable_frame, fill=tk.X)
-        work_timer.description.delete(0, tk.END)
-        work_timer.description.insert(0, "🎯 Глубокий фокус")
-        work_timer.hours.set("1")
-        work_timer.minutes.set("0")
-        work_timer.seconds.set("0")
-        work_timer.update_presets_visibility()
-        work_timer.update_time_display()
+        work_timer = self.create_timer()
+        work_timer.set_description("🎯 Глубокий фокус")
+        work_timer.set_duration(60 * 60)
         self.timers.append(work_timer)
 
-        break_timer = Timer(self, on_delete=self.remove_timer)
-        break_timer.pack(in_=self.scrollable_frame, fill=tk.X)
-        break_timer.description.delete(0, tk.END)
-        break_timer.description.insert(0, "🌿 Перерыв")
-        break_timer.hours.set("0")
-        break_timer.minutes.set("5")
-        break_timer.seconds.set("0")
-        break_timer.update_presets_visibility()
-        break_timer.update_time_display()
+        break_timer = self.create_timer()
+        break_timer.set_description("🌿 Перерыв")
+        break_timer.set_duration(5 * 60)
         self.timers.append(break_timer)
+        self.timer_list.refresh()
 
     def add_pomodoro_preset(self):
-        work_timer = Timer(self, on_delete=self.remove_timer)
-        work_timer.pack(in_=self.scrollable_frame, fill=tk.X)
-        work_timer.description.delete(0, tk.END)
-        work_timer.description.insert(0, "🍅 Помодоро")
-        work_timer.hours.set("0")
-        work_timer.minutes.set("25")
-        work_timer.seconds.set("0")
-        work_timer.update_presets_visibility()
-        work_timer.update_time_display()
-        self.timers.append(work_timer)
-
-        break_timer = Timer(self, on_delete=self.remove_timer)
-        break_timer.pack(in_=self.scrollable_frame, fill=tk.X)
-        break_timer.description.delete(0, tk.END)
-        break_timer.description.insert(0, "☕️ Короткий перерыв")
-        break_timer.hours.set("0")
-        break_timer.minutes.set("5")
-        break_timer.seconds.set("0")
-        break_timer.update_presets_visibility()
-        break_timer.update_time_display()
-        self.timers.append(break_timer)
+        self.add_sequence_timer("🍅 Помодоро", pomodoro_sequence())
 
     def add_long_focus_preset(self):
-        work_timer = Timer(self, on_delete=self.remove_timer)
-        work_timer.pack(in_=self.scrollable_frame, fill=tk.X)
-        work_timer.description.delete(0, tk.END)
-        work_timer.description.insert(0, "🔋 Глубокий фокус")
-        work_timer.hours.set("0")
-        work_timer.minutes.set("52")
-        work_timer.seconds.set("0")
-        work_timer.update_presets_visibility()
-        work_timer.update_time_display()
-        self.timers.append(work_timer)
+        self.add_sequence_timer("🔋 Длинный фокус", long_focus_sequence())
 
-        break_timer = Timer(self, on_delete=self.remove_timer)
-        break_timer.pack(in_=self.scrollable_frame, fill=tk.X)
-        break_timer.description.delete(0, tk.END)
-        break_timer.description.insert(0, "🌳 Длинный перерыв")
-        break_timer.hours.set("0")
-        break_timer.minutes.set("17")
-        break_timer.seconds.set("0")
-        break_timer.update_presets_visibility()
-        break_timer.update_time_display()
-        self.timers.append(break_timer)
+    def add_sequence_timer(self, description, sequence):
+        """Один таймер на всю цепочку: фазы переключаются без ручного запуска"""
+        timer = self.create_timer()
+        timer.set_description(description)
+        timer.set_sequence(sequence)
+        self.timers.append(timer)
+        self.timer_list.refresh()
+        self.timer_list.see(timer)
+        self.save_timers()
 
     def create_tray_icon(self):
+        import pystray
+        from PIL import Image
+
         icon = Image.open(IMAGES["TRAY_ICON"])
         icon = icon.resize((32, 32))
 
         menu = (
-            pystray.MenuItem("Показать", self.show_window),
-            pystray.MenuItem("Выход", self.quit_app),
+            pystray.MenuItem(
+                "Показать",
+                lambda: self.ui_dispatcher.post(self.show_window, key="tray_show"),
+            ),
+            pystray.MenuItem(
+                "Выход", lambda: self.ui_dispatcher.post(self.quit_app, key="tray_quit")
+            ),
         )
 
         self.icon = pystray.Icon("timer", icon, "Мульти-таймер", menu)
@@ -354,7 +396,7 @@ class MainWindow(ThemedTk):
             self.quit_app()
             return
 
-        close_on_exit = self.settings_tab.get_close_on_exit()
+        close_on_exit = self.get_close_on_exit()
 
         if close_on_exit:
             self.quit_app()
@@ -369,25 +411,26 @@ class MainWindow(ThemedTk):
     def quit_app(self):
         """Полностью закрывает приложение"""
         self.save_timers()
+        self.autosave.flush()
+        self.io_executor.shutdown()
+        self.ui_dispatcher.stop()
 
         if hasattr(self, "icon") and self.icon:
             self.icon.stop()
 
         for timer in self.timers:
-            if hasattr(timer, "is_running"):
-                timer.is_running = False
+            timer.stop_alarm()
 
-        try:
-            mixer.quit()
-        except:
-            pass
+        audio_engine.quit()
+        system_sound_helper.close()
 
         self.quit()
 
     def add_timer(self):
-        timer = Timer(self, on_delete=self.remove_timer)
-        timer.pack(in_=self.scrollable_frame, fill=tk.X)
+        timer = self.create_timer()
         self.timers.append(timer)
+        self.timer_list.refresh()
+        self.timer_list.see(timer)
         self.save_timers()
 
     def remove_timer(self, timer):
@@ -395,52 +438,59 @@ class MainWindow(ThemedTk):
         try:
             if timer in self.timers:
                 self.timers.remove(timer)
-            if hasattr(timer, "is_running"):
-                timer.is_running = False
+            if hasattr(timer, "stop_alarm"):
+                timer.stop_alarm()
             if hasattr(timer, "stop_timer"):
                 timer.stop_timer()
-            if timer.winfo_exists():
-                timer.destroy()
         except Exception as e:
             print(f"Ошибка при удалении таймера: {e}")
+        self.timer_list.refresh()
         self.save_timers()
 
     def save_timers(self):
-        """Сохраняет состояние таймеров в JSON файл"""
-        timers_data = []
-        for timer in self.timers:
-            timers_data.append(timer.to_dict())
+        """Помечает таймеры для отложенного сохранения в JSON файл"""
+        self.autosave.mark_dirty("timers.json")
 
+    def checkpoint_timers(self):
+        """
+        Периодически сохраняет состояние отсчёта, чтобы после сбоя
+        таймеры продолжились. Файл пишется только при изменениях.
+        """
+        self.save_timers()
+        self.after(TIMERS_CHECKPOINT_MS, self.checkpoint_timers)
+
+    def snapshot_timers(self):
+        if not self.timers_loaded:
+            return None
+        timers_data = [timer.to_dict() for timer in self.timers]
+        if timers_data == self.saved_timers_data:
+            return None
+        return timers_data
+
+    def write_timers(self, timers_data):
+        """Снимок считается сохранённым только после успешной записи"""
         try:
-            with open("timers.json", "w", encoding="utf-8") as f:
-                json.dump(timers_data, f, ensure_ascii=False, indent=2)
+            write_json("timers.json", timers_data)
         except Exception as e:
             print(f"Ошибка сохранения таймеров: {e}")
+            return
+        self.saved_timers_data = timers_data
 
     def load_timers(self):
-        """Загружает таймеры из JSON файла"""
+        """Читает таймеры из JSON файла в потоке ввода-вывода"""
+        self.io_executor.load_async("timers.json", self.on_timers_loaded)
+
+    def on_timers_loaded(self, future):
+        """Создает загруженные таймеры в потоке Tk"""
+        self.timers_loaded = True
         try:
-            with open("timers.json", "r", encoding="utf-8") as f:
-                timers_data = json.load(f)
+            timers_data = future.result()
 
             for timer_data in timers_data:
-                timer = Timer(self, on_delete=self.remove_timer)
-                timer.pack(in_=self.scrollable_frame, fill=tk.X)
-
-                timer.description.delete(0, tk.END)
-                timer.description.insert(0, timer_data["description"])
-
-                timer.hours.set(timer_data["hours"])
-                timer.minutes.set(timer_data["minutes"])
-                timer.seconds.set(timer_data["seconds"])
-
-                if timer_data.get("custom_sound"):
-                    timer.custom_sound = timer_data["custom_sound"]
-                    timer.sound_button.config(text="🔊 ✓")
-
-                timer.update_presets_visibility()
-                timer.update_time_display()
+                timer = self.create_timer()
+                timer.load_dict(timer_data)
                 self.timers.append(timer)
+            self.timer_list.refresh()
 
         except FileNotFoundError:
             self.add_default_timers()
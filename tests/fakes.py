@@ -0,0 +1,74 @@
+"""
+Общие заглушки для тестов без Tk.
+
+Особенности:
+- FakeClock - управляемые вручную часы вместо time.monotonic
+- FakeWidget - after()/after_cancel() по FakeClock, advance() двигает время
+- ManualWidget - after() без времени: отложенные вызовы выполняет fire()
+"""
+
+from __future__ import annotations
+
+
+class FakeClock:
+
+    def __init__(self, value: float = 100.0) -> None:
+        self.value = value
+
+    def __call__(self) -> float:
+        return self.value
+
+
+class FakeWidget:
+    """Эмулирует after()/after_cancel() без Tk: хранит только взведённые вызовы"""
+
+    def __init__(self, clock: FakeClock) -> None:
+        self.clock = clock
+        self.pending: dict[str, tuple[float, object]] = {}
+        self.counter = 0
+
+    def after(self, delay_ms: int, callback) -> str:
+        self.counter += 1
+        after_id = f"after#{self.counter}"
+        self.pending[after_id] = (self.clock.value + delay_ms / 1000, callback)
+        return after_id
+
+    def after_cancel(self, after_id: str) -> None:
+        self.pending.pop(after_id, None)
+
+    def advance(self, seconds: float) -> None:
+        target = self.clock.value + seconds
+        while True:
+            due = [
+                (when, after_id)
+                for after_id, (when, _) in self.pending.items()
+                if when <= target
+            ]
+            if not due:
+                break
+            when, after_id = min(due)
+            self.clock.value = max(self.clock.value, when)
+            _, callback = self.pending.pop(after_id)
+            callback()
+        self.clock.value = target
+
+
+class ManualWidget:
+    """Эмулирует after() без часов: задержка не важна, вызовы выполняет fire()"""
+
+    def __init__(self) -> None:
+        self.pending: dict[str, object] = {}
+        self.counter = 0
+
+    def after(self, delay_ms: int, callback) -> str:
+        self.counter += 1
+        after_id = f"after#{self.counter}"
+        self.pending[after_id] = callback
+        return after_id
+
+    def after_cancel(self, after_id: str) -> None:
+        self.pending.pop(after_id, None)
+
+    def fire(self) -> None:
+        for after_id in list(self.pending):
+            self.pending.pop(after_id)()
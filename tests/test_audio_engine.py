@@ -0,0 +1,187 @@
+"""Тесты AudioEngine - общего звукового движка с кэшем звуков"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.sound_utils import AudioEngine
+
+
+class FakeSound:
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+
+class FakeChannel:
+
+    def __init__(self) -> None:
+        self.sound: FakeSound | None = None
+        self.loops = 0
+
+    def play(self, sound: FakeSound, loops: int = 0) -> None:
+        self.sound = sound
+        self.loops = loops
+
+    def stop(self) -> None:
+        self.sound = None
+
+    def get_busy(self) -> bool:
+        return self.sound is not None
+
+
+class FakeMixer:
+    """Эмулирует pygame.mixer: каналы по индексу и счётчики вызовов"""
+
+    def __init__(self) -> None:
+        self.initialized = False
+        self.init_calls = 0
+        self.quit_calls = 0
+        self.decoded: list[str] = []
+        self.channels: list[FakeChannel] = []
+
+    def get_init(self) -> bool:
+        return self.initialized
+
+    def init(self) -> None:
+        self.initialized = True
+        self.init_calls += 1
+
+    def quit(self) -> None:
+        self.initialized = False
+        self.quit_calls += 1
+
+    def set_num_channels(self, count: int) -> None:
+        while len(self.channels) < count:
+            self.channels.append(FakeChannel())
+        del self.channels[count:]
+
+    def get_num_channels(self) -> int:
+        return len(self.channels)
+
+    def Channel(self, index: int) -> FakeChannel:
+        return self.channels[index]
+
+    def Sound(self, path: str) -> FakeSound:
+        if path.startswith("missing"):
+            raise FileNotFoundError(path)
+        self.decoded.append(path)
+        return FakeSound(path)
+
+
+@pytest.fixture
+def mixer() -> FakeMixer:
+    return FakeMixer()
+
+
+def make_engine(mixer: FakeMixer, **kwargs) -> AudioEngine:
+    return AudioEngine(lambda: mixer, **kwargs)
+
+
+class TestAudioEngine:
+
+    def test_mixer_initialized_once(self, mixer: FakeMixer) -> None:
+        """mixer инициализируется один раз и не перезапускается при stop"""
+        engine = make_engine(mixer)
+
+        engine.play("alarm.mp3", owner="a", loops=-1)
+        engine.stop("a")
+        engine.play("alarm.mp3", owner="a", loops=-1)
+
+        assert mixer.init_calls == 1
+        assert mixer.quit_calls == 0
+
+    def test_sound_decoded_once(self, mixer: FakeMixer) -> None:
+        """Повторный сигнал берёт звук из кэша"""
+        engine = make_engine(mixer)
+
+        engine.play("alarm.mp3", owner="a")
+        engine.play("alarm.mp3", owner="b")
+
+        assert mixer.decoded == ["alarm.mp3"]
+
+    def test_cache_evicts_least_recently_used(self, mixer: FakeMixer) -> None:
+        """При переполнении вытесняется давно не использованный звук"""
+        engine = make_engine(mixer, cache_size=2)
+
+        engine.preload("a.mp3")
+        engine.preload("b.mp3")
+        engine.preload("a.mp3")
+        engine.preload("c.mp3")
+        engine.preload("a.mp3")
+        engine.preload("b.mp3")
+
+        assert mixer.decoded == ["a.mp3", "b.mp3", "c.mp3", "b.mp3"]
+
+    def test_owners_ring_on_separate_channels(self, mixer: FakeMixer) -> None:
+        """Остановка одного таймера не глушит другой"""
+        engine = make_engine(mixer)
+
+        engine.play("alarm.mp3", owner="first", loops=-1)
+        engine.play("alarm.mp3", owner="second", loops=-1)
+        engine.stop("first")
+
+        assert not engine.is_playing("first")
+        assert engine.is_playing("second")
+
+    def test_play_replaces_owner_sound(self, mixer: FakeMixer) -> None:
+        """Повторный play владельца не занимает второй канал"""
+        engine = make_engine(mixer)
+
+        engine.play("a.mp3", owner="timer", loops=-1)
+        engine.play("b.mp3", owner="timer", loops=-1)
+
+        busy = [channel for channel in mixer.channels if channel.get_busy()]
+        assert [channel.sound.path for channel in busy] == ["b.mp3"]
+
+    def test_channels_grow_when_all_busy(self, mixer: FakeMixer) -> None:
+        """Если свободных каналов нет, их число увеличивается"""
+        engine = make_engine(mixer, channels=2, max_channels=8)
+
+        for owner in range(3):
+            engine.play("alarm.mp3", owner=owner, loops=-1)
+
+        assert mixer.get_num_channels() == 4
+        assert all(engine.is_playing(owner) for owner in range(3))
+
+    def test_oldest_owner_replaced_at_channel_limit(self, mixer: FakeMixer) -> None:
+        """На пределе каналов новый звук вытесняет самый старый"""
+        engine = make_engine(mixer, channels=2, max_channels=2)
+
+        for owner in range(3):
+            engine.play("alarm.mp3", owner=owner, loops=-1)
+
+        assert not engine.is_playing(0)
+        assert engine.is_playing(1)
+        assert engine.is_playing(2)
+
+    def test_missing_file_reports_failure(self, mixer: FakeMixer) -> None:
+        """Нечитаемый файл не воспроизводится, вызывающий выбирает запасной звук"""
+        engine = make_engine(mixer)
+
+        assert engine.play("missing.mp3", owner="timer") is False
+        assert not engine.is_playing("timer")
+
+    def test_unavailable_mixer(self) -> None:
+        """Без звукового устройства play возвращает False, а не падает"""
+
+        def broken_mixer():
+            raise RuntimeError("нет устройства")
+
+        engine = AudioEngine(broken_mixer)
+
+        assert engine.play("alarm.mp3", owner="timer") is False
+
+    def test_quit_releases_mixer(self, mixer: FakeMixer) -> None:
+        engine = make_engine(mixer)
+        engine.play("alarm.mp3", owner="timer")
+
+        engine.quit()
+
+        assert mixer.quit_calls == 1
+        assert not engine.is_playing("timer")
@@ -0,0 +1,93 @@
+"""Тесты AutosaveService - отложенного автосохранения с объединением изменений"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.autosave import AutosaveService
+from utils.io_executor import IOExecutor
+from tests.fakes import ManualWidget
+
+
+class TestAutosaveService:
+
+    @pytest.fixture
+    def widget(self) -> ManualWidget:
+        return ManualWidget()
+
+    @pytest.fixture
+    def service(self, widget: ManualWidget) -> AutosaveService:
+        return AutosaveService(widget, IOExecutor(), window_ms=500)
+
+    def test_burst_of_changes_gives_one_write(self, service, widget) -> None:
+        state = {"value": 0}
+        writes = []
+        service.register("data", lambda: dict(state), writes.append)
+
+        for i in range(100):
+            state["value"] = i
+            service.mark_dirty("data")
+
+        assert len(widget.pending) == 1
+        assert writes == []
+
+        widget.fire()
+        service.flush()
+
+        assert writes == [{"value": 99}]
+
+    def test_write_runs_off_main_thread(self, service, widget) -> None:
+        threads = []
+        service.register(
+            "data", lambda: 1, lambda _: threads.append(threading.current_thread())
+        )
+
+        service.mark_dirty("data")
+        widget.fire()
+        service.flush()
+
+        assert threads and threads[0] is not threading.main_thread()
+
+    def test_flush_writes_without_waiting_for_window(self, service, widget) -> None:
+        writes = []
+        service.register("timers", lambda: ["t"], writes.append)
+        service.register("habits", lambda: ["h"], writes.append)
+
+        service.mark_dirty("timers")
+        service.mark_dirty("habits")
+        service.flush()
+
+        assert sorted(writes) == [["h"], ["t"]]
+        assert widget.pending == {}
+
+    def test_clean_sources_are_not_written(self, service, widget) -> None:
+        writes = []
+        service.register("data", lambda: None, writes.append)
+        service.register("other", lambda: "x", writes.append)
+
+        service.mark_dirty("data")
+        service.flush()
+
+        assert writes == []
+
+    def test_write_error_does_not_stop_service(self, service, widget) -> None:
+        writes = []
+
+        def failing_write(data) -> None:
+            raise OSError("диск недоступен")
+
+        service.register("broken", lambda: 1, failing_write)
+        service.register("data", lambda: 2, writes.append)
+
+        service.mark_dirty("broken")
+        service.flush()
+        service.mark_dirty("data")
+        service.flush()
+
+        assert writes == [2]
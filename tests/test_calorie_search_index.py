@@ -0,0 +1,111 @@
+"""
+Тесты ProductSearchIndex
+
+Особенности:
+- Проверяет ранжирование: точное совпадение, префикс, начало слова, подстрока
+- Проверяет нечёткий поиск с опечатками и инкрементальные обновления
+- Проверяет поиск через CalorieStorage при переименовании и удалении
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import Generator
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tabs.calorie_search_index import ProductSearchIndex
+from tabs.calorie_storage import CalorieStorage
+
+
+class TestProductSearchIndex:
+
+    @pytest.fixture
+    def index(self) -> ProductSearchIndex:
+        index = ProductSearchIndex()
+        index.rebuild(["Рис бурый", "Рис", "Ирис", "Сырный рис", "Яблоко"])
+        return index
+
+    def test_empty_query_returns_sorted_names(self, index) -> None:
+        assert index.search("") == [
+            "Ирис",
+            "Рис",
+            "Рис бурый",
+            "Сырный рис",
+            "Яблоко",
+        ]
+
+    def test_ranks_exact_prefix_word_and_substring(self, index) -> None:
+        assert index.search("рис") == ["Рис", "Рис бурый", "Сырный рис", "Ирис"]
+
+    def test_query_is_case_insensitive_and_stripped(self, index) -> None:
+        assert index.search("  ЯБЛ ") == ["Яблоко"]
+
+    def test_short_query_matches_substring(self, index) -> None:
+        assert index.search("ко") == ["Яблоко"]
+
+    def test_short_query_follows_incremental_updates(self, index) -> None:
+        index.add("Кокос")
+        index.remove("Яблоко")
+
+        assert index.search("ко") == ["Кокос"]
+        assert index.search("р") == ["Рис", "Рис бурый", "Ирис", "Сырный рис"]
+
+    def test_fuzzy_match_with_typo(self, index) -> None:
+        assert index.search("яблако") == ["Яблоко"]
+
+    def test_unrelated_query_finds_nothing(self, index) -> None:
+        assert index.search("шоколад") == []
+
+    def test_limit_caps_results(self, index) -> None:
+        assert index.search("", limit=2) == ["Ирис", "Рис"]
+        assert index.search("рис", limit=1) == ["Рис"]
+
+    def test_incremental_add_and_remove(self, index) -> None:
+        index.add("Рисовая лапша")
+        index.remove("Рис")
+        index.remove("Нет такого")
+
+        assert index.search("рис") == [
+            "Рис бурый",
+            "Рисовая лапша",
+            "Сырный рис",
+            "Ирис",
+        ]
+        assert "Рис" not in index.search("")
+
+
+class TestStorageSearch:
+
+    @pytest.fixture
+    def storage(self, tmp_path) -> Generator[CalorieStorage, None, None]:
+        original_dir = os.getcwd()
+        os.chdir(tmp_path)
+        storage = CalorieStorage()
+        storage.add_product_to_db("Рис", calories=130)
+        storage.add_product_to_db("Яблоко", calories=52)
+        yield storage
+        os.chdir(original_dir)
+
+    def test_rename_updates_search(self, storage) -> None:
+        storage.update_product_in_db("Рис", "Гречка", calories=110)
+
+        assert storage.search_products("рис") == []
+        assert storage.search_products("греч") == ["Гречка"]
+        assert storage.get_product("Гречка")["calories"] == 110
+
+    def test_remove_updates_search(self, storage) -> None:
+        storage.remove_product_from_db("Яблоко")
+
+        assert storage.search_products("") == ["Рис"]
+        assert storage.get_product("Яблоко") is None
+
+    def test_index_rebuilt_on_load(self, storage) -> None:
+        storage.save()
+
+        reloaded = CalorieStorage()
+
+        assert reloaded.search_products("ябл") == ["Яблоко"]
@@ -0,0 +1,229 @@
+"""
+Тесты SqliteCalorieStorage
+
+Особенности:
+- Сверяет результаты с JSON-хранилищем CalorieStorage на одних и тех же операциях
+- Использует временные директории через os.chdir для изоляции файлов
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from typing import Generator
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tabs.calorie_sqlite_storage import SqliteCalorieStorage
+from tabs.calorie_storage import CalorieStorage, create_calorie_storage
+
+
+class TestSqliteCalorieStorage:
+
+    @pytest.fixture
+    def workdir(self, tmp_path) -> Generator[str, None, None]:
+        original_dir = os.getcwd()
+        os.chdir(tmp_path)
+        yield str(tmp_path)
+        os.chdir(original_dir)
+
+    @pytest.fixture
+    def storage(self, workdir: str) -> Generator[SqliteCalorieStorage, None, None]:
+        storage = SqliteCalorieStorage()
+        yield storage
+        storage.close()
+
+    def fill(self, storage) -> None:
+        storage.add_product_to_db("Рис", calories=130, protein=3, fat=0, carbs=28)
+        storage.add_product_to_db("Яблоко", calories=52, carbs=14)
+        storage.add_meal_entry("2025-01-15", "lunch", "Рис", 150, True)
+        storage.add_meal_entry("2025-01-15", "lunch", "Яблоко", 2, False)
+        storage.add_meal_entry("2025-01-15", "snack", "Яблоко", 1, False)
+        storage.add_meal_entry("2025-01-16", "breakfast", "Рис", 80, True)
+
+    def without_time(self, entries: list[dict]) -> list[dict]:
+        return [{k: v for k, v in e.items() if k != "time"} for e in entries]
+
+    def test_matches_json_storage(self, storage, workdir: str) -> None:
+        reference = CalorieStorage()
+        for target in (reference, storage):
+            self.fill(target)
+            target.update_meal_entry("2025-01-15", "lunch", 1, "Рис", 50, True)
+            target.remove_meal_entry("2025-01-15", "snack", 0)
+            target.update_product_in_db("Рис", "Рис бурый", 110, 3, 1, 23)
+
+        for date in ("2025-01-15", "2025-01-16", "2025-01-17"):
+            assert storage.get_day_total_calories(date) == (
+                reference.get_day_total_calories(date)
+            )
+            assert storage.get_day_total_macros(date) == (
+                reference.get_day_total_macros(date)
+            )
+            for meal in ("breakfast", "lunch", "dinner", "snack"):
+                assert storage.get_meal_total_macros(date, meal) == (
+                    reference.get_meal_total_macros(date, meal)
+                )
+            for meal, entries in reference.get_day_data(date).items():
+                assert self.without_time(storage.get_day_data(date)[meal]) == (
+                    self.without_time(entries)
+                )
+
+        assert storage.get_all_products() == reference.get_all_products()
+
+    def test_entries_for_product_match_json_storage(self, storage, workdir) -> None:
+        reference = CalorieStorage()
+        for target in (reference, storage):
+            self.fill(target)
+            target.remove_meal_entry("2025-01-15", "lunch", 0)
+
+        for name in ("Рис", "Яблоко", "Нет такого"):
+            assert storage.get_entries_for_product(name) == (
+                reference.get_entries_for_product(name)
+            )
+
+    def test_range_totals_match_json_storage(self, storage, workdir) -> None:
+        reference = CalorieStorage()
+        for target in (reference, storage):
+            self.fill(target)
+
+        for start, end in (("2025-01-01", "2025-01-31"), ("2025-01-16", "2025-01-16")):
+            assert storage.get_range_totals(start, end) == (
+                reference.get_range_totals(start, end)
+            )
+
+    def test_search_matches_json_storage(self, storage, workdir) -> None:
+        reference = CalorieStorage()
+        for target in (reference, storage):
+            self.fill(target)
+            target.update_product_in_db("Рис", "Рис бурый", 110)
+
+        for query in ("", "рис", "ябл", "яблако", "рис белый"):
+            assert storage.search_products(query) == reference.search_products(query)
+        assert storage.get_product("Рис бурый") == reference.get_product("Рис бурый")
+
+    def test_rename_updates_entries(self, storage) -> None:
+        self.fill(storage)
+
+        storage.update_product_in_db("Яблоко", "Яблоко зелёное", calories=40)
+
+        lunch = storage.get_day_data("2025-01-15")["lunch"]
+        assert lunch[1]["product"] == "Яблоко зелёное"
+        assert lunch[1]["calories"] == 80
+        assert lunch[1]["carbs"] is None
+
+    def test_remove_product_removes_entries(self, storage) -> None:
+        self.fill(storage)
+
+        storage.remove_product_from_db("Рис")
+
+        assert storage.get_day_total_calories("2025-01-16") == 0
+        assert len(storage.get_day_data("2025-01-15")["lunch"]) == 1
+
+    def test_invalid_index_is_ignored(self, storage) -> None:
+        self.fill(storage)
+
+        storage.remove_meal_entry("2025-01-15", "lunch", 5)
+        storage.remove_meal_entry("2025-01-15", "lunch", -1)
+
+        assert len(storage.get_day_data("2025-01-15")["lunch"]) == 2
+
+    def test_empty_day_totals(self, storage) -> None:
+        assert storage.get_day_total_calories("2030-01-01") == 0
+        assert storage.get_day_total_macros("2030-01-01") == {
+            "protein": None,
+            "fat": None,
+            "carbs": None,
+        }
+
+    def test_data_persists_after_save(self, storage, workdir: str) -> None:
+        self.fill(storage)
+        storage.save()
+
+        reopened = SqliteCalorieStorage()
+        assert reopened.get_day_total_calories("2025-01-15") == 195 + 104 + 52
+        reopened.close()
+
+    def test_migrates_legacy_json(self, workdir: str) -> None:
+        legacy = CalorieStorage()
+        self.fill(legacy)
+        legacy.save()
+
+        storage = SqliteCalorieStorage()
+
+        assert storage.get_all_products() == legacy.get_all_products()
+        assert storage.get_day_data("2025-01-15") == legacy.get_day_data("2025-01-15")
+        storage.close()
+
+    def test_migration_skips_incomplete_legacy_rows(self, workdir: str) -> None:
+        """Запись без продукта не срывает перенос остальных данных"""
+        legacy = {
+            "products": {
+                "Рис": {"calories": 130, "protein": 3},
+                "Безымянный": {"protein": 1},
+            },
+            "entries": {
+                "2025-01-15": {
+                    "lunch": [
+                        {"amount": 100, "is_grams": True, "calories": 50},
+                        {"product": "Рис", "amount": 150, "is_grams": True, "calories": 195},
+                    ]
+                }
+            },
+        }
+        with open("calories.json", "w", encoding="utf-8") as f:
+            json.dump(legacy, f, ensure_ascii=False)
+
+        storage = SqliteCalorieStorage()
+
+        assert list(storage.get_all_products()) == ["Рис"]
+        lunch = storage.get_day_data("2025-01-15")["lunch"]
+        assert [entry["product"] for entry in lunch] == ["Рис"]
+        storage.close()
+
+    def test_keeps_sqlite_edits_while_json_unchanged(self, workdir: str) -> None:
+        legacy = CalorieStorage()
+        self.fill(legacy)
+        legacy.save()
+        storage = SqliteCalorieStorage()
+        storage.add_product_to_db("Гречка", calories=110)
+        storage.close()
+
+        reopened = SqliteCalorieStorage()
+
+        assert set(reopened.get_all_products()) == {"Рис", "Яблоко", "Гречка"}
+        reopened.close()
+
+    def test_reimports_json_changed_after_migration(self, workdir: str) -> None:
+        """SQLite -> JSON -> SQLite: правки, сделанные в JSON, не теряются"""
+        legacy = CalorieStorage()
+        self.fill(legacy)
+        legacy.save()
+        storage = SqliteCalorieStorage()
+        storage.add_product_to_db("Гречка", calories=110)
+        storage.close()
+
+        legacy = CalorieStorage()
+        legacy.add_product_to_db("Кефир", calories=40)
+        legacy.add_meal_entry("2025-01-17", "snack", "Кефир", 200, True)
+        legacy.save()
+        later = time.time() + 10
+        for path in ("calories.json", "calories.json.journal"):
+            if os.path.exists(path):
+                os.utime(path, (later, later))
+
+        reopened = SqliteCalorieStorage()
+
+        assert reopened.get_all_products() == legacy.get_all_products()
+        assert reopened.get_day_data("2025-01-17") == legacy.get_day_data("2025-01-17")
+        assert reopened.get_day_total_calories("2025-01-15") == 195 + 104 + 52
+        reopened.close()
+
+    def test_factory_selects_backend(self, workdir: str) -> None:
+        assert isinstance(create_calorie_storage("json"), CalorieStorage)
+        sqlite_storage = create_calorie_storage("sqlite")
+        assert isinstance(sqlite_storage, SqliteCalorieStorage)
+        sqlite_storage.close()
@@ -18,6 +18,7 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from tabs.calorie_storage import CalorieStorage
+from utils.io_executor import IOExecutor
 
 
 class TestCalorieStorage:
@@ -271,6 +272,105 @@ class TestCalorieStorage:
         assert macros["carbs"] is None
 
 
+    def test_get_entries_for_product(self, storage: CalorieStorage) -> None:
+        storage.add_product_to_db("Рис", calories=130)
+        storage.add_product_to_db("Суп", calories=40)
+        storage.add_meal_entry("2025-01-15", "lunch", "Суп", 300, True)
+        storage.add_meal_entry("2025-01-15", "lunch", "Рис", 100, True)
+        storage.add_meal_entry("2025-01-16", "dinner", "Рис", 150, True)
+
+        assert storage.get_entries_for_product("Рис") == [
+            ("2025-01-15", "lunch", 1),
+            ("2025-01-16", "dinner", 0),
+        ]
+        assert storage.get_entries_for_product("Нет такого") == []
+
+    def test_product_index_follows_entry_removal(self, storage: CalorieStorage) -> None:
+        """Удаление записи сдвигает позиции следующих записей"""
+        storage.add_product_to_db("Рис", calories=130)
+        storage.add_product_to_db("Суп", calories=40)
+        storage.add_meal_entry("2025-01-15", "lunch", "Суп", 300, True)
+        storage.add_meal_entry("2025-01-15", "lunch", "Рис", 100, True)
+
+        storage.remove_meal_entry("2025-01-15", "lunch", 0)
+
+        assert storage.get_entries_for_product("Суп") == []
+        assert storage.get_entries_for_product("Рис") == [("2025-01-15", "lunch", 0)]
+
+    def test_product_index_follows_entry_update(self, storage: CalorieStorage) -> None:
+        storage.add_product_to_db("Рис", calories=130)
+        storage.add_product_to_db("Гречка", calories=123)
+        storage.add_meal_entry("2025-01-15", "lunch", "Рис", 100, True)
+
+        storage.update_meal_entry("2025-01-15", "lunch", 0, "Гречка", 100, True)
+
+        assert storage.get_entries_for_product("Рис") == []
+        assert storage.get_entries_for_product("Гречка") == [("2025-01-15", "lunch", 0)]
+
+    def test_rename_product_recalculates_entries(self, storage: CalorieStorage) -> None:
+        storage.add_product_to_db("Молоко", calories=60)
+        storage.add_meal_entry("2025-01-15", "breakfast", "Молоко", 200, True)
+        storage.add_meal_entry("2025-01-16", "breakfast", "Молоко", 100, True)
+
+        storage.update_product_in_db("Молоко", "Молоко 3.2%", calories=64)
+
+        assert storage.get_entries_for_product("Молоко") == []
+        assert storage.get_entries_for_product("Молоко 3.2%") == [
+            ("2025-01-15", "breakfast", 0),
+            ("2025-01-16", "breakfast", 0),
+        ]
+        entry = storage.get_day_data("2025-01-15")["breakfast"][0]
+        assert entry["product"] == "Молоко 3.2%"
+        assert entry["calories"] == 128
+
+    def test_remove_product_keeps_other_positions(self, storage: CalorieStorage) -> None:
+        storage.add_product_to_db("Рис", calories=130)
+        storage.add_product_to_db("Суп", calories=40)
+        storage.add_meal_entry("2025-01-15", "lunch", "Суп", 300, True)
+        storage.add_meal_entry("2025-01-15", "lunch", "Рис", 100, True)
+        storage.add_meal_entry("2025-01-15", "lunch", "Суп", 200, True)
+
+        storage.remove_product_from_db("Суп")
+
+        assert storage.get_entries_for_product("Рис") == [("2025-01-15", "lunch", 0)]
+
+
+    def test_totals_follow_mutations(self, storage: CalorieStorage) -> None:
+        """Кэш итогов обновляется при добавлении, изменении и удалении"""
+        storage.add_product_to_db("Рис", calories=130, protein=3)
+        storage.add_meal_entry("2025-01-15", "lunch", "Рис", 100, True)
+        assert storage.get_meal_total_calories("2025-01-15", "lunch") == 130
+
+        storage.add_meal_entry("2025-01-15", "lunch", "Рис", 200, True)
+        assert storage.get_meal_total_calories("2025-01-15", "lunch") == 390
+
+        storage.update_meal_entry("2025-01-15", "lunch", 0, "Рис", 50, True)
+        assert storage.get_meal_total_calories("2025-01-15", "lunch") == 325
+        assert storage.get_meal_total_macros("2025-01-15", "lunch")["protein"] == 7
+
+        storage.remove_meal_entry("2025-01-15", "lunch", 1)
+        assert storage.get_day_total_calories("2025-01-15") == 65
+
+        storage.update_product_in_db("Рис", "Рис", calories=100)
+        assert storage.get_day_total_calories("2025-01-15") == 50
+
+        storage.remove_product_from_db("Рис")
+        assert storage.get_day_total_calories("2025-01-15") == 0
+        assert storage.get_day_total_macros("2025-01-15")["protein"] is None
+
+    def test_get_range_totals(self, storage: CalorieStorage) -> None:
+        storage.add_product_to_db("Хлеб", calories=250, carbs=50)
+        storage.add_product_to_db("Сыр", calories=360)
+        storage.add_meal_entry("2025-01-14", "breakfast", "Хлеб", 100, True)
+        storage.add_meal_entry("2025-01-15", "breakfast", "Хлеб", 40, True)
+        storage.add_meal_entry("2025-01-16", "dinner", "Сыр", 50, True)
+        storage.add_meal_entry("2025-01-20", "dinner", "Сыр", 100, True)
+
+        totals = storage.get_range_totals("2025-01-15", "2025-01-19")
+
+        assert totals == {"calories": 280, "protein": None, "fat": None, "carbs": 20}
+
+
 class TestCalorieStoragePersistence:
 
     @pytest.fixture
@@ -317,3 +417,33 @@ class TestCalorieStoragePersistence:
             assert day_data["lunch"][0]["amount"] == 200
         finally:
             os.chdir(original_dir)
+
+    def test_edits_before_async_load_are_kept(self, temp_dir: str) -> None:
+        """Изменения, сделанные до окончания загрузки, сливаются с файлом"""
+        original_dir = os.getcwd()
+        os.chdir(temp_dir)
+
+        try:
+            storage1 = CalorieStorage()
+            storage1.add_product_to_db("Рис", calories=130)
+            storage1.add_meal_entry("2025-01-15", "lunch", "Рис", 200, True)
+            storage1.save()
+
+            executor = IOExecutor()
+            storage2 = CalorieStorage(executor)
+            storage2.add_product_to_db("Гречка", calories=110)
+            storage2.add_meal_entry("2025-01-15", "lunch", "Гречка", 150, True)
+            storage2.load_async(lambda: None)
+            executor.wait()
+
+            products = [e["product"] for e in storage2.get_day_data("2025-01-15")["lunch"]]
+            assert products == ["Рис", "Гречка"]
+            assert set(storage2.get_all_products()) == {"Рис", "Гречка"}
+
+            storage2.save()
+            executor.shutdown()
+
+            day_data = CalorieStorage().get_day_data("2025-01-15")
+            assert [e["product"] for e in day_data["lunch"]] == ["Рис", "Гречка"]
+        finally:
+            os.chdir(original_dir)
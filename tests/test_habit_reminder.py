@@ -0,0 +1,94 @@
+"""Тесты расчёта момента следующего напоминания о привычке"""
+
+from __future__ import annotations
+
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tabs.habits_model import Habit
+from utils.habit_reminder import next_reminder_at
+
+
+def make_habit(**overrides) -> Habit:
+    data = {
+        "name": "Вода",
+        "interval": 60,
+        "start_time": "09:00",
+        "end_time": "18:00",
+        "enabled": True,
+        "completed": False,
+        "notifications": True,
+        "last_reminder": None,
+    }
+    data.update(overrides)
+    return Habit.from_json(data)
+
+
+def ts(*args: int) -> float:
+    return datetime(*args).timestamp()
+
+
+class TestNextReminderAt:
+
+    def test_first_reminder_fires_now_inside_window(self) -> None:
+        now = ts(2025, 1, 15, 10, 15)
+
+        assert next_reminder_at(make_habit(), now) == now
+
+    def test_before_window_waits_for_start(self) -> None:
+        now = ts(2025, 1, 15, 7, 0)
+
+        assert next_reminder_at(make_habit(), now) == ts(2025, 1, 15, 9, 0)
+
+    def test_after_window_moves_to_next_day(self) -> None:
+        now = ts(2025, 1, 15, 19, 0)
+
+        assert next_reminder_at(make_habit(), now) == ts(2025, 1, 16, 9, 0)
+
+    def test_interval_after_last_reminder(self) -> None:
+        habit = make_habit(last_reminder="2025-01-15T10:00:00")
+
+        result = next_reminder_at(habit, ts(2025, 1, 15, 10, 20))
+
+        assert result == ts(2025, 1, 15, 11, 0)
+
+    def test_next_reminder_past_window_moves_to_next_day(self) -> None:
+        habit = make_habit(last_reminder="2025-01-15T17:30:00")
+
+        result = next_reminder_at(habit, ts(2025, 1, 15, 17, 40))
+
+        assert result == ts(2025, 1, 16, 9, 0)
+
+    def test_end_of_day_window(self) -> None:
+        habit = make_habit(
+            interval=5, end_time="24:00", last_reminder="2025-01-15T23:50:00"
+        )
+
+        result = next_reminder_at(habit, ts(2025, 1, 15, 23, 52))
+
+        assert result == ts(2025, 1, 15, 23, 55)
+
+    def test_overdue_reminder_fires_now(self) -> None:
+        habit = make_habit(last_reminder="2025-01-14T12:00:00")
+        now = ts(2025, 1, 15, 12, 0)
+
+        assert next_reminder_at(habit, now) == now
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"enabled": False},
+            {"notifications": False},
+            {"completed": True},
+            {"start_time": "20:00", "end_time": "08:00"},
+        ],
+    )
+    def test_no_reminder(self, overrides: dict) -> None:
+        now = ts(2025, 1, 15, 10, 0)
+
+        assert next_reminder_at(make_habit(**overrides), now) is None
@@ -0,0 +1,120 @@
+"""Тесты модели привычки Habit"""
+
+from __future__ import annotations
+
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tabs.habits_model import Habit, habit_to_json, parse_minutes
+
+
+def habit_data(**overrides) -> dict:
+    data = {
+        "name": "Зарядка",
+        "interval": 60,
+        "start_time": "08:00",
+        "end_time": "24:00",
+        "enabled": True,
+        "completed": False,
+        "completed_repeats": 1,
+        "repeats": 3,
+        "notifications": True,
+        "comment": "Утренняя зарядка",
+        "last_reminder": "2025-01-15T08:30:00",
+    }
+    data.update(overrides)
+    return data
+
+
+class TestParseMinutes:
+
+    def test_parses_time(self) -> None:
+        assert parse_minutes("09:30") == 570
+
+    def test_end_of_day(self) -> None:
+        assert parse_minutes("24:00") == 24 * 60
+
+    @pytest.mark.parametrize("text", ["25:00", "ab:cd", "0930"])
+    def test_invalid_time_raises(self, text: str) -> None:
+        with pytest.raises(ValueError):
+            parse_minutes(text)
+
+
+class TestHabit:
+
+    def test_from_json_parses_once(self) -> None:
+        habit = Habit.from_json(habit_data())
+
+        assert habit.start == 8 * 60
+        assert habit.end == 24 * 60
+        assert habit.last_reminder == datetime(2025, 1, 15, 8, 30).timestamp()
+
+    def test_json_round_trip(self) -> None:
+        data = habit_data()
+
+        assert Habit.from_json(data).to_json() == data
+
+    def test_completed_time_saved_only_when_set(self) -> None:
+        data = habit_data(completed=True, completed_time="2025-01-15T09:00:00")
+
+        assert Habit.from_json(data).to_json() == data
+        assert "completed_time" not in Habit.from_json(habit_data()).to_json()
+
+    def test_dict_style_access(self) -> None:
+        habit = Habit.from_json(habit_data())
+
+        habit["start_time"] = "07:15"
+        habit["last_reminder"] = datetime(2025, 1, 15, 9, 0)
+
+        assert habit["name"] == "Зарядка"
+        assert habit["start_time"] == "07:15"
+        assert habit.start == 7 * 60 + 15
+        assert habit.last_reminder == datetime(2025, 1, 15, 9, 0).timestamp()
+        assert habit.get("comment") == "Утренняя зарядка"
+        assert habit.get("unknown", 5) == 5
+        assert "repeats" in habit
+
+    def test_unknown_key_raises(self) -> None:
+        habit = Habit.from_json(habit_data())
+
+        with pytest.raises(KeyError):
+            habit["unknown"]
+        with pytest.raises(AttributeError):
+            habit.unknown = 1
+
+    def test_missing_field_raises(self) -> None:
+        data = habit_data()
+        del data["interval"]
+
+        with pytest.raises(KeyError):
+            Habit.from_json(data)
+
+    def test_corrupted_timestamps_become_none(self) -> None:
+        """Испорченные отметки времени не отменяют саму привычку"""
+        data = habit_data(
+            last_reminder="вчера вечером",
+            completed=True,
+            completed_time="2025-13-45T99:00:00",
+        )
+
+        habit = Habit.from_json(data)
+
+        assert habit.last_reminder is None
+        assert habit.completed_time is None
+        assert habit.completed is False
+
+    def test_invalid_window_falls_back_to_whole_day(self) -> None:
+        habit = Habit.from_json(habit_data(start_time="8 утра", end_time="25:00"))
+
+        assert habit.start == 0
+        assert habit.end == 24 * 60
+
+    def test_habit_to_json_accepts_dict(self) -> None:
+        data = habit_data(last_reminder=None)
+
+        assert habit_to_json(data) == data
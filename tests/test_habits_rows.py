@@ -0,0 +1,111 @@
+"""Тесты точечного обновления строк привычек в HabitsTab"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+from typing import Generator
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tabs.habits_model import Habit
+from tabs.habits_rows import habit_info_text
+
+try:
+    import tkinter as tk
+    from tabs.habits_store import HabitsStore
+    from tabs.habits_tab import HabitsTab
+    from utils.autosave import get_autosave
+    from utils.habit_reminder import HabitReminder
+    from utils.io_executor import get_io_executor
+    TKINTER_AVAILABLE = True
+except (ImportError, Exception):
+    TKINTER_AVAILABLE = False
+
+
+def make_habit(name: str, **overrides) -> Habit:
+    data = {
+        "name": name,
+        "interval": 30,
+        "start_time": "08:00",
+        "end_time": "09:00",
+        "repeats": 2,
+        "comment": "",
+    }
+    data.update(overrides)
+    return Habit.from_json(data)
+
+
+class TestHabitInfoText:
+
+    def test_comment_and_schedule(self) -> None:
+        habit = make_habit("Вода", comment="Стакан")
+
+        assert habit_info_text(habit) == '"Стакан" • Каждые 30 мин • 08:00 - 09:00'
+
+    def test_no_notifications_no_comment(self) -> None:
+        habit = make_habit("Вода", notifications=False)
+
+        assert habit_info_text(habit) == ""
+
+
+@pytest.mark.skipif(not TKINTER_AVAILABLE, reason="Требуется tkinter")
+class TestHabitRows:
+
+    @pytest.fixture
+    def habits_tab(self) -> Generator[HabitsTab, None, None]:
+        original_dir = os.getcwd()
+        os.chdir(tempfile.mkdtemp())
+        root = tk.Tk()
+        root.withdraw()
+        store = HabitsStore(get_autosave(root), get_io_executor(root))
+        tab = HabitsTab(root, store, HabitReminder(root, store))
+        tab.habits["Утро"] = [make_habit("Зарядка"), make_habit("Вода")]
+        tab.update_times_display()
+        yield tab
+        os.chdir(original_dir)
+        root.destroy()
+
+    def row_frames(self, tab: HabitsTab) -> list:
+        habit_list = tab.habit_lists["Утро"]
+        return [habit_list.rows[key].frame for key in habit_list.order]
+
+    def test_toggle_repeat_keeps_widgets(self, habits_tab: HabitsTab) -> None:
+        frames = self.row_frames(habits_tab)
+        time_frames = habits_tab.times_frame.winfo_children()
+
+        habits_tab.toggle_repeat(habits_tab.habits["Утро"][0], 0, True)
+
+        assert self.row_frames(habits_tab) == frames
+        assert habits_tab.times_frame.winfo_children() == time_frames
+        row = habits_tab.habit_lists["Утро"].rows[id(habits_tab.habits["Утро"][0])]
+        assert [var.get() for var in row.checkbox_vars] == [True, False]
+
+    def test_move_habit_reorders_rows(self, habits_tab: HabitsTab) -> None:
+        first, second = self.row_frames(habits_tab)
+
+        habits_tab.move_habit("Утро", "Зарядка", 1)
+
+        assert self.row_frames(habits_tab) == [second, first]
+
+    def test_changed_repeats_rebuilds_only_that_row(self, habits_tab) -> None:
+        first, second = self.row_frames(habits_tab)
+
+        habits_tab.habits["Утро"][1]["repeats"] = 3
+        habits_tab.update_times_display()
+
+        frames = self.row_frames(habits_tab)
+        assert frames[0] is first
+        assert frames[1] is not second
+
+    def test_new_time_slot_rebuilds_layout(self, habits_tab: HabitsTab) -> None:
+        time_frames = habits_tab.times_frame.winfo_children()
+
+        habits_tab.all_times.append("Обед")
+        habits_tab.update_times_display()
+
+        assert habits_tab.times_frame.winfo_children() != time_frames
+        assert "Обед" in habits_tab.habit_lists
@@ -1,4 +1,4 @@
-"""Тесты HabitsTab storage - сохранение/загрузка привычек"""
+"""Тесты HabitsStore - сохранение/загрузка привычек"""
 
 from __future__ import annotations
 
@@ -12,15 +12,20 @@ import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-try:
-    import tkinter as tk
-    from tabs.habits_tab import HabitsTab
-    TKINTER_AVAILABLE = True
-except (ImportError, Exception):
-    TKINTER_AVAILABLE = False
+from tabs.habits_store import HabitsStore
+from utils.autosave import AutosaveService
+from utils.io_executor import IOExecutor
+from tests.fakes import ManualWidget
+
+
+def load_store() -> HabitsStore:
+    executor = IOExecutor()
+    store = HabitsStore(AutosaveService(ManualWidget(), executor), executor)
+    store.load()
+    executor.shutdown()
+    return store
 
 
-@pytest.mark.skipif(not TKINTER_AVAILABLE, reason="Требуется tkinter")
 class TestHabitsStorage:
 
     @pytest.fixture
@@ -31,62 +36,46 @@ class TestHabitsStorage:
         shutil.rmtree(temp_dir, ignore_errors=True)
 
     @pytest.fixture
-    def root(self):
-        root = tk.Tk()
-        root.withdraw()
-        yield root
-        try:
-            root.destroy()
-        except tk.TclError:
-            pass
-
-    @pytest.fixture
-    def habits_tab(self, root, temp_dir: str) -> Generator[HabitsTab, None, None]:
+    def store(self, temp_dir: str) -> Generator[HabitsStore, None, None]:
         original_dir = os.getcwd()
         os.chdir(temp_dir)
 
-        tab = HabitsTab(root)
-        yield tab
+        yield load_store()
 
         os.chdir(original_dir)
-        try:
-            tab.destroy()
-        except tk.TclError:
-            pass
 
-    def test_save_creates_habits_file(self, habits_tab: HabitsTab, temp_dir: str) -> None:
-        habits_tab.save_habits()
+    def save(self, store: HabitsStore) -> None:
+        store.write(store.snapshot())
 
-        assert os.path.exists(os.path.join(temp_dir, "habits.json"))
+    def test_save_creates_habits_file(self, store: HabitsStore, temp_dir: str) -> None:
+        self.save(store)
 
-    def test_save_and_load_empty_habits(self, habits_tab: HabitsTab, temp_dir: str) -> None:
-        habits_tab.save_habits()
+        assert os.path.exists(os.path.join(temp_dir, "habits.json"))
 
-        new_tab = HabitsTab(habits_tab.parent)
+    def test_save_and_load_empty_habits(self, store: HabitsStore, temp_dir: str) -> None:
+        self.save(store)
 
-        assert set(new_tab.all_times) == set(habits_tab.default_times)
-        assert len(new_tab.custom_times) == 0
+        new_store = load_store()
 
-        new_tab.destroy()
+        assert set(new_store.all_times) == set(store.default_times)
+        assert len(new_store.custom_times) == 0
 
-    def test_save_and_load_custom_time(self, habits_tab: HabitsTab, temp_dir: str) -> None:
+    def test_save_and_load_custom_time(self, store: HabitsStore, temp_dir: str) -> None:
         """Сохранение и загрузка пользовательского времени"""
         custom_time = "Обед"
-        habits_tab.custom_times.append(custom_time)
-        habits_tab.all_times.append(custom_time)
-        habits_tab.habits[custom_time] = []
-        habits_tab.time_settings[custom_time] = {"quick_timer_minutes": None}
+        store.custom_times.append(custom_time)
+        store.all_times.append(custom_time)
+        store.habits[custom_time] = []
+        store.time_settings[custom_time] = {"quick_timer_minutes": None}
 
-        habits_tab.save_habits()
+        self.save(store)
 
-        new_tab = HabitsTab(habits_tab.parent)
+        new_store = load_store()
 
-        assert custom_time in new_tab.all_times
-        assert custom_time in new_tab.custom_times
+        assert custom_time in new_store.all_times
+        assert custom_time in new_store.custom_times
 
-        new_tab.destroy()
-
-    def test_save_and_load_habit(self, habits_tab: HabitsTab, temp_dir: str) -> None:
+    def test_save_and_load_habit(self, store: HabitsStore, temp_dir: str) -> None:
         habit = {
             "name": "Зарядка",
             "interval": 60,
@@ -101,20 +90,18 @@ class TestHabitsStorage:
             "last_reminder": None,
         }
 
-        habits_tab.habits["Утро"].append(habit)
-        habits_tab.save_habits()
+        store.habits["Утро"].append(habit)
+        self.save(store)
 
-        new_tab = HabitsTab(habits_tab.parent)
+        new_store = load_store()
 
-        assert len(new_tab.habits["Утро"]) == 1
-        loaded_habit = new_tab.habits["Утро"][0]
+        assert len(new_store.habits["Утро"]) == 1
+        loaded_habit = new_store.habits["Утро"][0]
         assert loaded_habit["name"] == "Зарядка"
         assert loaded_habit["interval"] == 60
         assert loaded_habit["enabled"] is True
 
-        new_tab.destroy()
-
-    def test_save_habit_with_repeats(self, habits_tab: HabitsTab, temp_dir: str) -> None:
+    def test_save_habit_with_repeats(self, store: HabitsStore, temp_dir: str) -> None:
         habit = {
             "name": "Отжимания",
             "interval": 120,
@@ -129,18 +116,16 @@ class TestHabitsStorage:
             "last_reminder": None,
         }
 
-        habits_tab.habits["День"].append(habit)
-        habits_tab.save_habits()
+        store.habits["День"].append(habit)
+        self.save(store)
 
-        new_tab = HabitsTab(habits_tab.parent)
+        new_store = load_store()
 
-        loaded_habit = new_tab.habits["День"][0]
+        loaded_habit = new_store.habits["День"][0]
         assert loaded_habit["completed_repeats"] == 3
         assert loaded_habit["repeats"] == 5
 
-        new_tab.destroy()
-
-    def test_save_multiple_habits_multiple_times(self, habits_tab: HabitsTab, temp_dir: str) -> None:
+    def test_save_multiple_habits_multiple_times(self, store: HabitsStore, temp_dir: str) -> None:
         """Несколько привычек в разных временах"""
         morning_habit = {
             "name": "Медитация",
@@ -170,32 +155,28 @@ class TestHabitsStorage:
             "last_reminder": None,
         }
 
-        habits_tab.habits["Утро"].append(morning_habit)
-        habits_tab.habits["Вечер"].append(evening_habit)
-        habits_tab.save_habits()
-
-        new_tab = HabitsTab(habits_tab.parent)
+        store.habits["Утро"].append(morning_habit)
+        store.habits["Вечер"].append(evening_habit)
+        self.save(store)
 
-        assert len(new_tab.habits["Утро"]) == 1
-        assert len(new_tab.habits["Вечер"]) == 1
-        assert new_tab.habits["Утро"][0]["name"] == "Медитация"
-        assert new_tab.habits["Вечер"][0]["name"] == "Чтение"
+        new_store = load_store()
 
-        new_tab.destroy()
+        assert len(new_store.habits["Утро"]) == 1
+        assert len(new_store.habits["Вечер"]) == 1
+        assert new_store.habits["Утро"][0]["name"] == "Медитация"
+        assert new_store.habits["Вечер"][0]["name"] == "Чтение"
 
-    def test_save_time_settings(self, habits_tab: HabitsTab, temp_dir: str) -> None:
+    def test_save_time_settings(self, store: HabitsStore, temp_dir: str) -> None:
         """Сохранение настроек быстрого таймера"""
-        habits_tab.time_settings["Утро"]["quick_timer_minutes"] = 25
+        store.time_settings["Утро"]["quick_timer_minutes"] = 25
 
-        habits_tab.save_habits()
+        self.save(store)
 
-        new_tab = HabitsTab(habits_tab.parent)
+        new_store = load_store()
 
-        assert new_tab.time_settings["Утро"]["quick_timer_minutes"] == 25
+        assert new_store.time_settings["Утро"]["quick_timer_minutes"] == 25
 
-        new_tab.destroy()
-
-    def test_json_format_utf8(self, habits_tab: HabitsTab, temp_dir: str) -> None:
+    def test_json_format_utf8(self, store: HabitsStore, temp_dir: str) -> None:
         """JSON файл должен быть UTF-8 с русскими символами"""
         habit = {
             "name": "Проверка кириллицы",
@@ -211,8 +192,8 @@ class TestHabitsStorage:
             "last_reminder": None,
         }
 
-        habits_tab.habits["День"].append(habit)
-        habits_tab.save_habits()
+        store.habits["День"].append(habit)
+        self.save(store)
 
         with open(os.path.join(temp_dir, "habits.json"), "r", encoding="utf-8") as f:
             content = f.read()
@@ -221,11 +202,44 @@ class TestHabitsStorage:
         assert "Проверка кириллицы" in content
         assert data["habits"]["День"][0]["name"] == "Проверка кириллицы"
 
-    def test_missing_file_creates_default_state(self, habits_tab: HabitsTab, temp_dir: str) -> None:
-        """Отсутствие файла создает дефолтное состояние"""
-        habits_tab.load_habits()
+    def test_corrupted_timestamp_keeps_habit(self, store: HabitsStore, temp_dir: str) -> None:
+        """Привычка с испорченной датой загружается и переживает следующее сохранение"""
+        data = {
+            "times": ["Утро"],
+            "custom_times": [],
+            "time_settings": {},
+            "habits": {
+                "Утро": [
+                    {
+                        "name": "Зарядка",
+                        "interval": 60,
+                        "start_time": "08:00",
+                        "end_time": "09:00",
+                        "enabled": True,
+                        "last_reminder": "2025-01-15T25:61:00",
+                        "completed": True,
+                        "completed_time": "не дата",
+                    }
+                ]
+            },
+        }
+        with open(os.path.join(temp_dir, "habits.json"), "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+
+        loaded = load_store()
+        self.save(loaded)
+        reloaded = load_store()
 
-        assert set(habits_tab.all_times) == set(habits_tab.default_times)
-        for time_period in habits_tab.default_times:
-            assert time_period in habits_tab.habits
-            assert isinstance(habits_tab.habits[time_period], list)
+        for current in (loaded, reloaded):
+            assert len(current.habits["Утро"]) == 1
+            habit = current.habits["Утро"][0]
+            assert habit["name"] == "Зарядка"
+            assert habit["last_reminder"] is None
+            assert habit["completed"] is False
+
+    def test_missing_file_creates_default_state(self, store: HabitsStore, temp_dir: str) -> None:
+        """Отсутствие файла создает дефолтное состояние"""
+        assert set(store.all_times) == set(store.default_times)
+        for time_period in store.default_times:
+            assert time_period in store.habits
+            assert isinstance(store.habits[time_period], list)
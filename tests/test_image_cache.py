@@ -0,0 +1,74 @@
+"""Тесты обработки и кэширования картинок уведомления"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    from PIL import Image
+
+    from utils import image_cache
+
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+@pytest.mark.skipif(not PIL_AVAILABLE, reason="Требуется Pillow")
+class TestImageCache:
+
+    @pytest.fixture
+    def source(self, tmp_path) -> str:
+        image = Image.new("RGB", (4, 2), (30, 30, 30))
+        image.putpixel((0, 0), (200, 10, 10))
+        image.putpixel((1, 0), (30, 30, 31))
+        path = tmp_path / "source.png"
+        image.save(path)
+        return str(path)
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch) -> str:
+        cache_dir = str(tmp_path / "cache")
+        monkeypatch.setattr(image_cache, "CACHE_DIR", cache_dir)
+        monkeypatch.setattr(image_cache, "_images", {})
+        return cache_dir
+
+    def test_key_color_becomes_transparent(self, source) -> None:
+        with Image.open(source) as original:
+            result = image_cache.key_transparency(original)
+
+        assert result.mode == "RGBA"
+        assert result.getpixel((0, 0)) == (200, 10, 10, 255)
+        assert result.getpixel((1, 0)) == (30, 30, 31, 255)
+        assert result.getpixel((2, 0)) == (30, 30, 30, 0)
+
+    def test_fit_image_only_shrinks(self) -> None:
+        small = Image.new("RGB", (100, 100))
+        big = Image.new("RGB", (2000, 2000))
+
+        assert image_cache.fit_image(small, (1920, 1080)).size == (100, 100)
+        assert image_cache.fit_image(big, (1920, 1080)).size == (960, 960)
+
+    def test_processed_image_is_cached_on_disk(self, source, cache_dir) -> None:
+        image_cache.load_processed_image(source, (1920, 1080))
+
+        files = os.listdir(cache_dir)
+        assert len(files) == 1
+        assert files[0].endswith("_1920x1080.png")
+
+    def test_disk_cache_is_reused(self, source, monkeypatch) -> None:
+        image_cache.load_processed_image(source, (1920, 1080))
+        monkeypatch.setattr(image_cache, "_images", {})
+
+        def fail(*args, **kwargs):
+            raise AssertionError("картинка обработана повторно")
+
+        monkeypatch.setattr(image_cache, "key_transparency", fail)
+        result = image_cache.load_processed_image(source, (1920, 1080))
+
+        assert result.getpixel((2, 0))[3] == 0
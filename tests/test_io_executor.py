@@ -0,0 +1,89 @@
+"""Тесты IOExecutor - фонового ввода-вывода с порядком операций по файлу"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.io_executor import IOExecutor
+
+
+class FakeDispatcher:
+
+    def __init__(self) -> None:
+        self.posted: list = []
+
+    def post(self, callback, key=None) -> None:
+        self.posted.append(callback)
+
+    def flush(self) -> None:
+        posted, self.posted = self.posted, []
+        for callback in posted:
+            callback()
+
+
+class TestIOExecutor:
+
+    @pytest.fixture
+    def executor(self):
+        executor = IOExecutor(max_workers=4)
+        yield executor
+        executor.shutdown()
+
+    def test_operations_on_same_file_keep_order(self, executor, tmp_path) -> None:
+        path = str(tmp_path / "data.json")
+        order = []
+
+        def slow_write(value: int) -> None:
+            time.sleep(0.01 if value == 0 else 0)
+            order.append(value)
+
+        for value in range(5):
+            executor.submit(path, slow_write, value)
+        executor.wait()
+
+        assert order == [0, 1, 2, 3, 4]
+
+    def test_different_files_run_in_parallel(self, executor) -> None:
+        started = threading.Barrier(2, timeout=2)
+
+        first = executor.submit("a.json", started.wait)
+        second = executor.submit("b.json", started.wait)
+
+        first.result(timeout=2)
+        second.result(timeout=2)
+
+    def test_save_then_load_round_trip(self, executor, tmp_path) -> None:
+        path = str(tmp_path / "settings.json")
+
+        executor.save_async(path, {"theme": "тема"})
+        future = executor.load_async(path)
+
+        assert future.result(timeout=2) == {"theme": "тема"}
+
+    def test_missing_file_error_in_future(self, executor, tmp_path) -> None:
+        future = executor.load_async(str(tmp_path / "missing.json"))
+
+        with pytest.raises(FileNotFoundError):
+            future.result(timeout=2)
+
+    def test_callback_marshalled_through_dispatcher(self, tmp_path) -> None:
+        dispatcher = FakeDispatcher()
+        executor = IOExecutor(dispatcher)
+        results = []
+
+        executor.submit(
+            "key", lambda: 42, callback=lambda f: results.append(f.result())
+        )
+        executor.wait()
+
+        assert results == []
+        dispatcher.flush()
+        assert results == [42]
+        executor.shutdown()
@@ -0,0 +1,157 @@
+"""Тесты JournalStorage - журнального хранилища JSON-документов"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.journal_storage import JournalStorage, atomic_write_text
+
+
+class TestJournalStorage:
+
+    @pytest.fixture
+    def path(self, tmp_path) -> str:
+        return str(tmp_path / "data.json")
+
+    def read_journal(self, path: str) -> list[dict]:
+        with open(f"{path}.journal", "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def test_load_missing_raises(self, path: str) -> None:
+        with pytest.raises(FileNotFoundError):
+            JournalStorage(path).load()
+
+    def test_first_write_creates_snapshot(self, path: str) -> None:
+        storage = JournalStorage(path)
+        storage.set(["products", "Яблоко"], {"calories": 52})
+
+        with open(path, "r", encoding="utf-8") as f:
+            assert json.load(f) == {"products": {"Яблоко": {"calories": 52}}}
+        assert not os.path.exists(f"{path}.journal")
+
+    def test_legacy_json_is_read_as_snapshot(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"2025-01-01": [{"count": 10}]}, f, indent=2)
+
+        assert JournalStorage(path).load() == {"2025-01-01": [{"count": 10}]}
+
+    def test_changes_are_appended_not_rewritten(self, path: str) -> None:
+        atomic_write_text(path, '{"a": 1}')
+        storage = JournalStorage(path)
+        storage.load()
+
+        storage.set(["b"], 2)
+        storage.delete(["a"])
+
+        with open(path, "r", encoding="utf-8") as f:
+            assert json.load(f) == {"a": 1}
+        assert len(self.read_journal(path)) == 2
+        assert JournalStorage(path).load() == {"b": 2}
+
+    def test_commit_writes_batch(self, path: str) -> None:
+        atomic_write_text(path, "{}")
+        storage = JournalStorage(path)
+        storage.load()
+
+        storage.commit([(["x", "1"], 1), (["x", "2"], 2)], [["y"]])
+
+        assert len(self.read_journal(path)) == 3
+        assert JournalStorage(path).load() == {"x": {"1": 1, "2": 2}}
+
+    def test_sync_journals_only_changed_subtrees(self, path: str) -> None:
+        document = {
+            "habits": {"Утро": [{"name": "Зарядка"}], "Вечер": []},
+            "times": ["Утро", "Вечер"],
+        }
+        atomic_write_text(path, json.dumps(document))
+        storage = JournalStorage(path)
+        storage.load()
+
+        document["habits"]["Вечер"] = [{"name": "Чтение"}]
+        storage.sync(document, depth=2)
+
+        records = self.read_journal(path)
+        assert records == [
+            {"op": "set", "path": ["habits", "Вечер"], "value": [{"name": "Чтение"}]}
+        ]
+        assert JournalStorage(path).load() == document
+
+    def test_sync_replaces_legacy_list_root(self, path: str) -> None:
+        atomic_write_text(path, '[{"name": "old"}]')
+        storage = JournalStorage(path)
+        storage.load()
+
+        storage.sync({"habits": {}}, depth=2)
+
+        assert JournalStorage(path).load() == {"habits": {}}
+
+    def test_compact_folds_journal_into_snapshot(self, path: str) -> None:
+        atomic_write_text(path, "{}")
+        storage = JournalStorage(path)
+        storage.load()
+        storage.set(["a"], "б")
+
+        storage.compact()
+
+        with open(path, "r", encoding="utf-8") as f:
+            assert json.load(f) == {"a": "б"}
+        assert self.read_journal(path) == []
+
+    def test_compaction_runs_in_background(self, path: str) -> None:
+        atomic_write_text(path, "{}")
+        storage = JournalStorage(path, compact_threshold=3)
+        storage.load()
+
+        for i in range(3):
+            storage.set([str(i)], i)
+        storage._compaction.join(timeout=5)
+
+        assert self.read_journal(path) == []
+        assert JournalStorage(path).load() == {"0": 0, "1": 1, "2": 2}
+
+    def test_torn_last_line_is_skipped(self, path: str) -> None:
+        atomic_write_text(path, "{}")
+        with open(f"{path}.journal", "w", encoding="utf-8") as f:
+            f.write('{"op": "set", "path": ["a"], "value": 1}\n{"op": "se')
+
+        assert JournalStorage(path).load() == {"a": 1}
+
+    def test_append_after_torn_line_survives_reload(self, path: str) -> None:
+        """Новая запись после сбоя не склеивается с оборванной строкой"""
+        atomic_write_text(path, "{}")
+        with open(f"{path}.journal", "w", encoding="utf-8") as f:
+            f.write('{"op": "set", "path": ["a"], "value": 1}\n{"op": "se')
+
+        storage = JournalStorage(path)
+        storage.load()
+        storage.set(["b"], 2)
+
+        assert JournalStorage(path).load() == {"a": 1, "b": 2}
+        assert len(self.read_journal(path)) == 2
+
+    def test_complete_record_without_newline_is_kept(self, path: str) -> None:
+        atomic_write_text(path, "{}")
+        with open(f"{path}.journal", "w", encoding="utf-8") as f:
+            f.write('{"op": "set", "path": ["a"], "value": 1}')
+
+        storage = JournalStorage(path)
+        storage.load()
+        storage.set(["b"], 2)
+
+        assert JournalStorage(path).load() == {"a": 1, "b": 2}
+
+    def test_loaded_document_is_independent_copy(self, path: str) -> None:
+        atomic_write_text(path, '{"a": {"b": 1}}')
+        storage = JournalStorage(path)
+        data = storage.load()
+
+        data["a"]["b"] = 2
+        storage.sync(data, depth=2)
+
+        assert len(self.read_journal(path)) == 1
@@ -0,0 +1,62 @@
+"""Тесты LazyNotebook - вкладок, создаваемых при первом выборе"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    import tkinter as tk
+    from tkinter import ttk
+    from components.lazy_notebook import LazyNotebook
+
+    TKINTER_AVAILABLE = True
+except (ImportError, Exception):
+    TKINTER_AVAILABLE = False
+
+
+@pytest.mark.skipif(not TKINTER_AVAILABLE, reason="Требуется tkinter")
+class TestLazyNotebook:
+
+    @pytest.fixture
+    def root(self):
+        root = tk.Tk()
+        root.withdraw()
+        yield root
+        try:
+            root.destroy()
+        except tk.TclError:
+            pass
+
+    @pytest.fixture
+    def tabs(self, root) -> LazyNotebook:
+        notebook = ttk.Notebook(root)
+        notebook.pack()
+        return LazyNotebook(notebook)
+
+    def test_tab_built_only_on_demand(self, tabs: LazyNotebook) -> None:
+        built = []
+
+        def factory(frame):
+            built.append(frame)
+            return ttk.Label(frame, text="Вкладка")
+
+        frame = tabs.add("first", "Первая", factory)
+
+        assert built == []
+        tab = tabs.get("first")
+        assert built == [frame]
+        assert tabs.get("first") is tab
+
+    def test_selecting_tab_builds_it(self, root, tabs: LazyNotebook) -> None:
+        tabs.add("first", "Первая", lambda frame: ttk.Label(frame))
+        second = tabs.add("second", "Вторая", lambda frame: ttk.Label(frame))
+
+        tabs.notebook.select(second)
+        root.update()
+
+        assert tabs.is_built("second")
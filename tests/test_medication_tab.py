@@ -0,0 +1,60 @@
+"""Тесты реестра виджетов MedicationTab"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+from typing import Generator
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    import tkinter as tk
+    from tabs.medication_tab import MedicationTab
+    TKINTER_AVAILABLE = True
+except (ImportError, Exception):
+    TKINTER_AVAILABLE = False
+
+
+@pytest.mark.skipif(not TKINTER_AVAILABLE, reason="Требуется tkinter")
+class TestMedicationTab:
+
+    @pytest.fixture
+    def tab(self) -> Generator[MedicationTab, None, None]:
+        original_dir = os.getcwd()
+        os.chdir(tempfile.mkdtemp())
+        root = tk.Tk()
+        root.withdraw()
+        tab = MedicationTab(root)
+        tab.medications["Утро"] = [
+            {"name": "Витамин D", "taken": False},
+            {"name": "Омега-3", "taken": True},
+        ]
+        tab.update_intakes_display()
+        yield tab
+        os.chdir(original_dir)
+        root.destroy()
+
+    def test_registry_holds_intake_widgets(self, tab: MedicationTab) -> None:
+        widgets = tab.intake_widgets["Утро"]
+
+        assert widgets["mark_all"].cget("text") == "Отметить все"
+        assert len(widgets["checks"]) == 2
+
+    def test_toggle_all_updates_checks_and_button(self, tab: MedicationTab) -> None:
+        tab.toggle_all_medications("Утро")
+
+        widgets = tab.intake_widgets["Утро"]
+        assert all(check["var"].get() for check in widgets["checks"].values())
+        assert widgets["mark_all"].cget("text") == "Сбросить все"
+
+    def test_toggle_all_keeps_widgets(self, tab: MedicationTab) -> None:
+        children = tab.intakes_frame.winfo_children()
+
+        tab.toggle_all_medications("Утро")
+
+        assert tab.intakes_frame.winfo_children() == children
+        assert tab.intake_widgets["Обед"]["mark_all"].cget("text") == "Отметить все"
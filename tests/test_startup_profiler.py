@@ -0,0 +1,87 @@
+"""Тесты StartupProfiler - замера холодного старта по фазам"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.startup_profiler import STARTUP_TARGET_MS, StartupProfiler
+from tests.fakes import FakeClock
+
+
+class TestStartupProfiler:
+
+    def test_disabled_profiler_records_nothing(self) -> None:
+        """Без флага --profile-startup фазы не записываются"""
+        profiler = StartupProfiler(FakeClock(0.0))
+
+        with profiler.phase("импорты"):
+            pass
+
+        assert profiler.phases == []
+
+    def test_phase_measures_elapsed_time(self) -> None:
+        """phase() записывает длительность блока по часам профилировщика"""
+        clock = FakeClock(0.0)
+        profiler = StartupProfiler(clock)
+        profiler.enable()
+
+        with profiler.phase("импорты"):
+            clock.value += 0.25
+
+        assert profiler.phases == [("импорты", 0.25)]
+
+    def test_phase_recorded_on_exception(self) -> None:
+        """Фаза записывается, даже если блок упал"""
+        clock = FakeClock(0.0)
+        profiler = StartupProfiler(clock)
+        profiler.enable()
+
+        try:
+            with profiler.phase("тема"):
+                clock.value += 0.1
+                raise RuntimeError
+        except RuntimeError:
+            pass
+
+        assert [name for name, _ in profiler.phases] == ["тема"]
+
+    def test_finish_reports_total_against_target(self) -> None:
+        """Отчёт содержит фазы и итог относительно цели"""
+        clock = FakeClock(0.0)
+        profiler = StartupProfiler(clock)
+        profiler.enable()
+
+        with profiler.phase("импорты"):
+            clock.value += 0.3
+        clock.value += 0.2
+
+        report = profiler.finish()
+
+        assert "импорты" in report
+        assert "Итого: 500.0 мс" in report
+        assert f"в пределах цели {STARTUP_TARGET_MS} мс" in report
+
+    def test_slow_start_is_flagged(self) -> None:
+        """Старт дольше цели помечается в отчёте"""
+        clock = FakeClock(0.0)
+        profiler = StartupProfiler(clock)
+        profiler.enable()
+        clock.value += STARTUP_TARGET_MS / 1000 + 0.5
+
+        assert "выше цели" in profiler.finish()
+
+    def test_phases_after_finish_are_printed(self, capsys) -> None:
+        """Вкладки, построенные после старта, печатаются сразу"""
+        clock = FakeClock(0.0)
+        profiler = StartupProfiler(clock)
+        profiler.enable()
+        profiler.finish()
+
+        with profiler.phase("вкладка habits"):
+            clock.value += 0.05
+
+        assert profiler.phases == []
+        assert "вкладка habits: 50.0 мс" in capsys.readouterr().out
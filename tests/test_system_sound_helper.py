@@ -0,0 +1,123 @@
+"""Тесты SystemSoundHelper - постоянного помощника paplay"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import stat
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.sound_utils import SystemSoundHelper
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("sh") is None, reason="Требуется POSIX shell"
+)
+
+FAKE_PAPLAY = """#!/bin/sh
+echo "start $1" >> "{log}"
+trap 'echo "stop $1" >> "{log}"; exit 0' TERM
+sleep 5 &
+wait
+"""
+
+
+def read_log(path: str) -> list[str]:
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return f.read().splitlines()
+
+
+def wait_for(predicate, timeout: float = 3.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+@pytest.fixture
+def log_path(tmp_path, monkeypatch) -> str:
+    """Подменяет paplay скриптом, который пишет запуски и остановки в лог"""
+    log = str(tmp_path / "paplay.log")
+    paplay = tmp_path / "paplay"
+    paplay.write_text(FAKE_PAPLAY.format(log=log))
+    paplay.chmod(paplay.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    return log
+
+
+@pytest.fixture
+def helper(log_path):
+    helper = SystemSoundHelper()
+    yield helper
+    helper.stop()
+    helper.close()
+
+
+class TestSystemSoundHelper:
+
+    def test_play_does_not_block(self, helper, log_path) -> None:
+        """play возвращается сразу, звук продолжает играть в фоне"""
+        started = time.monotonic()
+
+        assert helper.play("/sounds/complete.oga") is True
+
+        assert time.monotonic() - started < 1
+        assert wait_for(lambda: read_log(log_path) == ["start /sounds/complete.oga"])
+
+    def test_helper_process_reused(self, helper, log_path) -> None:
+        """Все команды идут в один процесс-помощник"""
+        helper.play("/sounds/complete.oga")
+        first = helper._process
+
+        helper.play("/sounds/complete.oga")
+
+        assert helper._process is first
+
+    def test_overlapping_plays_coalesced(self, helper, log_path) -> None:
+        """Пока звук играет, повторные play не запускают новых paplay"""
+        for _ in range(5):
+            helper.play("/sounds/complete.oga")
+        wait_for(lambda: read_log(log_path))
+        time.sleep(0.2)
+
+        assert read_log(log_path) == ["start /sounds/complete.oga"]
+
+    def test_stop_is_immediate(self, helper, log_path) -> None:
+        """stop глушит текущий звук, не дожидаясь его окончания"""
+        helper.play("/sounds/complete.oga")
+        wait_for(lambda: read_log(log_path))
+
+        helper.stop()
+
+        assert wait_for(lambda: "stop /sounds/complete.oga" in read_log(log_path), 1)
+
+    def test_stop_ignores_other_owners(self, helper, log_path) -> None:
+        """stop(owner) не глушит звук, поставленный другим владельцем"""
+        first, second = object(), object()
+        helper.play("/sounds/complete.oga", owner=first)
+        helper.play("/sounds/message.oga", owner=second)
+        wait_for(lambda: read_log(log_path))
+
+        helper.stop(first)
+        time.sleep(0.2)
+        assert not any(line.startswith("stop") for line in read_log(log_path))
+
+        helper.stop(second)
+        assert wait_for(
+            lambda: any(line.startswith("stop") for line in read_log(log_path)), 1
+        )
+
+    def test_unavailable_without_paplay(self, monkeypatch, tmp_path) -> None:
+        """Без paplay play сообщает о неудаче, а не падает"""
+        monkeypatch.setenv("PATH", str(tmp_path))
+        helper = SystemSoundHelper()
+
+        assert helper.play("/sounds/complete.oga") is False
@@ -0,0 +1,103 @@
+"""Тесты TickScheduler - единого планировщика тиков таймеров"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.tick_scheduler import TickScheduler
+from tests.fakes import FakeClock, FakeWidget
+
+
+class TestTickScheduler:
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def widget(self, clock: FakeClock) -> FakeWidget:
+        return FakeWidget(clock)
+
+    @pytest.fixture
+    def scheduler(self, widget: FakeWidget, clock: FakeClock) -> TickScheduler:
+        return TickScheduler(widget, clock=clock)
+
+    def test_callback_fires_at_deadline(self, scheduler, widget) -> None:
+        fired = []
+        scheduler.call_later(2.0, lambda: fired.append(scheduler.now()))
+
+        widget.advance(1.9)
+        assert fired == []
+
+        widget.advance(0.2)
+        assert fired == [pytest.approx(102.0)]
+
+    def test_single_after_armed_for_many_timers(self, scheduler, widget) -> None:
+        for i in range(50):
+            scheduler.call_later(1.0 + i, lambda: None)
+
+        assert len(widget.pending) == 1
+
+    def test_earlier_deadline_rearms(self, scheduler, widget) -> None:
+        scheduler.call_later(10.0, lambda: None)
+        scheduler.call_later(1.0, lambda: None)
+
+        assert len(widget.pending) == 1
+        when, _ = next(iter(widget.pending.values()))
+        assert when == pytest.approx(101.0)
+
+    def test_due_callbacks_run_in_one_wakeup(self, scheduler, widget) -> None:
+        fired = []
+        for name in ["a", "b", "c"]:
+            scheduler.call_at(105.0, lambda n=name: fired.append(n))
+
+        widget.advance(5.0)
+
+        assert sorted(fired) == ["a", "b", "c"]
+        assert widget.counter == 1
+
+    def test_cancel_prevents_callback(self, scheduler, widget) -> None:
+        fired = []
+        handle = scheduler.call_later(1.0, lambda: fired.append(1))
+
+        scheduler.cancel(handle)
+        widget.advance(2.0)
+
+        assert fired == []
+        assert scheduler.pending_count() == 0
+
+    def test_cancel_none_is_noop(self, scheduler) -> None:
+        scheduler.cancel(None)
+
+    def test_rescheduling_chain_has_no_drift(self, scheduler, widget) -> None:
+        """Тики по абсолютным дедлайнам не накапливают опоздание"""
+        ticks = []
+        deadline = scheduler.now() + 3600
+
+        def tick() -> None:
+            ticks.append(scheduler.now())
+            remaining = deadline - scheduler.now()
+            if remaining > 0:
+                scheduler.call_at(deadline - int(remaining - 1e-9), tick)
+
+        scheduler.call_later(0, tick)
+        widget.advance(3600.5)
+
+        assert ticks[-1] == pytest.approx(deadline, abs=0.002)
+
+    def test_callback_error_does_not_stop_others(self, scheduler, widget) -> None:
+        fired = []
+
+        def broken() -> None:
+            raise ValueError("boom")
+
+        scheduler.call_later(1.0, broken)
+        scheduler.call_later(1.0, lambda: fired.append(1))
+        widget.advance(1.5)
+
+        assert fired == [1]
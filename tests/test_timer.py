@@ -120,6 +120,26 @@ class TestTimer:
 
         assert timer.time_label.cget("text") == "00:00:00"
 
+    def test_start_after_arrow_uses_new_value(self, timer: Timer) -> None:
+        """Стрелка меняет значение после привязок виджета - старт видит 6 минут"""
+        timer.apply_preset(5)
+
+        timer.minutes.event_generate("<<Increment>>")
+        timer.start_timer()
+
+        assert timer.minutes.get() == "6"
+        assert timer.remaining_time == 6 * 60
+        timer.stop_timer()
+
+    def test_start_rereads_fields_without_events(self, timer: Timer) -> None:
+        timer.apply_preset(5)
+        timer.minutes.set("7")
+
+        timer.start_timer()
+
+        assert timer.remaining_time == 7 * 60
+        timer.stop_timer()
+
     def test_choose_sound_updates_button(self, timer: Timer) -> None:
         timer.custom_sound = "/some/sound.mp3"
         timer.sound_button.config(text="🔊 ✓")
@@ -152,7 +172,6 @@ class TestTimer:
 
     def test_stop_alarm_resets_state(self, timer: Timer) -> None:
         timer.alarm_active = True
-        timer.is_running = True
 
         timer.stop_alarm()
 
@@ -0,0 +1,386 @@
+"""Тесты TimerEngine - состояния таймера без Tk"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from components.timer_engine import (
+    IDLE,
+    PAUSED,
+    PHASE,
+    RINGING,
+    RUNNING,
+    STATE,
+    TICK,
+    TimerEngine,
+)
+from components.timer_sequence import Phase, TimerSequence
+from utils.tick_scheduler import TickScheduler
+from tests.fakes import FakeClock, FakeWidget
+
+
+class TestTimerEngine:
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def widget(self, clock: FakeClock) -> FakeWidget:
+        return FakeWidget(clock)
+
+    @pytest.fixture
+    def scheduler(self, widget: FakeWidget, clock: FakeClock) -> TickScheduler:
+        return TickScheduler(widget, clock=clock)
+
+    @pytest.fixture
+    def engine(self, scheduler: TickScheduler) -> TimerEngine:
+        engine = TimerEngine(scheduler)
+        engine.set_duration(10)
+        return engine
+
+    def test_initial_state(self, scheduler: TickScheduler) -> None:
+        engine = TimerEngine(scheduler)
+
+        assert engine.state == IDLE
+        assert engine.remaining_time == 0
+        assert engine.initial_time is None
+        assert engine.progress() == 1.0
+
+    def test_set_duration_updates_idle_remaining(self, engine: TimerEngine) -> None:
+        """В покое остаток показывает заданную длительность"""
+        engine.set_duration(90)
+
+        assert engine.duration == 90
+        assert engine.remaining_time == 90
+
+    def test_start_counts_down(self, engine: TimerEngine, widget: FakeWidget) -> None:
+        assert engine.start() is True
+        assert engine.state == RUNNING
+        assert engine.remaining_time == 10
+
+        widget.advance(3)
+
+        assert engine.remaining_time == 7
+        assert engine.initial_time == 10
+
+    def test_zero_duration_does_not_start(self, scheduler: TickScheduler) -> None:
+        engine = TimerEngine(scheduler)
+
+        assert engine.start() is False
+        assert engine.state == IDLE
+
+    def test_rings_at_deadline(self, engine: TimerEngine, widget: FakeWidget) -> None:
+        """По истечении дедлайна таймер переходит в ringing с нулевым остатком"""
+        engine.start()
+
+        widget.advance(10)
+
+        assert engine.state == RINGING
+        assert engine.remaining_time == 0
+        assert engine.progress() == 0.0
+
+    def test_pause_and_resume_keep_remaining(
+        self, engine: TimerEngine, widget: FakeWidget
+    ) -> None:
+        """Пауза останавливает отсчёт, продолжение идёт от остатка"""
+        engine.start()
+        widget.advance(4)
+
+        assert engine.pause() is True
+        widget.advance(100)
+
+        assert engine.state == PAUSED
+        assert engine.paused_time == pytest.approx(6)
+
+        engine.start()
+        widget.advance(5)
+        assert engine.remaining_time == 1
+
+        widget.advance(1)
+        assert engine.state == RINGING
+
+    def test_stop_resets_to_duration(
+        self, engine: TimerEngine, widget: FakeWidget, scheduler: TickScheduler
+    ) -> None:
+        engine.start()
+        widget.advance(4)
+
+        engine.stop()
+
+        assert engine.state == IDLE
+        assert engine.remaining_time == 10
+        assert engine.paused_time == 0
+        assert scheduler.pending_count() == 0
+
+    def test_duration_change_does_not_affect_running(
+        self, engine: TimerEngine, widget: FakeWidget
+    ) -> None:
+        """Новая длительность применяется только к следующему запуску"""
+        engine.start()
+        engine.set_duration(60)
+        widget.advance(10)
+
+        assert engine.state == RINGING
+
+        engine.start()
+        assert engine.remaining_time == 60
+
+    def test_listeners_receive_events(
+        self, engine: TimerEngine, widget: FakeWidget
+    ) -> None:
+        """Подписчик получает тик на каждую секунду и смены состояния"""
+        events: list[tuple[str, str, int]] = []
+        engine.add_listener(
+            lambda event: events.append((event, engine.state, engine.remaining_time))
+        )
+
+        engine.start()
+        widget.advance(2)
+        engine.pause()
+
+        assert events == [
+            (STATE, RUNNING, 10),
+            (TICK, RUNNING, 10),
+            (TICK, RUNNING, 9),
+            (TICK, RUNNING, 8),
+            (STATE, PAUSED, 8),
+        ]
+
+    def test_listener_can_stop_from_tick(
+        self, engine: TimerEngine, widget: FakeWidget, scheduler: TickScheduler
+    ) -> None:
+        """Остановка из обработчика тика не оставляет запланированных тиков"""
+        engine.add_listener(lambda event: event == TICK and engine.stop())
+
+        engine.start()
+
+        assert engine.state == IDLE
+        assert scheduler.pending_count() == 0
+
+    def test_removed_listener_not_called(self, engine: TimerEngine) -> None:
+        events: list[str] = []
+        engine.add_listener(events.append)
+        engine.remove_listener(events.append)
+
+        engine.start()
+
+        assert events == []
+
+    def restored(
+        self, scheduler: TickScheduler, state: dict, wall_now: float
+    ) -> TimerEngine:
+        """Движок после перезапуска: новые монотонные часы, та же длительность"""
+        engine = TimerEngine(scheduler, wall_clock=lambda: wall_now)
+        engine.set_duration(10)
+        engine.restore(state)
+        return engine
+
+    def test_snapshot_idle(self, engine: TimerEngine) -> None:
+        assert engine.snapshot() == {"state": IDLE, "initial_time": None}
+
+    def test_running_resumes_against_wall_clock(
+        self, scheduler: TickScheduler, widget: FakeWidget
+    ) -> None:
+        """Идущий таймер продолжается с учётом времени, пока приложение было закрыто"""
+        before = TimerEngine(scheduler, wall_clock=lambda: 5000.0)
+        before.set_duration(600)
+        before.start()
+        state = before.snapshot()
+        before.stop()
+
+        assert state == {"state": RUNNING, "initial_time": 600, "deadline_at": 5600.0}
+
+        engine = self.restored(scheduler, state, wall_now=5450.0)
+        widget.advance(0)
+
+        assert engine.state == RUNNING
+        assert engine.remaining_time == 150
+        assert engine.initial_time == 600
+
+        widget.advance(150)
+        assert engine.state == RINGING
+
+    def test_paused_restored(self, scheduler: TickScheduler) -> None:
+        state = {"state": PAUSED, "initial_time": 600, "paused_remaining": 42.5}
+
+        engine = self.restored(scheduler, state, wall_now=9999.0)
+
+        assert engine.state == PAUSED
+        assert engine.remaining_time == 43
+        assert engine.start() is True
+        assert engine.remaining_time == 43
+
+    def test_expired_while_down_rings_after_load(
+        self, scheduler: TickScheduler, widget: FakeWidget
+    ) -> None:
+        """Истёкший за время простоя таймер звенит, но не внутри restore()"""
+        state = {"state": RUNNING, "initial_time": 60, "deadline_at": 1000.0}
+
+        engine = self.restored(scheduler, state, wall_now=2000.0)
+
+        assert engine.state == RUNNING
+        widget.advance(0)
+        assert engine.state == RINGING
+
+    def test_ringing_restored_as_catch_up_alarm(
+        self, scheduler: TickScheduler, widget: FakeWidget
+    ) -> None:
+        state = {"state": RINGING, "initial_time": 60}
+
+        engine = self.restored(scheduler, state, wall_now=2000.0)
+        widget.advance(0)
+
+        assert engine.state == RINGING
+
+    def test_unknown_state_ignored(self, scheduler: TickScheduler) -> None:
+        engine = self.restored(scheduler, {"state": "broken"}, wall_now=0.0)
+
+        assert engine.state == IDLE
+        assert engine.remaining_time == 10
+
+    def sequence_engine(self, scheduler: TickScheduler) -> TimerEngine:
+        engine = TimerEngine(scheduler)
+        engine.set_sequence(
+            TimerSequence([Phase("Фокус", 25), Phase("Перерыв", 5)], cycles=2)
+        )
+        return engine
+
+    def test_sequence_sets_first_phase_duration(self, scheduler: TickScheduler) -> None:
+        engine = self.sequence_engine(scheduler)
+
+        assert engine.duration == 25
+        assert engine.remaining_time == 25
+
+    def test_sequence_advances_without_gap(
+        self, scheduler: TickScheduler, widget: FakeWidget, clock: FakeClock
+    ) -> None:
+        """Следующая фаза отсчитывается от дедлайна предыдущей"""
+        engine = self.sequence_engine(scheduler)
+        phases: list[str] = []
+        engine.add_listener(
+            lambda event: event == PHASE and phases.append(engine.sequence.current.name)
+        )
+        started = clock.value
+
+        engine.start()
+        widget.advance(25)
+
+        assert phases == ["Перерыв"]
+        assert engine.state == RUNNING
+        assert engine.deadline == pytest.approx(started + 30)
+        assert engine.remaining_time == 5
+
+    def test_sequence_rings_only_at_end(
+        self, scheduler: TickScheduler, widget: FakeWidget
+    ) -> None:
+        engine = self.sequence_engine(scheduler)
+        states: list[str] = []
+        engine.add_listener(
+            lambda event: event == STATE and states.append(engine.state)
+        )
+
+        engine.start()
+        widget.advance(59)
+        assert engine.state == RUNNING
+
+        widget.advance(1)
+        assert engine.state == RINGING
+        assert states == [RUNNING, RINGING]
+
+    def test_sequence_progress_spans_all_phases(
+        self, scheduler: TickScheduler, widget: FakeWidget
+    ) -> None:
+        """Прогресс общий для всей цепочки, а не для текущей фазы"""
+        engine = self.sequence_engine(scheduler)
+
+        engine.start()
+        widget.advance(30)
+
+        assert engine.progress() == pytest.approx(0.5)
+
+    def test_stop_rewinds_sequence(
+        self, scheduler: TickScheduler, widget: FakeWidget
+    ) -> None:
+        engine = self.sequence_engine(scheduler)
+        engine.start()
+        widget.advance(40)
+
+        engine.stop()
+
+        assert engine.sequence.position == 0
+        assert engine.remaining_time == 25
+
+    def test_snooze_keeps_sequence(
+        self, scheduler: TickScheduler, widget: FakeWidget
+    ) -> None:
+        """Отложенный звонок цепочки - разовый отсчёт, а не новый цикл"""
+        engine = self.sequence_engine(scheduler)
+        engine.start()
+        widget.advance(60)
+        assert engine.state == RINGING
+
+        assert engine.snooze(3) is True
+
+        assert engine.state == RUNNING
+        assert engine.remaining_time == 3
+        assert engine.sequence.position == 3
+        assert engine.duration == 25
+
+        widget.advance(3)
+
+        assert engine.state == RINGING
+        assert engine.sequence.position == 3
+
+    def test_snooze_plain_timer_keeps_duration(
+        self, engine: TimerEngine, widget: FakeWidget
+    ) -> None:
+        engine.start()
+        widget.advance(10)
+
+        engine.snooze(5)
+        widget.advance(5)
+
+        assert engine.state == RINGING
+        assert engine.duration == 10
+
+    def test_sequence_restore_skips_finished_phases(
+        self, scheduler: TickScheduler, widget: FakeWidget
+    ) -> None:
+        """Фазы, прошедшие за время простоя, пропускаются по реальным часам"""
+        state = {
+            "state": RUNNING,
+            "initial_time": 25,
+            "deadline_at": 1000.0,
+            "position": 0,
+        }
+        engine = TimerEngine(scheduler, wall_clock=lambda: 1008.0)
+        engine.set_sequence(
+            TimerSequence([Phase("Фокус", 25), Phase("Перерыв", 5)], cycles=2)
+        )
+
+        engine.restore(state)
+        widget.advance(0)
+
+        assert engine.sequence.position == 2
+        assert engine.remaining_time == 22
+        assert engine.snapshot()["position"] == 2
+
+    def test_many_timers_headless(self, scheduler: TickScheduler, widget) -> None:
+        """Тысячи таймеров отрабатывают без дисплея через один планировщик"""
+        engines = []
+        for index in range(2000):
+            engine = TimerEngine(scheduler)
+            engine.set_duration(1 + index % 5)
+            engine.start()
+            engines.append(engine)
+
+        widget.advance(5)
+
+        assert all(engine.state == RINGING for engine in engines)
+        assert scheduler.pending_count() == 0
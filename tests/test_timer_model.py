@@ -0,0 +1,164 @@
+"""Тесты TimerModel и сводки VirtualTimerList - таймеров без строк списка"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from components.timer_engine import PAUSED, RUNNING, STATE, TICK
+from components.timer_model import CHANGED, DEFAULT_DESCRIPTION, TimerModel
+from components.timer_sequence import pomodoro_sequence
+from components.virtual_timer_list import offscreen_running, summary_text
+from utils.tick_scheduler import TickScheduler
+from tests.fakes import FakeClock, FakeWidget
+
+
+@pytest.fixture
+def widget() -> FakeWidget:
+    return FakeWidget(FakeClock())
+
+
+@pytest.fixture
+def scheduler(widget: FakeWidget) -> TickScheduler:
+    return TickScheduler(widget, clock=widget.clock)
+
+
+def make_timer(
+    scheduler: TickScheduler, description: str, seconds: int = 60
+) -> TimerModel:
+    model = TimerModel(None, scheduler)
+    model.set_description(description)
+    model.set_duration(seconds)
+    return model
+
+
+class TestTimerModel:
+
+    def test_initial_state(self, scheduler: TickScheduler) -> None:
+        model = TimerModel(None, scheduler)
+
+        assert model.description == DEFAULT_DESCRIPTION
+        assert model.custom_sound is None
+        assert model.is_running is False
+        assert model.remaining_time == 0
+
+    def test_field_changes_notify_changed(self, scheduler: TickScheduler) -> None:
+        """Строка списка перерисовывается по CHANGED"""
+        model = TimerModel(None, scheduler)
+        events: list[str] = []
+        model.add_listener(events.append)
+
+        model.set_description("Чтение")
+        model.set_duration(90)
+
+        assert events.count(CHANGED) == 2
+        assert model.remaining_time == 90
+
+    def test_engine_events_forwarded(
+        self, scheduler: TickScheduler, widget: FakeWidget
+    ) -> None:
+        model = make_timer(scheduler, "Фокус", 10)
+        events: list[str] = []
+        model.add_listener(events.append)
+
+        model.start_timer()
+        widget.advance(2)
+
+        assert STATE in events
+        assert TICK in events
+        assert model.remaining_time == 8
+
+    def test_removed_listener_not_called(self, scheduler: TickScheduler) -> None:
+        model = TimerModel(None, scheduler)
+        events: list[str] = []
+        model.add_listener(events.append)
+        model.remove_listener(events.append)
+
+        model.set_description("Без подписчиков")
+
+        assert events == []
+
+    def test_to_dict_splits_duration(self, scheduler: TickScheduler) -> None:
+        model = make_timer(scheduler, "Отчёт", 3600 + 30 * 60 + 45)
+        model.custom_sound = "/path/to/sound.mp3"
+
+        result = model.to_dict()
+
+        assert result["description"] == "Отчёт"
+        assert (result["hours"], result["minutes"], result["seconds"]) == (
+            "1",
+            "30",
+            "45",
+        )
+        assert result["custom_sound"] == "/path/to/sound.mp3"
+        assert result["sequence"] is None
+
+    def test_load_dict_round_trip(
+        self, scheduler: TickScheduler, widget: FakeWidget
+    ) -> None:
+        """Пауза, звук и последовательность переживают сохранение"""
+        source = make_timer(scheduler, "Помодоро")
+        source.set_sequence(pomodoro_sequence())
+        source.custom_sound = "/path/to/sound.mp3"
+        source.start_timer()
+        widget.advance(60)
+        source.pause_timer()
+
+        restored = TimerModel(None, scheduler)
+        restored.load_dict(source.to_dict())
+
+        assert restored.description == "Помодоро"
+        assert restored.custom_sound == "/path/to/sound.mp3"
+        assert restored.engine.sequence is not None
+        assert restored.engine.state == PAUSED
+        assert restored.remaining_time == 24 * 60
+
+    def test_load_dict_tolerates_bad_fields(self, scheduler: TickScheduler) -> None:
+        model = TimerModel(None, scheduler)
+
+        model.load_dict(
+            {
+                "description": "Старый файл",
+                "hours": "abc",
+                "minutes": "5",
+                "seconds": "",
+                "sequence": {"phases": []},
+            }
+        )
+
+        assert model.engine.duration == 5 * 60
+        assert model.engine.sequence is None
+
+
+class TestOffscreenSummary:
+
+    def test_only_running_outside_window(self, scheduler: TickScheduler) -> None:
+        models = [make_timer(scheduler, f"Таймер {i}") for i in range(6)]
+        for position in (0, 2, 5):
+            models[position].start_timer()
+
+        hidden = offscreen_running(models, 1, 4)
+
+        assert hidden == [models[0], models[5]]
+        assert all(model.engine.state == RUNNING for model in hidden)
+
+    def test_summary_lists_remaining_time(self, scheduler: TickScheduler) -> None:
+        model = make_timer(scheduler, "Чай", 3 * 60)
+        model.start_timer()
+
+        assert summary_text([model]) == "Вне экрана: ▶ Чай — 00:03:00"
+
+    def test_summary_truncates_long_list(self, scheduler: TickScheduler) -> None:
+        models = [make_timer(scheduler, f"Т{i}") for i in range(5)]
+
+        text = summary_text(models, limit=2)
+
+        assert text.count("▶") == 2
+        assert text.endswith("и ещё 3")
+
+    def test_empty_summary(self) -> None:
+        assert summary_text([]) == ""
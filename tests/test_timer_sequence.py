@@ -0,0 +1,116 @@
+"""Тесты TimerSequence - последовательности фаз таймера"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from components.timer_sequence import (
+    Phase,
+    TimerSequence,
+    long_focus_sequence,
+    pomodoro_sequence,
+)
+
+WORK = Phase("Фокус", 25)
+REST = Phase("Перерыв", 5)
+LONG = Phase("Длинный перерыв", 15)
+
+
+def walk(sequence: TimerSequence) -> list[str]:
+    """Имена всех фаз от текущей до конца"""
+    names = [sequence.current.name]
+    while sequence.advance():
+        names.append(sequence.current.name)
+    return names
+
+
+class TestTimerSequence:
+
+    def test_phases_repeat_for_cycles(self) -> None:
+        sequence = TimerSequence([WORK, REST], cycles=2)
+
+        assert walk(sequence) == ["Фокус", "Перерыв", "Фокус", "Перерыв"]
+
+    def test_long_break_replaces_every_nth_rest(self) -> None:
+        """Длинный перерыв заменяет последнюю фазу каждого N-го цикла"""
+        sequence = TimerSequence(
+            [WORK, REST], cycles=4, long_break=LONG, long_break_every=2
+        )
+
+        assert walk(sequence) == [
+            "Фокус",
+            "Перерыв",
+            "Фокус",
+            "Длинный перерыв",
+            "Фокус",
+            "Перерыв",
+            "Фокус",
+            "Длинный перерыв",
+        ]
+
+    def test_advance_stops_at_end(self) -> None:
+        sequence = TimerSequence([WORK], cycles=1)
+
+        assert sequence.advance() is False
+        assert sequence.position == 0
+
+    def test_cycle_number(self) -> None:
+        sequence = TimerSequence([WORK, REST], cycles=3)
+        sequence.seek(3)
+
+        assert sequence.cycle == 2
+        assert sequence.describe() == "Перерыв · цикл 2/3"
+
+    def test_seek_is_clamped(self) -> None:
+        sequence = TimerSequence([WORK, REST], cycles=2)
+
+        sequence.seek(100)
+
+        assert sequence.position == 3
+
+    def test_total_and_remaining_seconds(self) -> None:
+        sequence = TimerSequence(
+            [WORK, REST], cycles=2, long_break=LONG, long_break_every=2
+        )
+
+        assert sequence.total_seconds() == 25 + 5 + 25 + 15
+        sequence.seek(1)
+        assert sequence.seconds_after_current() == 25 + 15
+
+    def test_empty_or_zero_phase_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            TimerSequence([])
+        with pytest.raises(ValueError):
+            TimerSequence([Phase("Пусто", 0)])
+
+    def test_json_roundtrip(self) -> None:
+        sequence = pomodoro_sequence()
+
+        restored = TimerSequence.from_json(sequence.to_json())
+
+        assert restored.phases == sequence.phases
+        assert restored.cycles == sequence.cycles
+        assert restored.long_break == sequence.long_break
+        assert restored.long_break_every == sequence.long_break_every
+
+    def test_json_without_long_break(self) -> None:
+        data = long_focus_sequence().to_json()
+
+        assert "long_break" not in data
+        assert TimerSequence.from_json(data).long_break is None
+
+    def test_broken_json_raises(self) -> None:
+        with pytest.raises((KeyError, ValueError, TypeError)):
+            TimerSequence.from_json({"phases": [["Фокус", "много"]]})
+
+    def test_pomodoro_ends_with_long_break(self) -> None:
+        names = walk(pomodoro_sequence())
+
+        assert len(names) == 8
+        assert names[-1] == "🌴 Длинный перерыв"
+        assert names.count("☕️ Короткий перерыв") == 3
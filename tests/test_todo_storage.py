@@ -0,0 +1,134 @@
+"""
+Тесты TodoStorage
+
+Особенности:
+- Проверяет фильтрацию по модели и кэш поиска в нижнем регистре
+- Проверяет перестановку, удаление выполненных и сохранение в todos.json
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import Generator
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tabs.todo_storage import TodoStorage
+from utils.io_executor import IOExecutor
+
+
+class TestTodoStorage:
+
+    @pytest.fixture
+    def storage(self, tmp_path) -> Generator[TodoStorage, None, None]:
+        original_dir = os.getcwd()
+        os.chdir(tmp_path)
+        storage = TodoStorage()
+        yield storage
+        os.chdir(original_dir)
+
+    def texts(self, storage: TodoStorage) -> list[str]:
+        return [item.text for item in storage.items]
+
+    def test_matches_filter_and_query(self, storage: TodoStorage) -> None:
+        milk = storage.add("Купить Молоко")
+        report = storage.add("Отчёт")
+        storage.set_done(report, True)
+
+        assert milk.matches("all", "молоко")
+        assert not milk.matches("all", "хлеб")
+        assert milk.matches("active", "")
+        assert not report.matches("active", "")
+        assert report.matches("completed", "отч")
+
+    def test_set_text_updates_search_key(self, storage: TodoStorage) -> None:
+        item = storage.add("Старое")
+
+        storage.set_text(item, "Новое Название")
+
+        assert item.matches("all", "новое")
+        assert not item.matches("all", "старое")
+
+    def test_move_swaps_with_neighbor(self, storage: TodoStorage) -> None:
+        first = storage.add("1")
+        second = storage.add("2")
+
+        assert storage.move(second, -1) is first
+        assert self.texts(storage) == ["2", "1"]
+        assert storage.move(second, -1) is None
+
+    def test_remove_completed(self, storage: TodoStorage) -> None:
+        storage.add("1")
+        done = storage.add("2")
+        storage.set_done(done, True)
+
+        assert storage.remove_completed() == [done]
+        assert self.texts(storage) == ["1"]
+
+    def test_save_and_load(self, storage: TodoStorage, tmp_path) -> None:
+        storage.add("Задача")
+        storage.set_done(storage.add("Готово"), True)
+        storage.save()
+
+        with open(tmp_path / "todos.json", encoding="utf-8") as f:
+            assert "Задача" in f.read()
+
+        reloaded = TodoStorage()
+        assert self.texts(reloaded) == ["Задача", "Готово"]
+        assert [item.done for item in reloaded.items] == [False, True]
+
+    def test_save_skipped_without_changes(self, storage: TodoStorage, tmp_path) -> None:
+        storage.save()
+
+        assert not (tmp_path / "todos.json").exists()
+
+    def test_corrupted_file_gives_empty_list(self, tmp_path) -> None:
+        original_dir = os.getcwd()
+        os.chdir(tmp_path)
+        (tmp_path / "todos.json").write_text("{", encoding="utf-8")
+
+        assert TodoStorage().items == []
+        os.chdir(original_dir)
+
+    def test_load_async_through_executor(self, storage: TodoStorage, tmp_path) -> None:
+        storage.add("Задача")
+        storage.save()
+        executor = IOExecutor()
+        loaded = []
+
+        background = TodoStorage(executor=executor)
+        assert background.snapshot() is None
+
+        background.load_async(lambda: loaded.append(True))
+        executor.shutdown()
+
+        assert loaded == [True]
+        assert self.texts(background) == ["Задача"]
+
+    def test_tasks_added_before_load_are_kept(self, storage: TodoStorage) -> None:
+        """Задача, добавленная до окончания загрузки, не затирается файлом"""
+        storage.add("Из файла")
+        storage.save()
+        executor = IOExecutor()
+
+        background = TodoStorage(executor=executor)
+        background.add("Добавлена до загрузки")
+        background.load_async(lambda: None)
+        executor.shutdown()
+
+        assert self.texts(background) == ["Из файла", "Добавлена до загрузки"]
+        background.save()
+        assert self.texts(TodoStorage()) == ["Из файла", "Добавлена до загрузки"]
+
+    def test_failed_write_is_retried(self, storage: TodoStorage, tmp_path) -> None:
+        storage.add("Задача")
+        storage.path = str(tmp_path / "missing" / "todos.json")
+        storage.save()
+
+        storage.path = "todos.json"
+        storage.save()
+
+        assert self.texts(TodoStorage()) == ["Задача"]
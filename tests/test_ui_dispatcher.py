@@ -0,0 +1,93 @@
+"""Тесты UIDispatcher - очереди изменений UI из фоновых потоков"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.ui_dispatcher import UIDispatcher
+from tests.fakes import ManualWidget
+
+
+class TestUIDispatcher:
+
+    @pytest.fixture
+    def widget(self) -> ManualWidget:
+        return ManualWidget()
+
+    @pytest.fixture
+    def dispatcher(self, widget: ManualWidget) -> UIDispatcher:
+        dispatcher = UIDispatcher(widget)
+        dispatcher.start()
+        return dispatcher
+
+    def test_callbacks_run_only_in_pump(self, dispatcher, widget) -> None:
+        applied = []
+        dispatcher.post(lambda: applied.append(1))
+
+        assert applied == []
+        widget.fire()
+        assert applied == [1]
+
+    def test_unkeyed_updates_keep_order(self, dispatcher, widget) -> None:
+        applied = []
+        for i in range(5):
+            dispatcher.post(lambda i=i: applied.append(i))
+
+        widget.fire()
+
+        assert applied == [0, 1, 2, 3, 4]
+
+    def test_same_key_is_coalesced(self, dispatcher, widget) -> None:
+        applied = []
+        for i in range(10):
+            dispatcher.post(lambda i=i: applied.append(i), key="label")
+        dispatcher.post(lambda: applied.append("other"), key="other")
+
+        widget.fire()
+
+        assert applied == [9, "other"]
+
+    def test_pump_rearms_itself(self, dispatcher, widget) -> None:
+        widget.fire()
+        assert len(widget.pending) == 1
+
+    def test_stop_cancels_pump(self, dispatcher, widget) -> None:
+        dispatcher.stop()
+        assert widget.pending == {}
+
+    def test_error_in_callback_does_not_break_batch(
+        self, dispatcher, widget
+    ) -> None:
+        applied = []
+
+        def broken() -> None:
+            raise RuntimeError("boom")
+
+        dispatcher.post(broken)
+        dispatcher.post(lambda: applied.append(1))
+        widget.fire()
+
+        assert applied == [1]
+
+    def test_posts_from_threads_are_applied(self, dispatcher, widget) -> None:
+        applied = []
+
+        def worker(n: int) -> None:
+            for i in range(100):
+                dispatcher.post(lambda: applied.append(n))
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        widget.fire()
+
+        assert len(applied) == 400
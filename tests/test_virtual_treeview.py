@@ -0,0 +1,91 @@
+"""Тесты VirtualTreeview - виртуализированного списка поверх Treeview"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from components.virtual_treeview import VirtualRow, VirtualTreeview, visible_window
+
+try:
+    import tkinter as tk
+    from tkinter import ttk
+    TKINTER_AVAILABLE = True
+except (ImportError, Exception):
+    TKINTER_AVAILABLE = False
+
+
+class TestVisibleWindow:
+
+    def test_window_adds_margin_around_visible_rows(self) -> None:
+        assert visible_window(1000, 500, 20, 5) == (500, 495, 525)
+
+    def test_offset_clamped_to_last_page(self) -> None:
+        assert visible_window(1000, 995, 20, 5) == (980, 975, 1000)
+
+    def test_short_model_fits_entirely(self) -> None:
+        assert visible_window(10, 3, 20, 5) == (0, 0, 10)
+
+    def test_empty_model(self) -> None:
+        assert visible_window(0, 0, 20, 5) == (0, 0, 0)
+
+
+@pytest.mark.skipif(not TKINTER_AVAILABLE, reason="Требуется tkinter")
+class TestVirtualTreeview:
+
+    @pytest.fixture
+    def root(self):
+        root = tk.Tk()
+        root.withdraw()
+        yield root
+        try:
+            root.destroy()
+        except tk.TclError:
+            pass
+
+    @pytest.fixture
+    def view(self, root) -> VirtualTreeview:
+        tree = ttk.Treeview(root, columns=("value",), show="headings", height=10)
+        scrollbar = ttk.Scrollbar(root, orient="vertical")
+        return VirtualTreeview(tree, scrollbar, margin=5)
+
+    def rows(self, count: int, suffix: str = "") -> list[VirtualRow]:
+        return [VirtualRow(str(i), (f"{i}{suffix}",)) for i in range(count)]
+
+    def test_materializes_only_window(self, view: VirtualTreeview) -> None:
+        view.set_rows(self.rows(5000))
+
+        assert len(view.tree.get_children()) == 15
+
+    def test_scroll_moves_window(self, view: VirtualTreeview) -> None:
+        view.set_rows(self.rows(5000))
+
+        view.yview("moveto", "0.5")
+
+        children = view.tree.get_children()
+        assert children[0] == "2495"
+        assert len(children) == 20
+        assert view.index_of("2500") == 2500
+
+    def test_refresh_updates_changed_rows_in_place(self, view: VirtualTreeview) -> None:
+        view.set_rows(self.rows(100))
+        view.tree.selection_set("3")
+
+        rows = self.rows(100)
+        rows[3] = VirtualRow("3", ("изменено",))
+        view.set_rows(rows)
+
+        assert view.tree.item("3")["values"] == ["изменено"]
+        assert view.tree.selection() == ("3",)
+
+    def test_removed_row_disappears(self, view: VirtualTreeview) -> None:
+        view.set_rows(self.rows(3))
+
+        view.set_rows([VirtualRow("0", ("0",)), VirtualRow("2", ("2",))])
+
+        assert view.tree.get_children() == ("0", "2")
+        assert view.index_of("2") == 1